@@ -2,39 +2,96 @@
 
 import sys
 import asyncio
-from typing import Optional
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-
-import nest_asyncio  # type: ignore
-
-from redbrick.common.context import RBContextImpl
-from redbrick.common.storage import StorageMethod, StorageProvider
-from redbrick.common.enums import (
-    ImportTypes,
-    TaskEventTypes,
-    TaskFilters,
-    TaskStates,
-)
 from redbrick.common.constants import DEFAULT_URL
-from redbrick.common.entities import RBOrganization, RBWorkspace, RBProject, RBDataset
-from redbrick.common.member import OrgMember, OrgInvite, ProjectMember
-from redbrick.organization import RBOrganizationImpl
-from redbrick.dataset import RBDatasetImpl
-from redbrick.workspace import RBWorkspaceImpl
-from redbrick.project import RBProjectImpl
-from redbrick.stage import Stage, LabelStage, ReviewStage, ModelStage
-
-from redbrick.utils.logging import logger
 from redbrick.utils.common_utils import config_migration
 
-from redbrick.types import task as TaskTypes, taxonomy as TaxonomyTypes
-
 from .config import config
-from .version_check import version_check
+
+if TYPE_CHECKING:
+    from redbrick.common.context import RBContextImpl
+    from redbrick.common.storage import StorageMethod, StorageProvider
+    from redbrick.common.enums import (
+        ImportTypes,
+        TaskEventTypes,
+        TaskFilters,
+        TaskStates,
+    )
+    from redbrick.common.entities import (
+        RBOrganization,
+        RBWorkspace,
+        RBProject,
+        RBDataset,
+    )
+    from redbrick.common.member import OrgMember, OrgInvite, ProjectMember
+    from redbrick.organization import RBOrganizationImpl
+    from redbrick.dataset import RBDatasetImpl
+    from redbrick.workspace import RBWorkspaceImpl
+    from redbrick.project import RBProjectImpl
+    from redbrick.stage import Stage, LabelStage, ReviewStage, ModelStage
+    from redbrick.utils.logging import logger
+    from redbrick.types import task as TaskTypes, taxonomy as TaxonomyTypes
 
 
 __version__ = "2.28.7"
 
+# Public attributes loaded on first access, mapped to (module, attribute)
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, Optional[str]]] = {
+    "RBContextImpl": ("redbrick.common.context", "RBContextImpl"),
+    "StorageMethod": ("redbrick.common.storage", "StorageMethod"),
+    "StorageProvider": ("redbrick.common.storage", "StorageProvider"),
+    "ImportTypes": ("redbrick.common.enums", "ImportTypes"),
+    "TaskEventTypes": ("redbrick.common.enums", "TaskEventTypes"),
+    "TaskFilters": ("redbrick.common.enums", "TaskFilters"),
+    "TaskStates": ("redbrick.common.enums", "TaskStates"),
+    "RBOrganization": ("redbrick.common.entities", "RBOrganization"),
+    "RBWorkspace": ("redbrick.common.entities", "RBWorkspace"),
+    "RBProject": ("redbrick.common.entities", "RBProject"),
+    "RBDataset": ("redbrick.common.entities", "RBDataset"),
+    "OrgMember": ("redbrick.common.member", "OrgMember"),
+    "OrgInvite": ("redbrick.common.member", "OrgInvite"),
+    "ProjectMember": ("redbrick.common.member", "ProjectMember"),
+    "RBOrganizationImpl": ("redbrick.organization", "RBOrganizationImpl"),
+    "RBDatasetImpl": ("redbrick.dataset", "RBDatasetImpl"),
+    "RBWorkspaceImpl": ("redbrick.workspace", "RBWorkspaceImpl"),
+    "RBProjectImpl": ("redbrick.project", "RBProjectImpl"),
+    "Stage": ("redbrick.stage", "Stage"),
+    "LabelStage": ("redbrick.stage", "LabelStage"),
+    "ReviewStage": ("redbrick.stage", "ReviewStage"),
+    "ModelStage": ("redbrick.stage", "ModelStage"),
+    "logger": ("redbrick.utils.logging", "logger"),
+    "TaskTypes": ("redbrick.types.task", None),
+    "TaxonomyTypes": ("redbrick.types.taxonomy", None),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Load public attributes and submodules on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        module = importlib.import_module(module_name)
+        value = getattr(module, attribute) if attribute else module
+    else:
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including lazily loaded ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 # windows event loop close bug https://github.com/encode/httpx/issues/914#issuecomment-622586610
 try:
     if (
@@ -52,8 +109,10 @@ except Exception:  # pylint: disable=broad-except
 try:
     if asyncio._get_running_loop() is None:  # pylint: disable=protected-access
         raise RuntimeError
+    import nest_asyncio  # type: ignore  # pylint: disable=import-outside-toplevel
+
     nest_asyncio.apply()
-    logger.warning(
+    __getattr__("logger").warning(
         "Applying nest-asyncio to a running event loop, this likely means you're in a jupyter"
         + " notebook and you can safely ignore this."
     )
@@ -68,11 +127,14 @@ except Exception:  # pylint: disable=broad-except
 
 def version() -> str:
     """Check for latest version and return the current one."""
+    # pylint: disable=import-outside-toplevel, cyclic-import
+    from redbrick.version_check import version_check
+
     version_check(__version__, config.check_version)
     return f"v{__version__}"
 
 
-def get_org(org_id: str, api_key: str, url: str = DEFAULT_URL) -> RBOrganization:
+def get_org(org_id: str, api_key: str, url: str = DEFAULT_URL) -> "RBOrganization":
     """
     Get an existing redbrick organization object.
 
@@ -92,12 +154,18 @@ def get_org(org_id: str, api_key: str, url: str = DEFAULT_URL) -> RBOrganization
     url: str = DEFAULT_URL
         Should default to https://api.redbrickai.com
     """
-    return RBOrganizationImpl(RBContextImpl(api_key=api_key, url=url), org_id)
+    # pylint: disable=import-outside-toplevel, cyclic-import
+    from redbrick.common import context
+    from redbrick import organization
+
+    return organization.RBOrganizationImpl(
+        context.RBContextImpl(api_key=api_key, url=url), org_id
+    )
 
 
 def get_dataset(
     org_id: str, dataset_name: str, api_key: str, url: str = DEFAULT_URL
-) -> RBDataset:
+) -> "RBDataset":
     """Get an existing RedBrick dataset object.
 
     Dataset objects allow you to interact with your RedBrick AI datasets,
@@ -119,12 +187,18 @@ def get_dataset(
     url: str = DEFAULT_URL
         Should default to https://api.redbrickai.com
     """
-    return RBDatasetImpl(RBContextImpl(api_key=api_key, url=url), org_id, dataset_name)
+    # pylint: disable=import-outside-toplevel, cyclic-import
+    from redbrick.common import context
+    from redbrick import dataset
+
+    return dataset.RBDatasetImpl(
+        context.RBContextImpl(api_key=api_key, url=url), org_id, dataset_name
+    )
 
 
 def get_workspace(
     org_id: str, workspace_id: str, api_key: str, url: str = DEFAULT_URL
-) -> RBWorkspace:
+) -> "RBWorkspace":
     """
     Get an existing RedBrick workspace object.
 
@@ -147,14 +221,18 @@ def get_workspace(
     url: str = DEFAULT_URL
         Should default to https://api.redbrickai.com
     """
-    return RBWorkspaceImpl(
-        RBContextImpl(api_key=api_key, url=url), org_id, workspace_id
+    # pylint: disable=import-outside-toplevel, cyclic-import
+    from redbrick.common import context
+    from redbrick import workspace
+
+    return workspace.RBWorkspaceImpl(
+        context.RBContextImpl(api_key=api_key, url=url), org_id, workspace_id
     )
 
 
 def get_project(
     org_id: str, project_id: str, api_key: str, url: str = DEFAULT_URL
-) -> RBProject:
+) -> "RBProject":
     """
     Get an existing RedBrick project object.
 
@@ -177,12 +255,18 @@ def get_project(
     url: str = DEFAULT_URL
         Should default to https://api.redbrickai.com
     """
-    return RBProjectImpl(RBContextImpl(api_key=api_key, url=url), org_id, project_id)
+    # pylint: disable=import-outside-toplevel, cyclic-import
+    from redbrick.common import context
+    from redbrick import project
+
+    return project.RBProjectImpl(
+        context.RBContextImpl(api_key=api_key, url=url), org_id, project_id
+    )
 
 
 def get_org_from_profile(
     profile_name: Optional[str] = None,
-) -> RBOrganization:
+) -> "RBOrganization":
     """Get the org from the profile name in credentials file
 
     >>> org = get_org_from_profile()
@@ -194,15 +278,16 @@ def get_org_from_profile(
 
     """
     # pylint: disable=import-outside-toplevel, cyclic-import
+    from redbrick import organization
     from redbrick.cli.entity import CLICredentials
 
     creds = CLICredentials(profile=profile_name)
-    return RBOrganizationImpl(creds.context, creds.org_id)
+    return organization.RBOrganizationImpl(creds.context, creds.org_id)
 
 
 def get_dataset_from_profile(
     dataset_name: str, profile_name: Optional[str] = None
-) -> RBDataset:
+) -> "RBDataset":
     """Get the RBDataset object using the credentials file
 
     dataset = get_dataset_from_profile()
@@ -216,15 +301,16 @@ def get_dataset_from_profile(
         Name of the profile stored in the credentials file
     """
     # pylint: disable=import-outside-toplevel, cyclic-import
+    from redbrick import dataset
     from redbrick.cli.entity import CLICredentials
 
     creds = CLICredentials(profile=profile_name)
-    return RBDatasetImpl(creds.context, creds.org_id, dataset_name)
+    return dataset.RBDatasetImpl(creds.context, creds.org_id, dataset_name)
 
 
 def get_workspace_from_profile(
     workspace_id: str, profile_name: Optional[str] = None
-) -> RBWorkspace:
+) -> "RBWorkspace":
     """Get the RBWorkspace object using the credentials file
 
     workspace = get_workspace_from_profile()
@@ -238,15 +324,16 @@ def get_workspace_from_profile(
         Name of the profile stored in the credentials file
     """
     # pylint: disable=import-outside-toplevel, cyclic-import
+    from redbrick import workspace
     from redbrick.cli.entity import CLICredentials
 
     creds = CLICredentials(profile=profile_name)
-    return RBWorkspaceImpl(creds.context, creds.org_id, workspace_id)
+    return workspace.RBWorkspaceImpl(creds.context, creds.org_id, workspace_id)
 
 
 def get_project_from_profile(
     project_id: Optional[str] = None, profile_name: Optional[str] = None
-) -> RBProject:
+) -> "RBProject":
     """Get the RBProject object using the credentials file
 
     project = get_project_from_profile()
@@ -261,16 +348,17 @@ def get_project_from_profile(
         Name of the profile stored in the credentials file
     """
     # pylint: disable=import-outside-toplevel, cyclic-import
+    from redbrick import project
     from redbrick.cli.project import CLIProject
     from redbrick.cli.entity import CLICredentials
 
     if project_id:
         creds = CLICredentials(profile=profile_name)
-        return RBProjectImpl(creds.context, creds.org_id, project_id)
+        return project.RBProjectImpl(creds.context, creds.org_id, project_id)
 
     cli_project = CLIProject.from_path(required=False, profile=profile_name)
     if cli_project:
-        return RBProjectImpl(
+        return project.RBProjectImpl(
             cli_project.context, cli_project.org_id, cli_project.project_id
         )
     raise ValueError(
@@ -1,4 +1,18 @@
 """CLI for RedBrick SDK."""
 
-from redbrick.cli.project import CLIProject
+from typing import TYPE_CHECKING, Any
+
 from redbrick.cli.public import cli_parser, cli_main
+
+if TYPE_CHECKING:
+    from redbrick.cli.project import CLIProject
+
+
+def __getattr__(name: str) -> Any:
+    """Load CLIProject on first access."""
+    if name == "CLIProject":
+        # pylint: disable=import-outside-toplevel
+        from redbrick.cli import project
+
+        return project.CLIProject
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,14 @@
 """Interfaces for RedBrick CLI."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from argparse import Namespace
 
-from redbrick.cli.project import CLIProject
 from redbrick.utils.logging import logger
 
+if TYPE_CHECKING:
+    from redbrick.cli.project import CLIProject
+
 
 class CLIInputParams(ABC):
     """CLI Input params handler."""
@@ -42,7 +44,7 @@ class CLIConfigInterface(ABC):
     """CLI config command interface."""
 
     args: Namespace
-    project: CLIProject
+    project: "CLIProject"
 
     LIST = "list"
     SET = "set"
@@ -88,7 +90,7 @@ class CLIInitInterface(ABC):
     """CLI init interface."""
 
     args: Namespace
-    project: CLIProject
+    project: "CLIProject"
 
     @abstractmethod
     def handler(self, args: Namespace) -> None:
@@ -103,7 +105,7 @@ class CLICloneInterface(ABC):
     """CLI clone interface."""
 
     args: Namespace
-    project: CLIProject
+    project: "CLIProject"
 
     @abstractmethod
     def handler(self, args: Namespace) -> None:
@@ -118,7 +120,7 @@ class CLIInfoInterface(ABC):
     """CLI info interface."""
 
     args: Namespace
-    project: CLIProject
+    project: "CLIProject"
 
     SETTING_LABELSTORAGE = "labelstorage"
 
@@ -143,7 +145,7 @@ class CLIExportInterface(ABC):
     """CLI export interface."""
 
     args: Namespace
-    project: CLIProject
+    project: "CLIProject"
 
     TYPE_LATEST = "latest"
     TYPE_GROUNDTRUTH = "groundtruth"
@@ -161,7 +163,7 @@ class CLIUploadInterface(ABC):
     """CLI upload interface."""
 
     args: Namespace
-    project: CLIProject
+    project: "CLIProject"
 
     STORAGE_REDBRICK = "redbrick"
     STORAGE_PUBLIC = "public"
@@ -179,7 +181,7 @@ class CLIReportInterface(ABC):
     """CLI report interface."""
 
     args: Namespace
-    project: CLIProject
+    project: "CLIProject"
 
     TYPE_ALL = "all"
     TYPE_GROUNDTRUTH = "groundtruth"
@@ -1,9 +1,32 @@
 """CLI commands controllers."""
 
-from redbrick.cli.command.config import CLIConfigController
-from redbrick.cli.command.init import CLIInitController
-from redbrick.cli.command.clone import CLICloneController
-from redbrick.cli.command.info import CLIInfoController
-from redbrick.cli.command.export import CLIExportController
-from redbrick.cli.command.upload import CLIUploadController
-from redbrick.cli.command.report import CLIIReportController
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from redbrick.cli.command.config import CLIConfigController
+    from redbrick.cli.command.init import CLIInitController
+    from redbrick.cli.command.clone import CLICloneController
+    from redbrick.cli.command.info import CLIInfoController
+    from redbrick.cli.command.export import CLIExportController
+    from redbrick.cli.command.upload import CLIUploadController
+    from redbrick.cli.command.report import CLIIReportController
+
+
+# Command controllers loaded on first access, mapped to their modules
+CONTROLLER_MODULES: Dict[str, str] = {
+    "CLIConfigController": "redbrick.cli.command.config",
+    "CLIInitController": "redbrick.cli.command.init",
+    "CLICloneController": "redbrick.cli.command.clone",
+    "CLIInfoController": "redbrick.cli.command.info",
+    "CLIExportController": "redbrick.cli.command.export",
+    "CLIUploadController": "redbrick.cli.command.upload",
+    "CLIIReportController": "redbrick.cli.command.report",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Load command controllers on first access."""
+    if name in CONTROLLER_MODULES:
+        return getattr(importlib.import_module(CONTROLLER_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
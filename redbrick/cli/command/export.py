@@ -3,7 +3,6 @@
 import os
 import re
 import json
-import asyncio
 from datetime import datetime, timezone
 from argparse import ArgumentError, ArgumentParser, Namespace
 from typing import Dict, Set, Optional, cast
@@ -15,8 +14,9 @@ from redbrick.config import config
 from redbrick.cli.project import CLIProject
 from redbrick.cli.cli_base import CLIExportInterface
 from redbrick.common.constants import MAX_FILE_BATCH_SIZE
+from redbrick.common.export import EXPORT_TASK_FIELDS
 from redbrick.types.taxonomy import Taxonomy
-from redbrick.utils.async_utils import gather_with_concurrency
+from redbrick.utils.async_utils import gather_with_concurrency, run_sync
 from redbrick.utils.logging import assert_validation, logger
 
 
@@ -189,6 +189,7 @@ class CLIExportController(CLIExportInterface):
             cache_timestamp,
             False,
             not no_consensus,
+            fields=EXPORT_TASK_FIELDS,
         )
         fetched = 0
         with tqdm.tqdm(
@@ -262,7 +263,7 @@ class CLIExportController(CLIExportInterface):
         if os.path.isfile(task_file):
             os.remove(task_file)
 
-        asyncio.run(
+        run_sync(
             gather_with_concurrency(
                 min(self.args.concurrency, MAX_FILE_BATCH_SIZE),
                 *[
@@ -3,7 +3,7 @@
 import os
 import re
 import json
-import asyncio
+from itertools import chain
 from argparse import ArgumentError, ArgumentParser, Namespace
 from typing import List, Dict, Optional, Union, cast
 
@@ -14,8 +14,9 @@ from redbrick.common.enums import ImportTypes
 from redbrick.common.storage import StorageMethod
 from redbrick.upload.interact import create_tasks, prepare_json_files
 from redbrick.utils.logging import assert_validation, logger
-from redbrick.utils.files import find_files_recursive
+from redbrick.utils.files import scan_files
 from redbrick.types.task import InputTask
+from redbrick.utils.async_utils import run_sync
 
 
 class CLIUploadController(CLIUploadInterface):
@@ -49,6 +50,11 @@ to understand the required folder structure and supported file types.
             action="store_true",
             help="Group files by study",
         )
+        parser.add_argument(
+            "--local-grouping",
+            action="store_true",
+            help="Group DICOM files into series locally using their headers",
+        )
         parser.add_argument(
             "--json",
             action="store_true",
@@ -170,14 +176,30 @@ but may increase the upload time.""",
         if self.args.clear_cache:
             self.project.cache.clear_cache(True)
 
-        items_list: Union[List[List[str]], List[Dict]]
+        items_list: Union[List[List[str]], List[Dict]] = []
         if self.args.json and directory.endswith(".json") and os.path.isfile(directory):
             items_list = [[os.path.abspath(directory)]]
         else:
             logger.info(f"Searching for items recursively in {directory}")
-            items_list = find_files_recursive(
-                directory, set(["json" if self.args.json else "*"])
-            )
+            scanned = scan_files(directory, set(["json" if self.args.json else "*"]))
+            if self.args.json:
+                items_list = sorted(scanned)
+            elif (first_group := next(scanned, None)) is not None:
+                import_file_type = CLIInputSelect(
+                    self.args.type,
+                    "Import file type",
+                    [import_type.value for import_type in ImportTypes],
+                ).get()
+
+                items_list = run_sync(
+                    self.project.project.upload.generate_items_list(
+                        chain([first_group], scanned),
+                        import_file_type,
+                        self.args.as_study,
+                        self.args.concurrency,
+                        self.args.local_grouping,
+                    )
+                )
 
         logger.debug(f"Contains {len(items_list)} items")
 
@@ -186,22 +208,6 @@ but may increase the upload time.""",
             self.project.cache.get_data("uploads", upload_cache_hash, True, True) or []
         )
 
-        if not self.args.json and items_list:
-            import_file_type = CLIInputSelect(
-                self.args.type,
-                "Import file type",
-                [import_type.value for import_type in ImportTypes],
-            ).get()
-
-            items_list = asyncio.run(
-                self.project.project.upload.generate_items_list(
-                    items_list,
-                    import_file_type,
-                    self.args.as_study,
-                    self.args.concurrency,
-                )
-            )
-
         segmentation_mapping = {}
         if self.args.segment_map:
             with open(self.args.segment_map, "r", encoding="utf-8") as file_:
@@ -378,7 +384,7 @@ but may increase the upload time.""",
         if points:
             logger.info(f"Found {len(points)} items")
 
-            uploads = asyncio.run(
+            uploads = run_sync(
                 create_tasks(
                     context=project.context,
                     org_id=project.org_id,
@@ -3,11 +3,11 @@
 import os
 import shutil
 import zlib
-import json
 from typing import Dict, List, Optional, Union
 
 from redbrick.config import config
 from redbrick.utils.common_utils import hash_sha256
+from redbrick.utils.json_codec import json_dumpb, json_loads
 from .conf import CLIConfiguration
 
 
@@ -62,7 +62,7 @@ class CLICache:
                 data = file_.read()
             if cache_hash == hash_sha256(data):
                 data = zlib.decompress(data)
-                return json.loads(data) if json_data else data.decode()
+                return json_loads(data) if json_data else data.decode()
         return None
 
     def set_data(
@@ -71,11 +71,7 @@ class CLICache:
         """Set cache data."""
         cache_file = self.cache_path(name, fixed_cache=fixed_cache)
         data = zlib.compress(
-            (
-                entity
-                if isinstance(entity, str)
-                else json.dumps(entity, separators=(",", ":"))
-            ).encode()
+            entity.encode() if isinstance(entity, str) else json_dumpb(entity)
         )
         cache_hash = hash_sha256(data)
         with open(cache_file, "wb") as file_:
@@ -93,8 +89,8 @@ class CLICache:
     ) -> Optional[Union[str, Dict, List]]:
         """Get cache entity."""
         cache_file = self.cache_path(*self._task_path(name), fixed_cache=fixed_cache)
-        with open(cache_file, "r", encoding="utf-8") as file_:
-            data = json.load(file_)
+        with open(cache_file, "rb") as file_:
+            data = json_loads(file_.read())
         return data
 
     def set_entity(
@@ -102,8 +98,8 @@ class CLICache:
     ) -> None:
         """Set cache entity."""
         cache_file = self.cache_path(*self._task_path(name), fixed_cache=fixed_cache)
-        with open(cache_file, "w", encoding="utf-8") as file_:
-            json.dump(entity, file_, separators=(",", ":"))
+        with open(cache_file, "wb") as file_:
+            file_.write(json_dumpb(entity))
 
     def remove_entity(self, name: str, fixed_cache: bool = False) -> None:
         """Remove cache entity."""
@@ -2,41 +2,47 @@
 
 import sys
 import argparse
-from typing import List, Optional, Any
-
-import shtab
+import importlib
+from typing import Dict, List, Optional, Any, Sequence
 
 import redbrick
-from redbrick.cli.command import (
-    CLIConfigController,
-    CLIInitController,
-    CLICloneController,
-    CLIInfoController,
-    CLIExportController,
-    CLIUploadController,
-    CLIIReportController,
-)
 from redbrick.cli.cli_base import CLIInterface
+from redbrick.cli.command import CONTROLLER_MODULES
 from redbrick.utils.logging import logger
 
 
 class CLIController(CLIInterface):
-    """Main CLI Controller."""
-
-    def __init__(self, command: argparse._SubParsersAction) -> None:
-        """Initialize CLI command parsers."""
-        self.config = CLIConfigController(
-            command.add_parser(
-                self.CONFIG,
-                help="Setup the credentials for your CLI.",
-                description="Setup the credentials for your CLI.",
-            )
+    """Main CLI Controller.
+
+    Command controllers, and the modules they depend on, are loaded on first use.
+    """
+
+    CONTROLLERS = {
+        CLIInterface.CONFIG: "CLIConfigController",
+        CLIInterface.INIT: "CLIInitController",
+        CLIInterface.CLONE: "CLICloneController",
+        CLIInterface.INFO: "CLIInfoController",
+        CLIInterface.EXPORT: "CLIExportController",
+        CLIInterface.UPLOAD: "CLIUploadController",
+        CLIInterface.REPORT: "CLIIReportController",
+    }
+
+    def __init__(
+        self,
+        command: argparse._SubParsersAction,
+        commands: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Initialize CLI command parsers, and controllers of the given commands."""
+        self._parsers: Dict[str, argparse.ArgumentParser] = {}
+        self._parsers[self.CONFIG] = command.add_parser(
+            self.CONFIG,
+            help="Setup the credentials for your CLI.",
+            description="Setup the credentials for your CLI.",
         )
-        self.init = CLIInitController(
-            command.add_parser(
-                self.INIT,
-                help="Create a new project",
-                description="""
+        self._parsers[self.INIT] = command.add_parser(
+            self.INIT,
+            help="Create a new project",
+            description="""
 Create a new project. We recommend creating a new directory and naming it after your project,
 initializing your project within the new directory.
 
@@ -46,43 +52,33 @@ $ cd new-project
 $ redbrick init
 ```
             """,
-            )
         )
-        self.clone = CLICloneController(
-            command.add_parser(
-                self.CLONE,
-                help="Clone an existing remote project to local",
-                description="""
+        self._parsers[self.CLONE] = command.add_parser(
+            self.CLONE,
+            help="Clone an existing remote project to local",
+            description="""
 The project will be cloned to a local directory named after your `project name`.
                 """,
-            )
         )
-        self.info = CLIInfoController(
-            command.add_parser(
-                self.INFO,
-                help="Get a project's information",
-                description="Get a project's information",
-            )
+        self._parsers[self.INFO] = command.add_parser(
+            self.INFO,
+            help="Get a project's information",
+            description="Get a project's information",
         )
-        self.export = CLIExportController(
-            command.add_parser(
-                self.EXPORT,
-                help="Export data for a project",
-                description="Export data for a project",
-            )
+        self._parsers[self.EXPORT] = command.add_parser(
+            self.EXPORT,
+            help="Export data for a project",
+            description="Export data for a project",
         )
-        self.upload = CLIUploadController(
-            command.add_parser(
-                self.UPLOAD,
-                help="Upload files to a project",
-                description="Upload files to a project",
-            )
+        self._parsers[self.UPLOAD] = command.add_parser(
+            self.UPLOAD,
+            help="Upload files to a project",
+            description="Upload files to a project",
         )
-        self.report = CLIIReportController(
-            command.add_parser(
-                self.REPORT,
-                help="Generate an audit report for a project",
-                description="""
+        self._parsers[self.REPORT] = command.add_parser(
+            self.REPORT,
+            help="Generate an audit report for a project",
+            description="""
 Generate an audit report for a project. Exports a JSON file containing all actions & events
 associated with every task, including:
 
@@ -91,8 +87,25 @@ associated with every task, including:
 - Who reviewed the task
 - and more.
 """,
+        )
+
+        for name in self._parsers if commands is None else commands:
+            getattr(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        """Load command controllers on first access."""
+        if name.startswith("_") or name not in self.CONTROLLERS:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
             )
+        controller_name = self.CONTROLLERS[name]
+        controller_class = getattr(
+            importlib.import_module(CONTROLLER_MODULES[controller_name]),
+            controller_name,
         )
+        controller = controller_class(self._parsers[name])
+        setattr(self, name, controller)
+        return controller
 
     def handle_command(self, args: argparse.Namespace) -> None:
         """CLI command main handler."""
@@ -114,18 +127,43 @@ associated with every task, including:
             raise argparse.ArgumentError(None, "")
 
 
+def _selected_commands(argv: Sequence[str]) -> Optional[List[str]]:
+    """Get the commands whose parsers are needed to parse argv (None for all)."""
+    for arg in argv:
+        if arg.startswith("--completion"):
+            return None
+        if not arg.startswith("-"):
+            return [arg] if arg in CLIController.CONTROLLERS else []
+    return []
+
+
 def cli_parser(
     only_parser: bool = True,
+    argv: Optional[Sequence[str]] = None,
 ) -> Any:
-    """Initialize argument parser."""
+    """Initialize argument parser.
+
+    If argv is given, only the controller of the selected command is loaded.
+    """
     parser = argparse.ArgumentParser(
         description="The RedBrick CLI offers a simple interface to quickly import and "
         + "export your images & annotations, and perform other high-level actions."
     )
     parser.add_argument("-v", "--version", action="version", version=redbrick.version())
-    cli = CLIController(parser.add_subparsers(title="Commands", dest="command"))
+    cli = CLIController(
+        parser.add_subparsers(title="Commands", dest="command"),
+        None if argv is None else _selected_commands(argv),
+    )
+
+    if argv is None or any(arg.startswith("--completion") for arg in argv):
+        import shtab  # pylint: disable=import-outside-toplevel
 
-    shtab.add_argument_to(parser, "--completion")
+        shtab.add_argument_to(parser, "--completion")
+    else:
+        # placeholder with the same usage, shtab is loaded only to print the script
+        parser.add_argument(
+            "--completion", metavar="SHELL", help="print shell completion script"
+        )
 
     if only_parser:
         return parser
@@ -138,10 +176,11 @@ def cli_main(argv: Optional[List[str]] = None) -> None:
     parser: argparse.ArgumentParser
     cli: CLIController
 
-    parser, cli = cli_parser(False)
+    argv = argv if argv is not None else sys.argv[1:]
+    parser, cli = cli_parser(False, argv)
 
     try:
-        args = parser.parse_args(argv if argv is not None else sys.argv[1:])
+        args = parser.parse_args(argv)
         logger.debug(args)
     except KeyboardInterrupt:
         logger.warning("User interrupted")
@@ -4,8 +4,10 @@ from abc import ABC, abstractmethod
 import time
 import json
 import base64
-import gzip
-from typing import Dict
+import zlib
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 import requests  # type: ignore
 
 import aiohttp
@@ -17,13 +19,41 @@ from tenacity.wait import wait_exponential
 from redbrick.common.constants import (
     DEFAULT_URL,
     MAX_RETRY_ATTEMPTS,
+    MIN_COMPRESSION_BYTES,
     REQUEST_TIMEOUT,
     PEERLESS_ERRORS,
 )
 from redbrick.config import config
+from redbrick.utils.json_codec import json_dumpb, json_dumps, json_loads
 from redbrick.utils.logging import assert_validation, log_error, logger
 
 
+@lru_cache(maxsize=256)
+def _query_prefix(query: str) -> bytes:
+    """Get the request body prefix of a query."""
+    return ('{"query":' + json_dumps(query) + ',"variables":').encode("utf-8")
+
+
+@lru_cache(maxsize=16)
+def _query_compressor(query: str) -> Tuple[bytes, Any]:
+    """Get the gzip stream of a query's request body prefix.
+
+    Copies of the stream are used to compress requests without compressing
+    the constant query text each time. Each stream holds a few hundred KB, so
+    only the queries of recent large requests are kept.
+    """
+    compressor = zlib.compressobj(wbits=31)
+    return compressor.compress(_query_prefix(query)), compressor
+
+
+def _decode_response(content: bytes) -> Dict:
+    """Decode a JSON response, raising a retryable error if it is malformed."""
+    try:
+        return json_loads(content)
+    except json.JSONDecodeError as error:
+        raise IOError(f"Invalid response from server: {error}") from error
+
+
 class RBClient(ABC):
     """Client to communicate with RedBrick AI GraphQL Server."""
 
@@ -53,7 +83,11 @@ class RBClient(ABC):
 
 
 class RBClientImpl(RBClient):
-    """Client to communicate with RedBrick AI GraphQL Server."""
+    """Client to communicate with RedBrick AI GraphQL Server.
+
+    The client is thread-safe: each thread sends requests over its own HTTP session
+    and connection pool, so SDK objects can be shared by a pool of worker threads.
+    """
 
     def __init__(self, api_key: str, url: str) -> None:
         """Construct RBClient."""
@@ -67,7 +101,9 @@ class RBClientImpl(RBClient):
             self.url = "https://" + self.url[:pos] + "/api"
 
         self.url += "/graphql/"
-        self.session = requests.Session()
+        self._local = threading.local()
+        self._sessions: Dict[threading.Thread, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
 
         self.api_key = api_key
         assert_validation(
@@ -76,8 +112,33 @@ class RBClientImpl(RBClient):
         )
 
     def __del__(self) -> None:
-        """Garbage collect and close session."""
-        self.session.close()
+        """Garbage collect and close sessions."""
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the HTTP session of the current thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            with self._sessions_lock:
+                # close the sessions of threads that have exited
+                exited = [thread for thread in self._sessions if not thread.is_alive()]
+                stale = [self._sessions.pop(thread) for thread in exited]
+                self._sessions[threading.current_thread()] = session
+            for stale_session in stale:
+                stale_session.close()
+            self._local.session = session
+        return session
+
+    def close(self) -> None:
+        """Close the HTTP sessions of all threads."""
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._local = threading.local()
+        for session in sessions:
+            session.close()
 
     @property
     def headers(self) -> Dict:
@@ -87,19 +148,26 @@ class RBClientImpl(RBClient):
             "ApiKey": self.api_key,
             "Content-Type": "application/json",
             "Accept": "application/json",
-            "Content-Encoding-RB": "gzip",
             "Accept-Encoding": "br, gzip",
         }
 
-    def prepare_query(self, query: str, variables: Dict) -> bytes:
-        """Prepare query to be sent to the server."""
-        return base64.b64encode(
-            gzip.compress(
-                json.dumps(
-                    {"query": query, "variables": variables}, separators=(",", ":")
-                ).encode("utf-8")
-            )
-        )
+    def prepare_query(self, query: str, variables: Dict) -> Tuple[bytes, Dict]:
+        """Prepare query to be sent to the server, along with its encoding headers.
+
+        Small requests are sent uncompressed. Others are gzipped, and sent as raw
+        gzip if ``config.binary_transport`` is set, or base64 encoded otherwise.
+        """
+        prefix = _query_prefix(query)
+        suffix = json_dumpb(variables) + b"}"
+        if len(prefix) + len(suffix) < MIN_COMPRESSION_BYTES:
+            return prefix + suffix, self.headers
+
+        compressed_prefix, compressor = _query_compressor(query)
+        compressor = compressor.copy()
+        data = compressed_prefix + compressor.compress(suffix) + compressor.flush()
+        if config.binary_transport:
+            return data, {**self.headers, "Content-Encoding": "gzip"}
+        return base64.b64encode(data), {**self.headers, "Content-Encoding-RB": "gzip"}
 
     @tenacity.retry(
         reraise=True,
@@ -113,14 +181,14 @@ class RBClientImpl(RBClient):
         """Execute a graphql query."""
         start_time = time.time()
         logger.debug("Executing: " + query.strip().split("\n")[0])
+        data, headers = self.prepare_query(query, variables)
         response = self.session.post(
-            self.url,
-            timeout=REQUEST_TIMEOUT,
-            headers=self.headers,
-            data=self.prepare_query(query, variables),
+            self.url, timeout=REQUEST_TIMEOUT, headers=headers, data=data
         )
         self._check_status_msg(response.status_code, start_time)
-        return self._process_json_response(response.json(), raise_for_error)
+        return self._process_json_response(
+            _decode_response(response.content), raise_for_error
+        )
 
     @tenacity.retry(
         reraise=True,
@@ -138,14 +206,17 @@ class RBClientImpl(RBClient):
         """Execute a graphql query using asyncio."""
         start_time = time.time()
         logger.debug("Executing async: " + query.strip().split("\n")[0])
+        data, headers = self.prepare_query(query, variables)
         async with aio_session.post(
             self.url,
             timeout=aiohttp.ClientTimeout(REQUEST_TIMEOUT),
-            headers=self.headers,
-            data=self.prepare_query(query, variables),
+            headers=headers,
+            data=data,
         ) as response:
             self._check_status_msg(response.status, start_time)
-            return self._process_json_response(await response.json(), raise_for_error)
+            return self._process_json_response(
+                _decode_response(await response.read()), raise_for_error
+            )
 
     @staticmethod
     def _check_status_msg(response_status: int, start_time: float) -> None:
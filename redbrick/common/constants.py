@@ -2,7 +2,12 @@
 
 MAX_CONCURRENCY = 30
 MAX_FILE_BATCH_SIZE = 5
+MAX_PRESIGN_BATCH_SIZE = 100
+MAX_PROCESS_WORKERS = 8
 MAX_RETRY_ATTEMPTS = 3
+MAX_TRANSFER_BYTES = 256 * 1024 * 1024
+MEMBER_DIRECTORY_TTL = 3600
+MIN_COMPRESSION_BYTES = 1024
 REQUEST_TIMEOUT = 30
 LABELS_ARRAY_LIMIT = 1000
 
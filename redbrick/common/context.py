@@ -15,6 +15,7 @@ from redbrick.common.storage import StorageRepo
 from redbrick.common.dataset import DatasetRepo
 from redbrick.config import config
 from redbrick.utils.logging import logger
+from redbrick.utils.metadata_cache import MemberDirectory, MetadataCache
 
 
 class RBContext(ABC):
@@ -32,6 +33,9 @@ class RBContext(ABC):
     storage: StorageRepo
     dataset: DatasetRepo
 
+    metadata: MetadataCache
+    member_directory: MemberDirectory
+
     @property
     @abstractmethod
     def key_id(self) -> str:
@@ -71,6 +75,9 @@ class RBContextImpl(RBContext):
         self.storage = StorageRepoImpl(self.client)
         self.dataset = DatasetRepoImpl(self.client)
 
+        self.metadata = MetadataCache(api_key=api_key, url=url)
+        self.member_directory = MemberDirectory(self.member)
+
         self._key_id: Optional[str] = None
 
     def __str__(self) -> str:
@@ -467,6 +467,7 @@ class RBWorkspace(ABC):
         points: List[InputTask],
         *,
         concurrency: int = 50,
+        dedup_uploads: bool = False,
     ) -> List[Dict]:
         """
         Create datapoints in workspace.
@@ -505,6 +506,11 @@ class RBWorkspace(ABC):
 
         concurrency: int = 50
 
+        dedup_uploads: bool = False
+            When doing direct upload, skip uploading files whose content was already
+            uploaded to this organization, and reference the existing files instead.
+            Uses a local index of file content hashes.
+
         Returns
         -------------
         List[Dict]
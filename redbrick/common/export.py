@@ -10,6 +10,31 @@ from redbrick.types.task import OutputTask
 from redbrick.types.taxonomy import Taxonomy
 
 
+# Optional fields of exported tasks, used to request only the fields a caller needs
+TASK_FIELDS = (
+    "labels",
+    "items",
+    "itemsPresigned",
+    "createdByEntity",
+    "metaData",
+    "seriesInfo",
+    "heatMaps",
+    "transforms",
+    "centerline",
+    "storageMethod",
+    "attributes",
+    "archived",
+    "cohorts",
+)
+
+# Fields used by the export format (items are presigned when downloaded)
+EXPORT_TASK_FIELDS = tuple(
+    field
+    for field in TASK_FIELDS
+    if field not in ("itemsPresigned", "archived", "cohorts")
+)
+
+
 class TaskFilterParams(TypedDict, total=False):
     """Task filter query."""
 
@@ -56,6 +81,7 @@ class ExportRepo(ABC):
         task_id: str,
         presign_items: bool = False,
         with_consensus: bool = False,
+        fields: Optional[Sequence[str]] = None,
     ) -> Dict:
         """Get the latest datapoint."""
 
@@ -70,6 +96,7 @@ class ExportRepo(ABC):
         with_consensus: bool = False,
         first: int = 50,
         cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Tuple[List[Dict], Optional[str], Optional[datetime]]:
         """Get the latest datapoints."""
 
@@ -84,6 +111,7 @@ class ExportRepo(ABC):
         only_meta_data: bool = True,
         first: int = 50,
         after: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Tuple[List[Dict], Optional[str]]:
         """Task search."""
 
@@ -145,6 +173,7 @@ class DatasetExport(ABC):
         page_size: int = MAX_CONCURRENCY,
         number: Optional[int] = None,
         search: Optional[str] = None,  # pylint: disable=unused-argument
+        resume: bool = False,
     ) -> None:
         """Export dataset to folder.
 
@@ -160,6 +189,8 @@ class DatasetExport(ABC):
             Number of series to export in total.
         search: str
             Search string to filter the series to export.
+        resume: bool
+            Skip series of an existing series.json whose files exist with matching counts.
         """
 
 
@@ -184,6 +215,7 @@ class Export(ABC):
         presign_items: bool = False,
         with_consensus: bool = False,
         task_id: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Iterator[Dict]:
         """Get raw task data."""
 
@@ -1,6 +1,6 @@
 """Abstract interface to upload."""
 
-from typing import List, Dict, Optional, Any, Sequence, Tuple
+from typing import Iterable, List, Dict, Optional, Any, Sequence, Tuple
 from abc import ABC, abstractmethod
 
 import aiohttp
@@ -24,6 +24,18 @@ class UploadRepo(ABC):
     ) -> Tuple[str, List[str]]:
         """Import files into a dataset."""
 
+    @abstractmethod
+    async def import_dataset_files_async(
+        self,
+        aio_client: aiohttp.ClientSession,
+        org_id: str,
+        data_store: str,
+        import_name: Optional[str] = None,
+        import_id: Optional[str] = None,
+        files: Optional[List[Dict]] = None,
+    ) -> Tuple[str, List[str]]:
+        """Import files into a dataset."""
+
     @abstractmethod
     def process_dataset_import(
         self,
@@ -263,6 +275,7 @@ class Upload(ABC):
         label_validate: bool = False,
         prune_segmentations: bool = False,
         concurrency: int = 50,
+        dedup_uploads: bool = False,
     ) -> List[Dict]:
         """
         Create datapoints in project.
@@ -331,6 +344,11 @@ class Upload(ABC):
 
         concurrency: int = 50
 
+        dedup_uploads: bool = False
+            When doing direct upload, skip uploading files whose content was already
+            uploaded to this organization, and reference the existing files instead.
+            Uses a local index of file content hashes.
+
         Returns
         -------------
         List[Dict]
@@ -395,10 +413,11 @@ class Upload(ABC):
     @abstractmethod
     async def generate_items_list(
         self,
-        items_list: List[List[str]],
+        items_list: Iterable[List[str]],
         import_file_type: str,
         as_study: bool,
         concurrency: int = 50,
+        local_grouping: bool = False,
     ) -> List[Dict]:
         """Generate items list from local files."""
 
@@ -16,6 +16,13 @@ class RBConfig:
         debug: Callable[[], bool]
         verify_ssl: Callable[[], bool]
         log_level: Callable[[], int]
+        blob_cache_size: Callable[[], int]
+        dcm2nii_cache_size: Callable[[], int]
+        process_pool: Callable[[], bool]
+        metadata_cache_ttl: Callable[[], int]
+        metadata_cache_persist: Callable[[], bool]
+        binary_transport: Callable[[], bool]
+        json_backend: Callable[[], str]
 
     class ConfigState(TypedDict, total=False):
         """RedBrick config state."""
@@ -25,6 +32,13 @@ class RBConfig:
         debug: bool
         verify_ssl: bool
         log_level: int
+        blob_cache_size: int
+        dcm2nii_cache_size: int
+        process_pool: bool
+        metadata_cache_ttl: int
+        metadata_cache_persist: bool
+        binary_transport: bool
+        json_backend: str
 
     def __init__(self) -> None:
         """Define configs."""
@@ -39,6 +53,23 @@ class RBConfig:
             "log_level": lambda: int(
                 os.environ.get("REDBRICK_SDK_LOG_LEVEL", logging.INFO)
             ),
+            "blob_cache_size": lambda: int(
+                os.environ.get("REDBRICK_SDK_BLOB_CACHE_SIZE", 0)
+            ),
+            "dcm2nii_cache_size": lambda: int(
+                os.environ.get("REDBRICK_SDK_DCM2NII_CACHE_SIZE", 0)
+            ),
+            "process_pool": lambda: bool(os.environ.get("REDBRICK_SDK_PROCESS_POOL")),
+            "metadata_cache_ttl": lambda: int(
+                os.environ.get("REDBRICK_SDK_METADATA_CACHE_TTL", 0)
+            ),
+            "metadata_cache_persist": lambda: bool(
+                os.environ.get("REDBRICK_SDK_METADATA_CACHE_PERSIST")
+            ),
+            "binary_transport": lambda: bool(
+                os.environ.get("REDBRICK_SDK_BINARY_TRANSPORT")
+            ),
+            "json_backend": lambda: os.environ.get("REDBRICK_SDK_JSON_BACKEND", ""),
         }
         logger = logging.getLogger("redbrick")
         logger.setLevel(
@@ -141,6 +172,141 @@ class RBConfig:
             del self._state["log_level"]
         self.logger.setLevel(logging.DEBUG if self.debug else self.log_level)
 
+    @property
+    def blob_cache_size(self) -> int:
+        """Max size in bytes of the local cache of exported files (0 disables it)."""
+        if "blob_cache_size" not in self._state:
+            self._state["blob_cache_size"] = self._options["blob_cache_size"]()
+        return self._state["blob_cache_size"]
+
+    @blob_cache_size.setter
+    def blob_cache_size(self, val: int) -> None:
+        """Max size in bytes of the local cache of exported files (0 disables it)."""
+        if isinstance(val, int):
+            self._state["blob_cache_size"] = val
+
+    @blob_cache_size.deleter
+    def blob_cache_size(self) -> None:
+        """Max size in bytes of the local cache of exported files (0 disables it)."""
+        if "blob_cache_size" in self._state:
+            del self._state["blob_cache_size"]
+
+    @property
+    def dcm2nii_cache_size(self) -> int:
+        """Max size in bytes of the local cache of DICOM to NIfTI conversions (0 disables it)."""
+        if "dcm2nii_cache_size" not in self._state:
+            self._state["dcm2nii_cache_size"] = self._options["dcm2nii_cache_size"]()
+        return self._state["dcm2nii_cache_size"]
+
+    @dcm2nii_cache_size.setter
+    def dcm2nii_cache_size(self, val: int) -> None:
+        """Max size in bytes of the local cache of DICOM to NIfTI conversions (0 disables it)."""
+        if isinstance(val, int):
+            self._state["dcm2nii_cache_size"] = val
+
+    @dcm2nii_cache_size.deleter
+    def dcm2nii_cache_size(self) -> None:
+        """Max size in bytes of the local cache of DICOM to NIfTI conversions (0 disables it)."""
+        if "dcm2nii_cache_size" in self._state:
+            del self._state["dcm2nii_cache_size"]
+
+    @property
+    def process_pool(self) -> bool:
+        """Run CPU bound conversions in worker processes, which import ``__main__``."""
+        if "process_pool" not in self._state:
+            self._state["process_pool"] = self._options["process_pool"]()
+        return self._state["process_pool"]
+
+    @process_pool.setter
+    def process_pool(self, val: bool) -> None:
+        """Run CPU bound conversions in worker processes, which import ``__main__``."""
+        if isinstance(val, bool):
+            self._state["process_pool"] = val
+
+    @process_pool.deleter
+    def process_pool(self) -> None:
+        """Run CPU bound conversions in worker processes, which import ``__main__``."""
+        if "process_pool" in self._state:
+            del self._state["process_pool"]
+
+    @property
+    def metadata_cache_ttl(self) -> int:
+        """Seconds to cache project, stage and taxonomy metadata (0, the default, disables it)."""
+        if "metadata_cache_ttl" not in self._state:
+            self._state["metadata_cache_ttl"] = self._options["metadata_cache_ttl"]()
+        return self._state["metadata_cache_ttl"]
+
+    @metadata_cache_ttl.setter
+    def metadata_cache_ttl(self, val: int) -> None:
+        """Seconds to cache project, stage and taxonomy metadata (0, the default, disables it)."""
+        if isinstance(val, int):
+            self._state["metadata_cache_ttl"] = val
+
+    @metadata_cache_ttl.deleter
+    def metadata_cache_ttl(self) -> None:
+        """Seconds to cache project, stage and taxonomy metadata (0, the default, disables it)."""
+        if "metadata_cache_ttl" in self._state:
+            del self._state["metadata_cache_ttl"]
+
+    @property
+    def metadata_cache_persist(self) -> bool:
+        """Persist cached metadata to disk, to share it across sessions."""
+        if "metadata_cache_persist" not in self._state:
+            self._state["metadata_cache_persist"] = self._options[
+                "metadata_cache_persist"
+            ]()
+        return self._state["metadata_cache_persist"]
+
+    @metadata_cache_persist.setter
+    def metadata_cache_persist(self, val: bool) -> None:
+        """Persist cached metadata to disk, to share it across sessions."""
+        if isinstance(val, bool):
+            self._state["metadata_cache_persist"] = val
+
+    @metadata_cache_persist.deleter
+    def metadata_cache_persist(self) -> None:
+        """Persist cached metadata to disk, to share it across sessions."""
+        if "metadata_cache_persist" in self._state:
+            del self._state["metadata_cache_persist"]
+
+    @property
+    def binary_transport(self) -> bool:
+        """Send compressed API requests as raw gzip instead of base64."""
+        if "binary_transport" not in self._state:
+            self._state["binary_transport"] = self._options["binary_transport"]()
+        return self._state["binary_transport"]
+
+    @binary_transport.setter
+    def binary_transport(self, val: bool) -> None:
+        """Send compressed API requests as raw gzip instead of base64."""
+        if isinstance(val, bool):
+            self._state["binary_transport"] = val
+
+    @binary_transport.deleter
+    def binary_transport(self) -> None:
+        """Send compressed API requests as raw gzip instead of base64."""
+        if "binary_transport" in self._state:
+            del self._state["binary_transport"]
+
+    @property
+    def json_backend(self) -> str:
+        """JSON backend (orjson, ujson or json), or the fastest installed if empty."""
+        if "json_backend" not in self._state:
+            self._state["json_backend"] = self._options["json_backend"]()
+        return self._state["json_backend"]
+
+    @json_backend.setter
+    def json_backend(self, val: str) -> None:
+        """JSON backend (orjson, ujson or json), or the fastest installed if empty."""
+        if isinstance(val, str):
+            self._state["json_backend"] = val
+
+    @json_backend.deleter
+    def json_backend(self) -> None:
+        """JSON backend (orjson, ujson or json), or the fastest installed if empty."""
+        if "json_backend" in self._state:
+            del self._state["json_backend"]
+
     @property
     def log_info(self) -> bool:
         """Show info logs."""
@@ -1,23 +1,115 @@
 """Public API to exporting."""
 
 import asyncio
-from typing import Iterator, List, Dict, Optional
+from typing import Any, Iterator, List, Dict, Optional, TextIO
 from functools import partial
 import os
 import json
+import textwrap
 
+import aiohttp
+import tqdm  # type: ignore
 from rich.console import Console
 
 from redbrick.common.constants import MAX_CONCURRENCY
 from redbrick.common.entities import RBDataset
 from redbrick.common.export import DatasetExport
-from redbrick.utils.async_utils import gather_with_concurrency
+from redbrick.utils.async_utils import (
+    gather_or_cancel,
+    get_session,
+    run_in_thread,
+    run_sync,
+)
 from redbrick.utils.pagination import PaginationIterator
 
 
 # pylint: disable=too-many-lines
 
 
+class SeriesManifest:
+    """Incrementally written JSON array of exported series.
+
+    Entries of a previous manifest are carried over first, so that they are kept
+    if the export is interrupted again, and later entries of a series replace
+    them. Once the export completes, the manifest is rewritten with the entries
+    of this export only.
+    """
+
+    def __init__(self, json_path: str, previous: Optional[Dict[str, Dict]] = None):
+        """Construct manifest writer."""
+        self.json_path = json_path
+        self.previous = previous or {}
+        self.entries: Dict[str, Dict] = {}
+        self.count = 0
+        self.file: Optional[TextIO] = None
+
+    def __enter__(self) -> "SeriesManifest":
+        """Start the JSON array."""
+        self.file = open(  # pylint: disable=consider-using-with
+            self.json_path, "w", encoding="utf-8"
+        )
+        self.file.write("[")
+        for entry in self.previous.values():
+            self._write(entry)
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        """Close the JSON array."""
+        assert self.file
+        self.file.write("\n]" if self.count else "]")
+        self.file.close()
+        if exc_type is not None or not self.previous:
+            return
+
+        tmp_path = f"{self.json_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file_:
+            json.dump(list(self.entries.values()), file_, indent=2)
+        os.replace(tmp_path, self.json_path)
+
+    @staticmethod
+    def load(json_path: str) -> Dict[str, Dict]:
+        """Load the series entries of a manifest, by series id.
+
+        A manifest left incomplete by an interrupted export is read up to its
+        last complete entry.
+        """
+        try:
+            with open(json_path, "r", encoding="utf-8") as file_:
+                data = file_.read()
+        except OSError:
+            return {}
+
+        try:
+            entries = json.loads(data)
+        except ValueError:
+            end = data.rfind("\n  }")
+            try:
+                entries = json.loads(data[: end + 4] + "\n]") if end >= 0 else []
+            except ValueError:
+                entries = []
+
+        return {
+            entry["seriesId"]: entry
+            for entry in entries
+            if isinstance(entry, dict) and entry.get("seriesId")
+        }
+
+    def _write(self, entry: Dict) -> None:
+        assert self.file
+        self.file.write(
+            (",\n" if self.count else "\n")
+            + textwrap.indent(json.dumps(entry, indent=2), "  ")
+        )
+        self.file.flush()
+        self.count += 1
+
+    def append(self, entry: Dict) -> None:
+        """Append a series entry."""
+        self._write(entry)
+        if self.previous:
+            self.entries[entry["seriesId"]] = entry
+
+
 class DatasetExportImpl(DatasetExport):
     """
     Primary interface for various export methods.
@@ -57,6 +149,7 @@ class DatasetExportImpl(DatasetExport):
         page_size: int = MAX_CONCURRENCY,
         number: Optional[int] = None,
         search: Optional[str] = None,  # pylint: disable=unused-argument
+        resume: bool = False,
     ) -> None:
         """Export dataset to folder.
 
@@ -70,6 +163,8 @@ class DatasetExportImpl(DatasetExport):
             Number of series to export in total.
         search: str
             Search string to filter the series to export.
+        resume: bool
+            Skip series of an existing series.json whose files exist with matching counts.
         """
         try:
             console = Console()
@@ -79,49 +174,56 @@ class DatasetExportImpl(DatasetExport):
             dataset_root = f"{path}/{self.dataset.dataset_name}"
             json_path = f"{dataset_root}/series.json"
             if os.path.exists(json_path):
-                console.print(
-                    f"[bold yellow][\u26a0] Warning: {json_path} already exists. It will be overwritten."
-                )
-                os.remove(json_path)
-
-            ds_import_series_list: List[Dict[str, str]] = []
-            # Save the files in chunks of page_size
-            for ds_import_series in self.get_data_store_series(
-                search=search,
-                page_size=number or MAX_CONCURRENCY,
-            ):
-                ds_import_series_list.append(ds_import_series)
-                if len(ds_import_series_list) >= page_size:
-                    asyncio.run(
-                        self.save_series_data_chunk(
-                            page_size,
-                            dataset_root,
-                            json_path,
-                            ds_import_series_list,
-                        )
+                if resume:
+                    console.print(
+                        f"[bold green][\u2713] Resuming export, {json_path} will be rebuilt."
                     )
-                    ds_import_series_list = []
-
-            if ds_import_series_list:
-                asyncio.run(
-                    self.save_series_data_chunk(
-                        page_size,
-                        dataset_root,
-                        json_path,
-                        ds_import_series_list,
+                else:
+                    console.print(
+                        f"[bold yellow][\u26a0] Warning: {json_path} already exists. It will be overwritten."
                     )
+                    os.remove(json_path)
+
+            run_sync(
+                self.save_series_data(
+                    page_size, dataset_root, json_path, search, number, resume
                 )
+            )
         except Exception as error:  # pylint: disable=broad-except
             console.print(f"[bold red][\u2717] Error: {error}")
 
-    async def save_series_data_chunk(
+    @staticmethod
+    def existing_series_files(
+        entry: Optional[Dict], ds_import_series: Dict[str, str]
+    ) -> Optional[List[str]]:
+        """Get the files of a previously exported series entry, if complete."""
+        if (
+            not entry
+            or not ds_import_series.get("numFiles")
+            or not isinstance(entry.get("items"), list)
+            or len(entry["items"]) != int(ds_import_series["numFiles"])
+        ):
+            return None
+
+        file_paths: List[str] = entry["items"]
+        if not all(
+            isinstance(file_path, str) and os.path.isfile(file_path)
+            for file_path in file_paths
+        ):
+            return None
+
+        return file_paths
+
+    async def save_series_data(
         self,
         max_concurrency: int,
         dataset_root: str,
         json_path: str,
-        ds_import_series_list: List[Dict[str, str]],
+        search: Optional[str] = None,
+        number: Optional[int] = None,
+        resume: bool = False,
     ) -> None:
-        """Store data for the given series imports.
+        """Store data for all series, overlapping listing, downloads and manifest writes.
 
         Args
         ----
@@ -131,11 +233,15 @@ class DatasetExportImpl(DatasetExport):
             Path to the dataset root folder.
         json_path: str
             Path to the series.json file.
-        ds_import_series_list: List[Dict]
-            List of series to export.
+        search: str
+            Search string to filter the series to export.
+        number: int
+            Number of series to export in total.
+        resume: bool
+            Skip series of an existing series.json whose files exist with matching counts.
 
         """
-        # pylint: disable=import-outside-toplevel
+        # pylint: disable=import-outside-toplevel, too-many-locals
         from redbrick.utils.altadb import save_dicom_series
 
         base_url = self.context.client.url.strip()
@@ -143,46 +249,73 @@ class DatasetExportImpl(DatasetExport):
             base_url = base_url[:-8]
         if base_url.endswith("api/"):
             base_url = base_url.rstrip("api/")
-        coros = [
-            save_dicom_series(
-                ds_import_series["url"],
-                os.path.join(dataset_root, ds_import_series["seriesId"]),
-                base_url,
-                self.context.client.headers,
-            )
-            for ds_import_series in ds_import_series_list
-        ]
-        file_paths_list = await gather_with_concurrency(
-            max_concurrency,
-            *coros,
-            progress_bar_name=f"Exporting {len(ds_import_series_list)} series",
-            keep_progress_bar=True,
+
+        max_concurrency = max(1, min(max_concurrency, MAX_CONCURRENCY))
+        series_iter = self.get_data_store_series(
+            search=search, page_size=number or MAX_CONCURRENCY
         )
-        new_series = []
-        # Save the series data to the series.json file
-        for ds_import, file_paths in zip(ds_import_series_list, file_paths_list):
-            new_series.append(
-                {
-                    "dataset": self.dataset.dataset_name,
-                    "seriesId": ds_import["seriesId"],
-                    "importId": ds_import["importId"],
-                    "createdAt": ds_import["createdAt"],
-                    "createdBy": ds_import["createdBy"],
-                    "items": file_paths,
-                }
-            )
-        if new_series:
-            series = []
-            if os.path.exists(json_path):
-                with open(json_path, "r", encoding="utf-8") as series_file:
-                    series = json.load(series_file)
-
-            with open(json_path, "w+", encoding="utf-8") as series_file:
-                json.dump(
-                    [
-                        *series,
-                        *new_series,
-                    ],
-                    series_file,
-                    indent=2,
+        queue: "asyncio.Queue[Optional[Dict[str, str]]]" = asyncio.Queue(
+            2 * max_concurrency
+        )
+        frame_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        exported = SeriesManifest.load(json_path) if resume else {}
+
+        async def list_series() -> None:
+            while True:
+                next_series = asyncio.ensure_future(
+                    run_in_thread(next, series_iter, None)
+                )
+                try:
+                    ds_import_series = await asyncio.shield(next_series)
+                except asyncio.CancelledError:
+                    # join the listing thread, so it does not outlive the export
+                    await asyncio.wait([next_series])
+                    raise
+                if ds_import_series is None:
+                    break
+                await queue.put(ds_import_series)
+            for _ in range(max_concurrency):
+                await queue.put(None)
+
+        async def save_series(
+            session: aiohttp.ClientSession, manifest: SeriesManifest, progress: Any
+        ) -> None:
+            while (ds_import_series := await queue.get()) is not None:
+                series_dir = os.path.join(dataset_root, ds_import_series["seriesId"])
+                file_paths = self.existing_series_files(
+                    exported.get(ds_import_series["seriesId"]), ds_import_series
+                )
+                if file_paths is None:
+                    file_paths = await save_dicom_series(
+                        ds_import_series["url"],
+                        series_dir,
+                        base_url,
+                        self.context.client.headers,
+                        session,
+                        frame_semaphore,
+                    )
+                manifest.append(
+                    {
+                        "dataset": self.dataset.dataset_name,
+                        "seriesId": ds_import_series["seriesId"],
+                        "importId": ds_import_series["importId"],
+                        "createdAt": ds_import_series["createdAt"],
+                        "createdBy": ds_import_series["createdBy"],
+                        "items": file_paths,
+                    }
+                )
+                progress.update(1)
+
+        os.makedirs(dataset_root, exist_ok=True)
+        with (
+            SeriesManifest(json_path, exported) as manifest,
+            tqdm.tqdm(desc="Exporting series", total=number, unit="series") as progress,
+        ):
+            async with get_session(api=False) as session:
+                await gather_or_cancel(
+                    list_series(),
+                    *(
+                        save_series(session, manifest, progress)
+                        for _ in range(max_concurrency)
+                    ),
                 )
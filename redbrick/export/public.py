@@ -3,7 +3,7 @@
 import asyncio
 import re
 import shutil
-from typing import Iterator, List, Dict, Optional, Sequence, Set, Tuple
+from typing import Iterator, List, Dict, Optional, Sequence, Set, Tuple, Union
 from functools import partial
 import os
 import json
@@ -16,9 +16,10 @@ import tqdm  # type: ignore
 from redbrick.config import config
 from redbrick.common.entities import RBProject
 from redbrick.common.enums import ReviewStates, TaskFilters, TaskStates
-from redbrick.common.export import Export, TaskFilterParams
+from redbrick.common.export import EXPORT_TASK_FIELDS, Export, TaskFilterParams
 from redbrick.stage import LabelStage, ReviewStage
 from redbrick.types.taxonomy import Taxonomy
+from redbrick.utils.async_utils import run_in_process, run_sync
 from redbrick.utils.common_utils import config_path, get_color
 from redbrick.utils.files import (
     DICOM_FILE_TYPES,
@@ -31,6 +32,7 @@ from redbrick.utils.files import (
     is_altadb_item,
     uniquify_path,
 )
+from redbrick.utils.json_codec import json_dumpb, json_loads
 from redbrick.utils.labels import process_labels
 from redbrick.utils.logging import log_error, logger
 from redbrick.utils.pagination import PaginationIterator
@@ -72,8 +74,9 @@ class ExportImpl(Export):
         presign_items: bool = False,
         with_consensus: bool = False,
         task_id: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Iterator[Dict]:
-        """Get raw task data."""
+        """Get raw task data, with all or only the given optional fields."""
         # pylint: disable=too-many-locals
         if task_id:
             logger.info(f"Fetching task: {task_id}")
@@ -83,6 +86,7 @@ class ExportImpl(Export):
                 task_id,
                 presign_items,
                 with_consensus,
+                fields,
             )
             task = parse_entry_latest(val)
             yield task
@@ -101,6 +105,7 @@ class ExportImpl(Export):
                 ),
                 presign_items,
                 with_consensus,
+                fields=fields,
             ),
             concurrency,
         )
@@ -195,9 +200,7 @@ class ExportImpl(Export):
 
         import numpy as np  # type: ignore
         import nibabel as nb  # type: ignore
-        from dicom2nifti import settings, dicom_series_to_nifti  # type: ignore
-
-        settings.disable_validate_slice_increment()
+        from redbrick.utils.nifti import convert_dicom_series_to_nifti
 
         logger.info("Converting DICOM image volumes to NIfTI")
 
@@ -218,66 +221,70 @@ class ExportImpl(Export):
         if not task_series or len(task_series) != len(series_dirs):
             return task
 
+        to_convert: List[Tuple[Series, str]] = []
         for series, series_dir in zip(task_series, series_dirs):
             series_items = series.get("items") or []
             items = [series_items] if isinstance(series_items, str) else series_items
-            if (
-                dcm_to_nii
-                and len(items) > 1
-                and not any(
-                    re.search(dcm_ext, item.split("?", 1)[0].rstrip("/"))
-                    for item in items
-                )
+            if len(items) > 1 and not any(
+                re.search(dcm_ext, item.split("?", 1)[0].rstrip("/")) for item in items
             ):
-                logger.info(f"Converting {task['taskId']} image to nifti")
+                to_convert.append((series, series_dir))
+
+        if to_convert:
+            logger.info(f"Converting {task['taskId']} image to nifti")
+        nii_files = await asyncio.gather(
+            *(
+                run_in_process(
+                    convert_dicom_series_to_nifti,
+                    series_dir,
+                    uniquify_path(series_dir + ".nii.gz"),
+                    config.dcm2nii_cache_size,
+                )
+                for _, series_dir in to_convert
+            ),
+            return_exceptions=True,
+        )
+
+        for (series, series_dir), nii_file in zip(to_convert, nii_files):
+            if isinstance(nii_file, BaseException):
+                logger.warning(
+                    f"Task {task['taskId']} : Failed to convert {series_dir} - {nii_file}"
+                )
+                return task
+
+            series["items"] = nii_file
+            if series.get("segmentations"):
+                logger.debug(f"{task['taskId']} matching headers")
                 try:
-                    nii_img = dicom_series_to_nifti(
-                        series_dir, uniquify_path(series_dir + ".nii.gz")
-                    )
-                except Exception as err:  # pylint: disable=broad-except
-                    logger.warning(
-                        f"Task {task['taskId']} : Failed to convert {series_dir} - {err}"
-                    )
-                    return task
-
-                series["items"] = nii_img["NII_FILE"]
-                if series.get("segmentations"):
-                    logger.debug(f"{task['taskId']} matching headers")
-                    try:
-                        nii_seg = nb.load(  # type: ignore
-                            os.path.abspath(
-                                (
-                                    series["segmentations"]
-                                    if isinstance(series["segmentations"], str)
-                                    else series["segmentations"][0]
-                                )
-                                if "segmentations" in series
-                                else ""
-                            )
+                    imgh = nb.load(nii_file).header  # type: ignore
+                    segh = nb.load(  # type: ignore
+                        os.path.abspath(
+                            series["segmentations"]
+                            if isinstance(series["segmentations"], str)
+                            else series["segmentations"][0]
                         )
-                        imgh = nii_img["NII"].header
-                        segh = nii_seg.header
-                        if not (
-                            imgh.get_data_shape() == segh.get_data_shape()  # type: ignore
-                            and imgh.get_data_offset() == segh.get_data_offset()  # type: ignore
-                            and np.array_equal(
-                                imgh.get_best_affine(), segh.get_best_affine()  # type: ignore
-                            )
-                            and np.array_equal(
-                                imgh.get_qform(), segh.get_qform()  # type: ignore
-                            )
-                            and np.array_equal(
-                                imgh.get_sform(), segh.get_sform()  # type: ignore
-                            )
-                        ):
-                            logger.warning(
-                                f"Task: {task['taskId']} : Headers of converted "
-                                + "nifti image and segmentation do not match."
-                            )
-                    except Exception as err:  # pylint: disable=broad-except
+                    ).header
+                    if not (
+                        imgh.get_data_shape() == segh.get_data_shape()  # type: ignore
+                        and imgh.get_data_offset() == segh.get_data_offset()  # type: ignore
+                        and np.array_equal(
+                            imgh.get_best_affine(), segh.get_best_affine()  # type: ignore
+                        )
+                        and np.array_equal(
+                            imgh.get_qform(), segh.get_qform()  # type: ignore
+                        )
+                        and np.array_equal(
+                            imgh.get_sform(), segh.get_sform()  # type: ignore
+                        )
+                    ):
                         logger.warning(
-                            f"Task {task['taskId']} : Failed to match headers - {err}"
+                            f"Task: {task['taskId']} : Headers of converted "
+                            + "nifti image and segmentation do not match."
                         )
+                except Exception as err:  # pylint: disable=broad-except
+                    logger.warning(
+                        f"Task {task['taskId']} : Failed to match headers - {err}"
+                    )
 
         return task
 
@@ -377,6 +384,9 @@ class ExportImpl(Export):
             if any(not presigned_path for presigned_path in presigned):
                 raise Exception("Failed to presign some files")
 
+            cache_keys: List[Optional[str]] = [
+                f"{storage_id}:{path}" for path in to_presign
+            ]
             presigned_altadb: List[str] = []
             local_files_altadb: List[str] = []
             pos = len(presigned) - 1
@@ -386,10 +396,14 @@ class ExportImpl(Export):
                     local_files_altadb.append(local_files[pos])
                     del presigned[pos]
                     del local_files[pos]
+                    del cache_keys[pos]
                 pos -= 1
 
             downloaded = await download_files(
-                list(zip(presigned, local_files)), "Downloading files", False
+                list(zip(presigned, local_files)),
+                "Downloading files",
+                False,
+                cache_keys=cache_keys,
             )
 
             if any(not downloaded_file for downloaded_file in downloaded):
@@ -456,17 +470,32 @@ class ExportImpl(Export):
 
                         if dicom_seg:
                             from redbrick.utils.dicom_seg import (
-                                convert_nii_to_dicom_seg,
+                                convert_nii_to_dicom_segs,
                             )
 
-                            for idx, segmentation in enumerate(segmentations):
-                                seg = convert_nii_to_dicom_seg(
-                                    segmentation,
+                            # one worker call per series, parsing its headers once
+                            segs: List[Union[Optional[str], Exception]]
+                            try:
+                                segs = await run_in_process(
+                                    convert_nii_to_dicom_segs,
+                                    segmentations,
                                     series_dir,
                                     taxonomy.get("objectTypes", []) or [],
                                     series.get("segmentMap", {}) or {},
                                     series.get("binaryMask", False),
                                 )
+                            except Exception as error:  # pylint: disable=broad-except
+                                segs = [error] * len(segmentations)
+                            for idx, (segmentation, seg) in enumerate(
+                                zip(segmentations, segs)
+                            ):
+                                if isinstance(seg, BaseException):
+                                    logger.warning(
+                                        f"Task {task['taskId']} : Failed to convert "
+                                        + f"{segmentation} to DICOM SEG - {seg}"
+                                    )
+                                    continue
+
                                 for inst in (series.get("segmentMap") or {}).keys():
                                     if isinstance(
                                         series["segmentMap"][inst], dict  # type: ignore
@@ -683,16 +712,16 @@ class ExportImpl(Export):
         downloaded = await download_files(to_download, "Downloading labels", False)
 
         if presigned_urls[0] and downloaded[0]:
-            with open(downloaded[0], "r", encoding="utf-8") as f_:
-                task["labels"] = process_labels(json.load(f_), taxonomy)
+            with open(downloaded[0], "rb") as f_:
+                task["labels"] = process_labels(json_loads(f_.read()), taxonomy)
 
         if len(presigned_urls) > 1:
             for idx in range(1, len(presigned_urls)):
                 fpath = downloaded[idx]
                 if presigned_urls[idx] and fpath:
-                    with open(fpath, "r", encoding="utf-8") as f_:
+                    with open(fpath, "rb") as f_:
                         task["consensusTasks"][idx]["labels"] = process_labels(
-                            json.load(f_), taxonomy
+                            json_loads(f_.read()), taxonomy
                         )
 
         shutil.rmtree(dirname, ignore_errors=True)
@@ -766,7 +795,19 @@ class ExportImpl(Export):
         paths: List[Optional[str]]
         if segmentation_dir:
             paths = await download_files(
-                files, "Downloading segmentations", False, True, True
+                files,
+                "Downloading segmentations",
+                False,
+                True,
+                True,
+                cache_keys=[
+                    (
+                        f"{task['labelStorageId']}:{presign_path}"
+                        if presign_path
+                        else None
+                    )
+                    for presign_path in presign_paths
+                ],
             )
         else:
             paths = list(list(zip(*files))[0])
@@ -912,14 +953,10 @@ class ExportImpl(Export):
         if os.path.isfile(task_file):
             with open(task_file, "rb+") as task_file_:
                 task_file_.seek(-1, 2)
-                task_file_.write(
-                    b"," + json.dumps(task, indent=2).encode("utf-8") + b"]"
-                )
+                task_file_.write(b"," + json_dumpb(task, indent=True) + b"]")
         else:
             with open(task_file, "wb") as task_file_:
-                task_file_.write(
-                    b"[" + json.dumps(task, indent=2).encode("utf-8") + b"]"
-                )
+                task_file_.write(b"[" + json_dumpb(task, indent=True) + b"]")
 
         return task if get_task else None
 
@@ -1079,16 +1116,17 @@ class ExportImpl(Export):
             concurrency,
             "END" if only_ground_truth else stage_name,
             None if task_id else from_timestamp,
-            True,
+            False,
             not no_consensus,
             task_id,
+            EXPORT_TASK_FIELDS,
         )
 
         if task_file and os.path.isfile(task_file):
             os.remove(task_file)
 
         for datapoint in datapoints:
-            task: OutputTask = asyncio.run(
+            task: OutputTask = run_sync(
                 self.export_nifti_label_data(  # type: ignore
                     datapoint,
                     self.project.taxonomy,
@@ -1269,13 +1307,7 @@ class ExportImpl(Export):
         else:
             raise ValueError(f"Invalid task filter: {search}")
 
-        members = self.context.member.list_org_members(self.project.org_id, False)
-
-        users = {}
-        for member in members:
-            user = member.get("user", {})
-            if user.get("userId") and user.get("email"):
-                users[user["userId"]] = user["email"]
+        users = self.context.member_directory.emails(self.project.org_id)
 
         my_iter = PaginationIterator(
             partial(  # type: ignore
@@ -1286,6 +1318,7 @@ class ExportImpl(Export):
                 task_name,
                 filters,
                 True,
+                fields=["createdByEntity", "metaData", "seriesInfo", "storageMethod"],
             ),
             concurrency,
             limit,
@@ -1311,7 +1344,7 @@ class ExportImpl(Export):
             if task["priority"]:
                 task_obj["priority"] = task["priority"]
             if datapoint.get("metaData"):
-                task_obj["metaData"] = json.loads(datapoint["metaData"])
+                task_obj["metaData"] = json_loads(datapoint["metaData"])
 
             if isinstance(datapoint.get("seriesInfo"), list):
                 series_list = []
@@ -1320,7 +1353,7 @@ class ExportImpl(Export):
                     if series["name"]:
                         series_obj["name"] = series["name"]
                     if series["metaData"]:
-                        series_obj["metaData"] = json.loads(series["metaData"])
+                        series_obj["metaData"] = json_loads(series["metaData"])
                     series_list.append(series_obj)
                 if any(series for series in series_list):
                     task_obj["series"] = series_list
@@ -1389,13 +1422,7 @@ class ExportImpl(Export):
             }]
         """
         # pylint: disable=too-many-locals
-        members = self.context.member.list_org_members(self.project.org_id, False)
-
-        users = {}
-        for member in members:
-            user = member.get("user", {})
-            if user.get("userId") and user.get("email"):
-                users[user["userId"]] = user["email"]
+        users = self.context.member_directory.emails(self.project.org_id)
 
         my_iter = PaginationIterator(
             partial(  # type: ignore
@@ -1474,13 +1501,7 @@ class ExportImpl(Export):
                 "cycle": number  # Task cycle
             }]
         """
-        members = self.context.member.list_org_members(self.project.org_id, False)
-
-        users = {}
-        for member in members:
-            user = member.get("user", {})
-            if user.get("userId") and user.get("email"):
-                users[user["userId"]] = user["email"]
+        users = self.context.member_directory.emails(self.project.org_id)
 
         my_iter = PaginationIterator(
             partial(  # type: ignore
@@ -3,7 +3,6 @@
 import functools
 from inspect import signature
 import json
-import asyncio
 from typing import Callable, List, Dict, Optional, Any, TypeVar, cast
 from copy import deepcopy
 
@@ -24,7 +23,7 @@ from redbrick.utils.upload import (
     process_segmentation_upload,
 )
 from redbrick.utils.logging import log_error, logger
-from redbrick.utils.async_utils import gather_with_concurrency, get_session
+from redbrick.utils.async_utils import gather_with_concurrency, get_session, run_sync
 from redbrick.types.task import OutputTask, Comment
 
 
@@ -367,7 +366,7 @@ class LabelingImpl(Labeling):
         )
         if with_labels:
             if rt_struct:
-                converted = asyncio.run(
+                converted = run_sync(
                     gather_with_concurrency(
                         concurrency,
                         *[
@@ -387,7 +386,7 @@ class LabelingImpl(Labeling):
                 with_labels = [task[0] for task in converted]
 
             elif dicom_seg:
-                converted = asyncio.run(
+                converted = run_sync(
                     gather_with_concurrency(
                         concurrency,
                         *[
@@ -405,7 +404,7 @@ class LabelingImpl(Labeling):
                 with_labels = [task[0] for task in converted]
 
             elif mhd:
-                converted = asyncio.run(
+                converted = run_sync(
                     gather_with_concurrency(
                         concurrency,
                         *[
@@ -421,7 +420,7 @@ class LabelingImpl(Labeling):
                 )
                 with_labels = [task[0] for task in converted]
 
-            validated = asyncio.run(
+            validated = run_sync(
                 validate_json(
                     self.context,
                     with_labels,  # type: ignore
@@ -430,15 +429,16 @@ class LabelingImpl(Labeling):
                 )
             )
 
-            with_labels_converted: List[Dict]
-            if validated:
-                with_labels_converted = validated
-            else:
-                failed_tasks.extend(with_labels)  # type: ignore
-                with_labels_converted = []
+            with_labels_converted: List[Dict] = validated
+            validated_ids = {task.get("taskId") for task in validated}
+            failed_tasks.extend(
+                task  # type: ignore
+                for task in with_labels
+                if task.get("taskId") not in validated_ids
+            )
 
             failed_tasks.extend(
-                asyncio.run(
+                run_sync(
                     self._put_tasks(
                         stage_name,
                         with_labels_converted,
@@ -456,7 +456,7 @@ class LabelingImpl(Labeling):
 
         if without_labels:
             failed_tasks.extend(
-                asyncio.run(
+                run_sync(
                     self._put_tasks(
                         stage_name,
                         without_labels,  # type: ignore
@@ -544,4 +544,4 @@ class LabelingImpl(Labeling):
 
     def move_tasks_to_start(self, task_ids: List[str]) -> None:
         """Move groundtruth tasks back to start."""
-        asyncio.run(self._tasks_to_start(task_ids))
+        run_sync(self._tasks_to_start(task_ids))
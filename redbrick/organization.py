@@ -1,6 +1,6 @@
 """Organization class."""
 
-import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 from typing import Any, List, Optional, Dict, Sequence, Union
@@ -15,7 +15,7 @@ from redbrick.common.member import OrgMember
 from redbrick.common.context import RBContext
 from redbrick.config import config
 from redbrick.dataset import RBDatasetImpl
-from redbrick.utils.async_utils import gather_with_concurrency, get_session
+from redbrick.utils.async_utils import gather_with_concurrency, get_session, run_sync
 from redbrick.workspace import RBWorkspaceImpl
 from redbrick.project import RBProjectImpl
 from redbrick.types.taxonomy import Attribute, ObjectType, Taxonomy
@@ -106,12 +106,28 @@ class RBOrganizationImpl(RBOrganization):
     def projects(self, include_archived: bool = False) -> List[RBProject]:
         """Get a list of active projects in the organization."""
         projects = self.projects_raw(include_archived)
-        return [
-            RBProjectImpl(
-                self.context, self._org_id, proj["projectId"], include_archived
+        for proj in projects:
+            if proj["status"] == "CREATION_SUCCESS":
+                self.context.metadata.put(
+                    "project", f"{self._org_id}/{proj['projectId']}", proj
+                )
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+            return list(
+                tqdm(
+                    executor.map(
+                        lambda proj: RBProjectImpl(
+                            self.context,
+                            self._org_id,
+                            proj["projectId"],
+                            include_archived,
+                        ),
+                        projects,
+                    ),
+                    total=len(projects),
+                    leave=config.log_info,
+                )
             )
-            for proj in tqdm(projects, leave=config.log_info)
-        ]
 
     @property
     def members(self) -> List[Dict]:
@@ -410,6 +426,7 @@ class RBOrganizationImpl(RBOrganization):
         if project.archived:
             log_error(f"Project {project_id} is already archived")
             return False
+        self.context.metadata.invalidate("project", f"{self._org_id}/{project_id}")
         return self.context.project.archive_project(self._org_id, project_id)
 
     def unarchive_project(self, project_id: str) -> bool:
@@ -418,10 +435,13 @@ class RBOrganizationImpl(RBOrganization):
         if not project.archived:
             log_error(f"Project {project_id} is not archived")
             return False
+        self.context.metadata.invalidate("project", f"{self._org_id}/{project_id}")
         return self.context.project.unarchive_project(self._org_id, project_id)
 
     async def _delete_projects(self, project_ids: List[str]) -> List[bool]:
         """Delete a list of projects by ID."""
+        for project_id in project_ids:
+            self.context.metadata.invalidate("project", f"{self._org_id}/{project_id}")
         async with get_session() as session:
             res = await gather_with_concurrency(
                 MAX_CONCURRENCY,
@@ -444,12 +464,12 @@ class RBOrganizationImpl(RBOrganization):
             log_error("Please archive the project before deleting it")
             return False
 
-        return asyncio.run(self._delete_projects([project_id]))[0]
+        return run_sync(self._delete_projects([project_id]))[0]
 
     def delete_projects(self, project_ids: List[str]) -> None:
         """Delete a list of projects by ID."""
         projects = self.projects_raw(include_archived=True)
-        asyncio.run(
+        run_sync(
             self._delete_projects(
                 [
                     project["projectId"]
@@ -577,9 +597,11 @@ class RBOrganizationImpl(RBOrganization):
             object_types,
         ):
             logger.info(f"Successfully updated taxonomy: {tax_id}")
+        self.context.metadata.invalidate("taxonomy")
 
     async def _delete_taxonomies(self, tax_ids: List[str]) -> List[bool]:
         """Delete a list of taxonomies by ID."""
+        self.context.metadata.invalidate("taxonomy")
         async with get_session() as session:
             res = await gather_with_concurrency(
                 MAX_CONCURRENCY,
@@ -604,13 +626,14 @@ class RBOrganizationImpl(RBOrganization):
                 log_error("Please provide taxonomy name or ID to delete")
                 return False
 
+            self.context.metadata.invalidate("taxonomy", f"{self._org_id}/{name}")
             return self.context.project.delete_taxonomy_by_name(self._org_id, name)
 
-        return asyncio.run(self._delete_taxonomies([tax_id]))[0]
+        return run_sync(self._delete_taxonomies([tax_id]))[0]
 
     def delete_taxonomies(self, tax_ids: List[str]) -> None:
         """Delete a list of taxonomies by ID."""
-        asyncio.run(self._delete_taxonomies(tax_ids))
+        run_sync(self._delete_taxonomies(tax_ids))
 
     def self_health_check(self, self_url: str) -> Optional[str]:
         """Send a health check update from the model server."""
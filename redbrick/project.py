@@ -1,6 +1,7 @@
 """Interface for interacting with your RedBrick AI Projects."""
 
 from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dateutil import parser  # type: ignore
 
@@ -64,12 +65,10 @@ class RBProjectImpl(RBProject):
 
         self._taxonomy: Optional[Taxonomy] = None
 
-        # check if project exists on backend to validate
+        # check if project exists on backend to validate,
+        # and if project taxonomy is valid
         self._get_project()
 
-        # check if project taxonomy is valid
-        _ = self.taxonomy
-
         self.output_stage_name: str = "Output"
         for stage in self._stages:
             if stage["brickName"] == "labelset-output":
@@ -131,8 +130,12 @@ class RBProjectImpl(RBProject):
     def taxonomy(self) -> Taxonomy:
         """Retrieves the project taxonomy."""
         if not self._taxonomy:
-            self._taxonomy = self.context.project.get_taxonomy(
-                org_id=self.org_id, tax_id=None, name=self.taxonomy_name
+            self._taxonomy = self.context.metadata.fetch(
+                "taxonomy",
+                f"{self.org_id}/{self.taxonomy_name}",
+                lambda: self.context.project.get_taxonomy(
+                    org_id=self.org_id, tax_id=None, name=self.taxonomy_name
+                ),
             )
         return self._taxonomy
 
@@ -216,6 +219,9 @@ class RBProjectImpl(RBProject):
         except tenacity.RetryError as error:
             raise Exception("Unknown problem occurred") from error
 
+        return self.__check_project_status(project)
+
+    def __check_project_status(self, project: Dict) -> Dict:
         if project["status"] == "REMOVING":
             if self.include_archived:
                 return project
@@ -230,14 +236,36 @@ class RBProjectImpl(RBProject):
         raise Exception("Unknown problem occurred")
 
     def _get_project(self) -> None:
-        """Get project to confirm it exists."""
-        project = self.__wait_for_project_to_finish_creating()
+        """Get project to confirm it exists, fetching metadata concurrently."""
+        cache = self.context.metadata
+        cache_key = f"{self.org_id}/{self.project_id}"
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stages = executor.submit(
+                cache.fetch,
+                "stages",
+                cache_key,
+                lambda: self.context.project.get_stages(self.org_id, self.project_id),
+            )
+
+            # only ready projects are cached, anything else is fetched again
+            project = cache.get("project", cache_key)
+            if project is not None and project["status"] == "CREATION_SUCCESS":
+                project = self.__check_project_status(project)
+            else:
+                cache.invalidate("project", cache_key)
+                project = self.__wait_for_project_to_finish_creating()
+                if project["status"] == "CREATION_SUCCESS":
+                    cache.put("project", cache_key, project)
+
+            self._project_name = project["name"]
+            self.td_type = project["tdType"]
+            self._taxonomy_name = project["taxonomy"]["name"]
+            taxonomy = executor.submit(lambda: self.taxonomy)
+
+            self._stages = stages.result()
+            taxonomy.result()
 
-        self._project_name = project["name"]
-        self.td_type = project["tdType"]
-        self._taxonomy_name = project["taxonomy"]["name"]
         self._workspace_id = (project.get("workspace", {}) or {}).get("workspaceId")
-        self._stages = self.context.project.get_stages(self.org_id, self.project_id)
         self._project_url = project["projectUrl"]
         self._created_at = parser.parse(project["createdAt"])
         self.is_consensus_enabled = project["consensusSettings"]["enabled"]
@@ -304,9 +332,13 @@ class RBProjectImpl(RBProject):
             stage.stage_name,
             stage.config.to_entity(self.taxonomy),
         )
+        cache_key = f"{self.org_id}/{self.project_id}"
         if success:
             if pipeline:
                 self._stages = pipeline
+                self.context.metadata.put("stages", cache_key, pipeline)
+            else:
+                self.context.metadata.invalidate("stages", cache_key)
         else:
             logger.warning("Error updating stage.")
 
@@ -134,12 +134,13 @@ class ExportRepoImpl(ExportRepo):
         task_id: str,
         presign_items: bool = False,
         with_consensus: bool = False,
+        fields: Optional[Sequence[str]] = None,
     ) -> Dict:
-        """Get the latest datapoint."""
+        """Get the latest datapoint, with all or only the given optional fields."""
         query_string = f"""
         query taskSDK($orgId: UUID!, $projectId: UUID!, $taskId: UUID!) {{
             task(orgId: $orgId, projectId: $projectId, taskId: $taskId) {{
-                {task_shard(presign_items, with_consensus)}
+                {task_shard(presign_items, with_consensus, fields)}
             }}
         }}
         """
@@ -160,8 +161,9 @@ class ExportRepoImpl(ExportRepo):
         with_consensus: bool = False,
         first: int = 50,
         cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Tuple[List[Dict], Optional[str], Optional[datetime]]:
-        """Get the latest datapoints."""
+        """Get the latest datapoints, with all or only the given optional fields."""
         # pylint: disable=too-many-locals
         query_string = f"""
         query tasksPagedSDK(
@@ -181,7 +183,7 @@ class ExportRepoImpl(ExportRepo):
                 after: $after
             ) {{
                 entries {{
-                    {task_shard(presign_items, with_consensus)}
+                    {task_shard(presign_items, with_consensus, fields)}
                 }}
                 cursor
                 cacheTime
@@ -218,6 +220,7 @@ class ExportRepoImpl(ExportRepo):
         only_meta_data: bool = True,
         first: int = 50,
         after: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> Tuple[List[Dict], Optional[str]]:
         """Task search."""
         query_string = f"""
@@ -246,7 +249,7 @@ class ExportRepoImpl(ExportRepo):
                     updatedAt
                     priority
                     datapoint {{
-                        {datapoint_shard(not only_meta_data, not only_meta_data)}
+                        {datapoint_shard(not only_meta_data, not only_meta_data, fields)}
                     }}
                     currentStageSubTask {{
                         ... on LabelingTask {{
@@ -1,5 +1,9 @@
 """Partial queries to prevent duplication."""
 
+from typing import Collection, Dict, Optional
+
+from redbrick.common.export import TASK_FIELDS
+
 USER_SHARD = """
 userId
 email
@@ -233,11 +237,15 @@ objectTypes {{
 }}
 """
 
-TASK_DATA_SHARD = f"""
+TASK_META_SHARD = f"""
     createdAt
     createdByEntity {{
         {USER_SHARD}
     }}
+"""
+
+TASK_DATA_SHARD = f"""
+    {TASK_META_SHARD}
     labelsData(interpolate: true)
     labelsDataPath(presigned: false)
     labelsStorage {{
@@ -259,42 +267,6 @@ NORMAL_TASK_SHARD = f"""
     }}
 """
 
-CONSENSUS_TASK_SHARD = f"""
-    ... on LabelingTask {{
-        state
-        assignedTo {{
-            {USER_SHARD}
-        }}
-        taskData {{
-            {TASK_DATA_SHARD}
-        }}
-        subTasks {{
-            state
-            assignedTo {{
-                {USER_SHARD}
-            }}
-            taskData {{
-                {TASK_DATA_SHARD}
-            }}
-        }}
-        overallConsensusScore
-        consensusInfo {{
-            user {{
-                {USER_SHARD}
-            }}
-            taskData {{
-                {TASK_DATA_SHARD}
-            }}
-            scores {{
-                user {{
-                    {USER_SHARD}
-                }}
-                score
-            }}
-        }}
-    }}
-"""
-
 TASK_COMMENT_SHARD = f"""
     commentId
     createdBy {{
@@ -337,25 +309,25 @@ TASK_COMMENT_SHARD = f"""
 """
 
 
-def datapoint_shard(raw_items: bool, presigned_items: bool) -> str:
-    """Return the datapoint shard."""
-    return f"""
-        dpId
-        name
-        {"items(presigned: false)" if raw_items else ""}
-        {"itemsPresigned:items(presigned: true)" if presigned_items else ""}
-        createdAt
+DATAPOINT_FIELD_SHARDS: Dict[str, str] = {
+    "items": "items(presigned: false)",
+    "itemsPresigned": "itemsPresigned:items(presigned: true)",
+    "createdByEntity": f"""
         createdByEntity {{
             {USER_SHARD}
         }}
-        metaData
-        seriesInfo {{
+    """,
+    "metaData": "metaData",
+    "seriesInfo": """
+        seriesInfo {
             name
             itemsIndices
             dataType
             metaData
-        }}
-        heatMaps {{
+        }
+    """,
+    "heatMaps": """
+        heatMaps {
             seriesIndex
             seriesName
             name
@@ -365,40 +337,124 @@ def datapoint_shard(raw_items: bool, presigned_items: bool) -> str:
             opacityPoints
             opacityPoints3d
             rgbPoints
-        }}
-        transforms {{
+        }
+    """,
+    "transforms": """
+        transforms {
             seriesIndex
             transform
-        }}
-        centerline {{
+        }
+    """,
+    "centerline": """
+        centerline {
             seriesIndex
             name
             centerline
-        }}
-        storageMethod {{
+        }
+    """,
+    "storageMethod": """
+        storageMethod {
             storageId
-        }}
-        attributes
-        archived
-        cohorts {{
+        }
+    """,
+    "attributes": "attributes",
+    "archived": "archived",
+    "cohorts": """
+        cohorts {
             name
+        }
+    """,
+}
+
+
+def consensus_task_shard(task_data: str) -> str:
+    """Return the consensus task shard, with the given task data shard."""
+    return f"""
+    ... on LabelingTask {{
+        state
+        assignedTo {{
+            {USER_SHARD}
+        }}
+        taskData {{
+            {task_data}
+        }}
+        subTasks {{
+            state
+            assignedTo {{
+                {USER_SHARD}
+            }}
+            taskData {{
+                {task_data}
+            }}
         }}
+        overallConsensusScore
+        consensusInfo {{
+            user {{
+                {USER_SHARD}
+            }}
+            taskData {{
+                {task_data}
+            }}
+            scores {{
+                user {{
+                    {USER_SHARD}
+                }}
+                score
+            }}
+        }}
+    }}
     """
 
 
-def task_shard(presigned_items: bool, with_consensus: bool) -> str:
-    """Return the task shard for the router query."""
+def _validate_fields(fields: Optional[Collection[str]]) -> None:
+    """Validate a task field projection."""
+    if fields is not None and not set(fields).issubset(TASK_FIELDS):
+        raise ValueError(
+            f"Invalid task fields: {sorted(set(fields).difference(TASK_FIELDS))}"
+        )
+
+
+def datapoint_shard(
+    raw_items: bool, presigned_items: bool, fields: Optional[Collection[str]] = None
+) -> str:
+    """Return the datapoint shard, with all or only the given optional fields."""
+    _validate_fields(fields)
+    selected = set(DATAPOINT_FIELD_SHARDS if fields is None else fields)
+    if not raw_items:
+        selected.discard("items")
+    if not presigned_items:
+        selected.discard("itemsPresigned")
+    shards = [
+        shard for field, shard in DATAPOINT_FIELD_SHARDS.items() if field in selected
+    ]
+    return "\n".join(["dpId", "name", "createdAt"] + shards)
+
+
+def task_shard(
+    presigned_items: bool,
+    with_consensus: bool,
+    fields: Optional[Collection[str]] = None,
+) -> str:
+    """Return the task shard for the router query, with all or only the given fields.
+
+    Task data (labels) of the latest version and of consensus sub tasks is
+    skipped unless ``labels`` is selected.
+    """
+    _validate_fields(fields)
+    task_data = (
+        TASK_DATA_SHARD if fields is None or "labels" in fields else TASK_META_SHARD
+    )
     return f"""
         taskId
         dpId
         currentStageName
         priority
-        {f"currentStageSubTask(consensus: true) {{ {CONSENSUS_TASK_SHARD} }}" if with_consensus else f"currentStageSubTask {{ {NORMAL_TASK_SHARD} }}"}
+        {f"currentStageSubTask(consensus: true) {{ {consensus_task_shard(task_data)} }}" if with_consensus else f"currentStageSubTask {{ {NORMAL_TASK_SHARD} }}"}
         datapoint {{
-            {datapoint_shard(True, presigned_items)}
+            {datapoint_shard(True, presigned_items, fields)}
         }}
         latestTaskData {{
-            {TASK_DATA_SHARD}
+            {task_data}
         }}
     """
 
@@ -11,6 +11,18 @@ from redbrick.repo.shards import TASK_COMMENT_SHARD
 from redbrick.types.task import InputTask, CommentPin
 
 
+IMPORT_FILES_MUTATION = """
+    mutation importFiles($orgId: UUID!, $dataStore: String!, $files: [ImportJobFileInput!]!, $importName: String, $importId: UUID) {
+        importFiles(orgId: $orgId, dataStore: $dataStore, files: $files, importName: $importName, importId: $importId) {
+            dataStoreImport {
+               importId
+            }
+            urls
+        }
+    }
+"""
+
+
 class UploadRepoImpl(UploadRepo):
     """Handle communication with backend relating to uploads."""
 
@@ -31,16 +43,7 @@ class UploadRepoImpl(UploadRepo):
         if not any([import_id, import_name]):
             raise ValueError("Either import_id or import_name must be provided")
 
-        query_string = """
-            mutation importFiles($orgId: UUID!, $dataStore: String!, $files: [ImportJobFileInput!]!, $importName: String, $importId: UUID) {
-                importFiles(orgId: $orgId, dataStore: $dataStore, files: $files, importName: $importName, importId: $importId) {
-                    dataStoreImport {
-                       importId
-                    }
-                    urls
-                }
-            }
-        """
+        query_string = IMPORT_FILES_MUTATION
         query_variables = {
             "orgId": org_id,
             "dataStore": data_store,
@@ -54,6 +57,36 @@ class UploadRepoImpl(UploadRepo):
             result["importFiles"]["urls"],
         )
 
+    async def import_dataset_files_async(
+        self,
+        aio_client: aiohttp.ClientSession,
+        org_id: str,
+        data_store: str,
+        import_name: Optional[str] = None,
+        import_id: Optional[str] = None,
+        files: Optional[List[Dict]] = None,
+    ) -> Tuple[str, List[str]]:
+        """Import files into a dataset."""
+        files = files or []
+        if not any([import_id, import_name]):
+            raise ValueError("Either import_id or import_name must be provided")
+
+        query_string = IMPORT_FILES_MUTATION
+        query_variables = {
+            "orgId": org_id,
+            "dataStore": data_store,
+            "files": files,
+            "importName": import_name,
+            "importId": import_id,
+        }
+        result: Dict = await self.client.execute_query_async(
+            aio_client, query_string, query_variables
+        )
+        return (
+            result["importFiles"]["dataStoreImport"]["importId"],
+            result["importFiles"]["urls"],
+        )
+
     def process_dataset_import(
         self,
         org_id: str,
@@ -1,6 +1,5 @@
 """Public interface to storage module."""
 
-import asyncio
 from typing import List
 
 from redbrick.common.entities import RBOrganization
@@ -11,6 +10,7 @@ from redbrick.common.storage import (
     STORAGE_PROVIDERS,
 )
 from redbrick.utils.files import is_valid_file_url
+from redbrick.utils.async_utils import run_sync
 
 
 class StorageImpl(Storage):
@@ -69,4 +69,4 @@ class StorageImpl(Storage):
         presigned_url = self.context.storage.presign_path(
             self.org.org_id, storage_id, path
         )
-        return asyncio.run(is_valid_file_url(presigned_url))
+        return run_sync(is_valid_file_url(presigned_url))
@@ -2,20 +2,26 @@
 
 import asyncio
 import os
-from typing import Callable, List, Dict, Optional
+from typing import Callable, Iterable, List, Dict, Optional, Tuple
 
+import aiohttp
 import tqdm  # type: ignore
+from natsort import natsorted, ns
 
 from redbrick.common.entities import RBDataset
-from redbrick.common.constants import MAX_FILE_BATCH_SIZE
+from redbrick.common.constants import (
+    MAX_CONCURRENCY,
+    MAX_FILE_BATCH_SIZE,
+    MAX_PRESIGN_BATCH_SIZE,
+)
 from redbrick.common.upload import DatasetUpload
-from redbrick.utils.async_utils import gather_with_concurrency
+from redbrick.utils.async_utils import gather_or_cancel, get_session, run_sync
 from redbrick.utils.logging import log_error, logger
 from redbrick.utils.files import (
     DICOM_FILE_TYPES,
-    find_files_recursive,
     get_file_type,
-    upload_files,
+    scan_files,
+    upload_file,
 )
 
 
@@ -39,49 +45,71 @@ class DatasetUploadImpl(DatasetUpload):
         self.dataset = dataset
         self.context = self.dataset.context
 
-    async def _upload_files_intermediate_function(
+    async def _upload_files_pipeline(
         self,
         import_id: str,
-        import_name: Optional[str] = None,
-        files_paths: Optional[List[Dict]] = None,
+        files_list: List[Dict],
+        concurrency: int,
         upload_callback: Optional[Callable] = None,
     ) -> bool:
-        """Upload files to presigned URLs."""
-        # Generate presigned URLs for concurrency number of files at a time
-        files_paths = files_paths or []
-        _, presigned_urls = self.context.upload.import_dataset_files(
-            org_id=self.dataset.org_id,
-            data_store=self.dataset.dataset_name,
-            import_name=import_name,
-            import_id=import_id,
-            files=[
-                {
-                    "filePath": file_path["filePath"],
-                    "fileType": file_path["fileType"],
-                    "fileSize": file_path["fileSize"],
-                }
-                for file_path in files_paths
-            ],
+        """Presign files in batches ahead of a steady pool of uploaders."""
+        concurrency = max(1, min(concurrency, MAX_CONCURRENCY))
+        queue: "asyncio.Queue[Optional[Tuple[Dict, str]]]" = asyncio.Queue(
+            2 * MAX_PRESIGN_BATCH_SIZE
         )
 
-        if not presigned_urls:
-            return False
-
-        # Upload files to presigned URLs
-        results = await upload_files(
-            [
-                (
+        async def presign() -> None:
+            async with get_session() as session:
+                for idx in range(0, len(files_list), MAX_PRESIGN_BATCH_SIZE):
+                    files_batch = files_list[idx : idx + MAX_PRESIGN_BATCH_SIZE]
+                    _, presigned_urls = (
+                        await self.context.upload.import_dataset_files_async(
+                            session,
+                            org_id=self.dataset.org_id,
+                            data_store=self.dataset.dataset_name,
+                            import_id=import_id,
+                            files=[
+                                {
+                                    "filePath": file_path["filePath"],
+                                    "fileType": file_path["fileType"],
+                                    "fileSize": file_path["fileSize"],
+                                }
+                                for file_path in files_batch
+                            ],
+                        )
+                    )
+                    if not presigned_urls or len(presigned_urls) != len(files_batch):
+                        raise Exception("Failed to presign some files")
+
+                    for item in zip(files_batch, presigned_urls):
+                        await queue.put(item)
+            for _ in range(concurrency):
+                await queue.put(None)
+
+        async def upload(session: aiohttp.ClientSession) -> None:
+            while (item := await queue.get()) is not None:
+                file_path, presigned_url = item
+                await upload_file(
+                    session,
                     file_path["abs_file_path"],
                     presigned_url,
                     get_file_type(file_path["abs_file_path"])[-1],
+                    upload_callback=upload_callback,
                 )
-                for file_path, presigned_url in zip(files_paths, presigned_urls)
-            ],
-            progress_bar_name="Batch Progress",
-            keep_progress_bar=False,
-            upload_callback=upload_callback,
-        )
-        return all(results)
+
+        try:
+            async with get_session(api=False) as session:
+                await gather_or_cancel(
+                    presign(), *(upload(session) for _ in range(concurrency))
+                )
+        except Exception as error:  # pylint: disable=broad-except
+            log_error(error)
+            return False
+        finally:
+            while not queue.empty():
+                queue.get_nowait()
+
+        return True
 
     def upload_files(
         self,
@@ -90,7 +118,7 @@ class DatasetUploadImpl(DatasetUpload):
         concurrency: int = MAX_FILE_BATCH_SIZE,
     ) -> None:
         """Upload files."""
-        files: List[str] = []
+        files: Iterable[str] = []
         if not path:
             logger.warning("No file path provided")
             return
@@ -100,10 +128,13 @@ class DatasetUploadImpl(DatasetUpload):
             return
 
         if os.path.isdir(path):
-            _files = find_files_recursive(
-                path, set(DICOM_FILE_TYPES.keys()), multiple=False
+            files = (
+                _file[0]
+                for _file in scan_files(
+                    path, set(DICOM_FILE_TYPES.keys()), multiple=False
+                )
+                if _file
             )
-            files = [_file[0] for _file in _files if _file]
 
         else:
             file_type = get_file_type(path)[0]
@@ -112,10 +143,6 @@ class DatasetUploadImpl(DatasetUpload):
             else:
                 logger.warning(f"File {path} is not supported")
 
-        if not files:
-            logger.warning(f"No files found in path {path}")
-            return
-
         # Now that we have the files list, let us generate the presigned URLs
         files_list: List[Dict] = []
         for file_ in files:
@@ -128,6 +155,14 @@ class DatasetUploadImpl(DatasetUpload):
                 }
             )
 
+        if not files_list:
+            logger.warning(f"No files found in path {path}")
+            return
+
+        files_list = natsorted(
+            files_list, key=lambda file_: file_["abs_file_path"], alg=ns.IGNORECASE
+        )
+
         import_id, _ = self.context.upload.import_dataset_files(
             org_id=self.dataset.org_id,
             data_store=self.dataset.dataset_name,
@@ -141,21 +176,13 @@ class DatasetUploadImpl(DatasetUpload):
         def _upload_callback(*_):
             progress_bar.update(1)
 
-        # Upload files to presigned URLs
-        upload_status = asyncio.run(
-            gather_with_concurrency(
-                min(5, concurrency),
-                *[
-                    self._upload_files_intermediate_function(
-                        import_name=import_name,
-                        import_id=import_id,
-                        files_paths=files_list[i : i + MAX_FILE_BATCH_SIZE],
-                        upload_callback=_upload_callback,
-                    )
-                    for i in range(0, len(files_list), MAX_FILE_BATCH_SIZE)
-                ],
+        # Presign and upload files to presigned URLs
+        upload_status = run_sync(
+            self._upload_files_pipeline(
+                import_id, files_list, concurrency, _upload_callback
             )
         )
+        progress_bar.close()
 
         if not upload_status:
             log_error("Error uploading files", True)
@@ -164,7 +191,7 @@ class DatasetUploadImpl(DatasetUpload):
             org_id=self.dataset.org_id,
             data_store=self.dataset.dataset_name,
             import_id=import_id,
-            total_files=len(files),
+            total_files=len(files_list),
         )
         if not mutation_status:
             log_error("Error finalizing the import", True)
@@ -4,30 +4,35 @@ import shutil
 import asyncio
 import os
 from copy import deepcopy
-from typing import List, Dict, Optional, Set
+from typing import Awaitable, List, Dict, Optional, Set
 import json
 
 import aiohttp
 import tenacity
 from tenacity.stop import stop_after_attempt
-import tqdm  # type: ignore
 
-from redbrick.config import config
 from redbrick.common.constants import DUMMY_FILE_PATH, MAX_CONCURRENCY
 from redbrick.common.context import RBContext
 from redbrick.common.storage import StorageMethod
 from redbrick.types.task import InputTask
 from redbrick.types.taxonomy import Taxonomy
-from redbrick.utils.async_utils import gather_with_concurrency, get_session
+from redbrick.utils.async_utils import (
+    gather_with_concurrency,
+    get_session,
+    run_in_thread,
+    run_sync,
+)
 from redbrick.utils.common_utils import config_path
 from redbrick.utils.upload import (
     convert_mhd_to_nii_labels,
     convert_rt_struct_to_nii_labels,
     convert_dicom_seg_to_nii_labels,
+    is_import_format,
     process_segmentation_upload,
 )
 from redbrick.utils.logging import assert_validation, log_error, logger
-from redbrick.utils.files import get_file_type, upload_files
+from redbrick.utils.files import TransferScheduler, get_file_type, upload_files
+from redbrick.utils.upload_index import UploadIndex, reusable_uploads
 
 
 @tenacity.retry(
@@ -50,9 +55,11 @@ async def create_task(
     prune_segmentations: bool,
     update_items: bool,
     append: bool,
+    scheduler: Optional[TransferScheduler] = None,
+    upload_index: Optional[UploadIndex] = None,
 ) -> Dict:
     """Create task interact function."""
-    # pylint:disable=too-many-locals
+    # pylint:disable=too-many-locals, too-many-branches, too-many-statements
     logger.debug(
         f"org_id={org_id}, workspace_id={workspace_id}, project_id={project_id}, "
         + f"storage={storage_id}, gt={is_ground_truth}, label_storage={label_storage_id}, "
@@ -60,17 +67,30 @@ async def create_task(
     )
     if storage_id == StorageMethod.REDBRICK and point.get("items"):
         logger.debug("Uploading files to Redbrick")
+        heatmap_start_idx = len(point["items"])
+        local_items: List[str] = point["items"] + [
+            heat_map["item"] for heat_map in point.get("heatMaps") or []
+        ]
         file_types, upload_items, presigned_items = [], [], []
+        remote_paths: List[Optional[str]] = [None] * len(local_items)
         try:
-            for item in point["items"]:
+            for item in local_items:
                 file_types.append(get_file_type(item)[1])
                 upload_items.append(os.path.split(item)[-1])
-            for heat_map in point.get("heatMaps") or []:
-                file_types.append(get_file_type(heat_map["item"])[1])
-                upload_items.append(os.path.split(heat_map["item"])[-1])
-            presigned_items = generate_upload_presigned_url(
-                context, org_id, workspace_id, project_id, upload_items, file_types
-            )
+            if upload_index:
+                remote_paths = await reusable_uploads(
+                    upload_index, context, session, org_id, local_items, file_types
+                )
+            pending = [idx for idx, path in enumerate(remote_paths) if not path]
+            if pending:
+                presigned_items = generate_upload_presigned_url(
+                    context,
+                    org_id,
+                    workspace_id,
+                    project_id,
+                    [upload_items[idx] for idx in pending],
+                    [file_types[idx] for idx in pending],
+                )
         except Exception:  # pylint:disable=broad-except
             log_error(f"Failed to upload {point['name']}")
             return {
@@ -78,32 +98,31 @@ async def create_task(
                 "error": f"Failed to upload {point['name']}",
             }
 
-        files = [
-            (
-                item,
-                presigned_items[idx]["presignedUrl"],
-                file_types[idx],
-            )
-            for idx, item in enumerate(point["items"])
+        logger.debug(
+            f"Reusing {len(local_items) - len(pending)} uploaded files for {point['name']}"
+        )
+        transfers = [
+            (idx, (local_items[idx], presigned["presignedUrl"], file_types[idx]))
+            for idx, presigned in zip(pending, presigned_items)
         ]
-        heatmap_start_idx = len(point["items"])
+        files = [transfer for idx, transfer in transfers if idx < heatmap_start_idx]
         heat_maps = [
-            (
-                heat_map["item"],
-                presigned_items[heatmap_start_idx + idx]["presignedUrl"],
-                file_types[heatmap_start_idx + idx],
-            )
-            for idx, heat_map in enumerate(point.get("heatMaps") or [])
+            transfer for idx, transfer in transfers if idx >= heatmap_start_idx
         ]
 
+        priority = scheduler.next_priority() if scheduler else 0
         uploaded_items, uploaded_heatmaps = await asyncio.gather(
             upload_files(
                 files,
                 f"Uploading items for {point['name'][:57]}{point['name'][57:] and '...'}",
+                scheduler=scheduler,
+                priority=priority,
             ),
             upload_files(
                 heat_maps,
                 f"Uploading heat maps for {point['name'][:57]}{point['name'][57:] and '...'}",
+                scheduler=scheduler,
+                priority=priority,
             ),
         )
 
@@ -114,11 +133,19 @@ async def create_task(
                 "error": f"Failed to upload {point['name']}",
             }
 
-        point["items"] = [
-            presigned_items[idx]["filePath"] for idx in range(len(point["items"]))
-        ]
+        for idx, presigned in zip(pending, presigned_items):
+            remote_paths[idx] = presigned["filePath"]
+        if upload_index and pending:
+            await run_in_thread(
+                upload_index.record,
+                [local_items[idx] for idx in pending],
+                [file_types[idx] for idx in pending],
+                [remote_paths[idx] for idx in pending],
+            )
+
+        point["items"] = remote_paths[:heatmap_start_idx]
         for idx, heat_map in enumerate(point.get("heatMaps") or []):
-            heat_map["item"] = presigned_items[heatmap_start_idx + idx]["filePath"]
+            heat_map["item"] = remote_paths[heatmap_start_idx + idx]
 
     try:
         labels_data_path, labels_map = (
@@ -386,9 +413,10 @@ async def create_tasks(
     concurrency: int = 50,
     update_items: bool = False,
     append: bool = False,
+    dedup_uploads: bool = False,
 ) -> List[Dict]:
     """Create tasks interact function."""
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-locals, too-many-branches
     try:
         global_segmentations = map_segmentation_category(segmentation_mapping)
         for point in points:
@@ -417,32 +445,47 @@ async def create_tasks(
         else (None, None)
     )
 
-    async with get_session() as session:
-        coros = [
-            create_task(
-                context=context,
-                session=session,
-                org_id=org_id,
-                workspace_id=workspace_id,
-                project_id=project_id,
-                storage_id=storage_id,
-                point=point,
-                is_ground_truth=is_ground_truth,
-                label_storage_id=label_storage_id,
-                project_label_storage_id=project_label_storage_id or label_storage_id,
-                label_validate=label_validate,
-                prune_segmentations=prune_segmentations,
-                update_items=update_items,
-                append=append,
+    upload_index = (
+        UploadIndex(org_id)
+        if dedup_uploads and storage_id == StorageMethod.REDBRICK
+        else None
+    )
+    try:
+        async with get_session() as session, get_session(api=False) as transfer_session:
+            scheduler = TransferScheduler(transfer_session)
+            coros = [
+                create_task(
+                    context=context,
+                    session=session,
+                    org_id=org_id,
+                    workspace_id=workspace_id,
+                    project_id=project_id,
+                    storage_id=storage_id,
+                    point=point,
+                    is_ground_truth=is_ground_truth,
+                    label_storage_id=label_storage_id,
+                    project_label_storage_id=project_label_storage_id
+                    or label_storage_id,
+                    label_validate=label_validate,
+                    prune_segmentations=prune_segmentations,
+                    update_items=update_items,
+                    append=append,
+                    scheduler=scheduler,
+                    upload_index=upload_index,
+                )
+                for point in points
+            ]
+            tasks = await gather_with_concurrency(
+                min(concurrency, 10),
+                *coros,
+                progress_bar_name=(
+                    "Updating items" if update_items else "Creating tasks"
+                ),
+                keep_progress_bar=True,
             )
-            for point in points
-        ]
-        tasks = await gather_with_concurrency(
-            min(concurrency, 10),
-            *coros,
-            progress_bar_name=("Updating items" if update_items else "Creating tasks"),
-            keep_progress_bar=True,
-        )
+    finally:
+        if upload_index:
+            upload_index.close()
 
     temp_dir = os.path.join(config_path(), "temp")
     if os.path.exists(temp_dir):
@@ -501,7 +544,112 @@ def generate_upload_presigned_url(
     return result
 
 
-def prepare_json_files(
+def _prepare_json_item(
+    item: Dict, task_dir: str, storage_id: str, uploaded: Optional[Set[str]]
+) -> bool:
+    """Normalize an item's label format and resolve its local paths, if valid."""
+    # pylint: disable=too-many-branches
+    if (
+        not isinstance(item.get("items"), list)
+        or not item["items"]
+        or not all(isinstance(i, str) for i in item["items"])
+    ):
+        logger.warning(f"Invalid {item}")
+        return False
+
+    if "name" not in item:
+        item["name"] = item["items"][0]
+    if uploaded and item["name"] in uploaded:
+        logger.info(f"Skipping duplicate item name: {item['name']}")
+        return False
+
+    if "segmentations" in item:
+        if isinstance(item["segmentations"], list):
+            item["segmentations"] = {
+                str(idx): segmentation
+                for idx, segmentation in enumerate(item["segmentations"])
+            }
+        if "labelsMap" not in item and isinstance(item["segmentations"], dict):
+            item["labelsMap"] = [
+                (
+                    {"labelName": segmentation, "seriesIndex": int(idx)}
+                    if segmentation
+                    else None
+                )
+                for idx, segmentation in item["segmentations"].items()
+            ]
+        del item["segmentations"]
+    elif "labelsPath" in item:
+        if "labelsMap" not in item:
+            item["labelsMap"] = [
+                {
+                    "labelName": item["labelsPath"],
+                    "seriesIndex": 0,
+                }
+            ]
+        del item["labelsPath"]
+
+    for label_map in item.get("labelsMap", []) or []:
+        if not isinstance(label_map, dict) or not label_map.get("labelName"):
+            continue
+        if not isinstance(label_map["labelName"], list):
+            label_map["labelName"] = [label_map["labelName"]]
+        label_map["labelName"] = [
+            (
+                label_name
+                if os.path.isabs(label_name)
+                or not os.path.exists(os.path.join(task_dir, label_name))
+                else os.path.abspath(os.path.join(task_dir, label_name))
+            )
+            for label_name in label_map["labelName"]
+        ]
+        if len(label_map["labelName"]) == 1:
+            label_map["labelName"] = label_map["labelName"][0]
+
+    for series_info in item.get("seriesInfo", []) or []:
+        for instance_id, mask in (series_info.get("masks", {}) or {}).items():
+            series_info["masks"][instance_id] = (
+                mask
+                if not isinstance(mask, str)
+                or os.path.isabs(mask)
+                or not os.path.exists(os.path.join(task_dir, mask))
+                else os.path.abspath(os.path.join(task_dir, mask))
+            )
+
+    if storage_id != str(StorageMethod.REDBRICK):
+        return True
+
+    for idx, path in enumerate(item["items"]):
+        item_path = path if os.path.isabs(path) else os.path.join(task_dir, path)
+        if os.path.isfile(item_path):
+            item["items"][idx] = item_path
+        else:
+            if path != DUMMY_FILE_PATH:
+                logger.warning(
+                    f"Could not find {path}. "
+                    + "Perhaps you forgot to supply the --storage argument"
+                )
+            return False
+
+    for idx, heat_map in enumerate(item.get("heatMaps") or []):
+        heat_map_path = (
+            heat_map["item"]
+            if os.path.isabs(heat_map["item"])
+            else os.path.join(task_dir, heat_map["item"])
+        )
+        if os.path.isfile(heat_map_path):
+            item["heatMaps"][idx]["item"] = heat_map_path
+        else:
+            logger.warning(
+                f"Could not find {heat_map['item']}. "
+                + "Perhaps you forgot to supply the --storage argument"
+            )
+            return False
+
+    return True
+
+
+async def prepare_json_files_async(
     *,
     context: RBContext,
     org_id: str,
@@ -518,50 +666,32 @@ def prepare_json_files(
     label_validate: bool = False,
     concurrency: int = 50,
 ) -> List[Dict]:
-    """Prepare items from json files for upload."""
-    # pylint: disable=too-many-locals, too-many-branches
-    # pylint: disable=too-many-statements, import-outside-toplevel
+    """Prepare items from json files for upload, processing all files concurrently.
+
+    Label conversion, validation and local path resolution of different files
+    overlap, with conversions sharing a single concurrency limit.
+    """
+    # pylint: disable=too-many-locals
     logger.debug(f"Preparing {len(files_data)} files for upload")
-    points: List[Dict] = []
-    uploading = set()
     logger.info("Validating files")
     if not task_dirs:
         cur_dir = os.getcwd()
         task_dirs = [cur_dir] * len(files_data)
-    for file_data, task_dir in tqdm.tqdm(  # pylint: disable=too-many-nested-blocks
-        zip(files_data, task_dirs), leave=config.log_info
-    ):
-        if not file_data:
-            continue
-        if not isinstance(file_data, list) or any(
-            not isinstance(obj, dict) for obj in file_data
-        ):
-            logger.warning("Invalid items list")
-            continue
 
-        for item in file_data:
-            if (
-                item.get("items")
-                and isinstance(item.get("segmentations"), list)
-                and len(item.get("segmentations", [])) > 1
-            ):
-                logger.warning(
-                    "Items list contains multiple segmentations."
-                    + " Please use new import format: "
-                    + "https://sdk.redbrickai.com/formats/index.html#import"
-                )
-                continue
+    conversion_semaphore = asyncio.Semaphore(max(1, min(concurrency, MAX_CONCURRENCY)))
 
-        if task_segment_map:
-            for item in file_data:
-                item["segmentMap"] = item.get("segmentMap", task_segment_map)  # type: ignore
+    async def convert(coro: Awaitable[List[InputTask]]) -> InputTask:
+        async with conversion_semaphore:
+            return (await coro)[0]
 
+    async def prepare_file(
+        session: aiohttp.ClientSession, file_data: List[InputTask], task_dir: str
+    ) -> List[Dict]:
         if rt_struct:
             if taxonomy:
-                converted = asyncio.run(
-                    gather_with_concurrency(
-                        concurrency,
-                        *[
+                file_data = await asyncio.gather(
+                    *[
+                        convert(
                             convert_rt_struct_to_nii_labels(
                                 context,
                                 org_id,
@@ -572,18 +702,14 @@ def prepare_json_files(
                                 label_validate,
                                 task_dir,
                             )
-                            for fdata in file_data
-                        ],
-                        progress_bar_name="Converting RTSTRUCT files to NIfTI",
-                    )
+                        )
+                        for fdata in file_data
+                    ]
                 )
-                file_data = [items[0] for items in converted]
-
         elif dicom_seg:
-            converted = asyncio.run(
-                gather_with_concurrency(
-                    concurrency,
-                    *[
+            file_data = await asyncio.gather(
+                *[
+                    convert(
                         convert_dicom_seg_to_nii_labels(
                             context,
                             org_id,
@@ -592,18 +718,14 @@ def prepare_json_files(
                             label_storage_id,
                             task_dir,
                         )
-                        for fdata in file_data
-                    ],
-                    progress_bar_name="Converting DICOM Seg files to NIfTI",
-                )
+                    )
+                    for fdata in file_data
+                ]
             )
-            file_data = [items[0] for items in converted]
-
         elif mhd_mask:
-            converted = asyncio.run(
-                gather_with_concurrency(
-                    concurrency,
-                    *[
+            file_data = await asyncio.gather(
+                *[
+                    convert(
                         convert_mhd_to_nii_labels(
                             context,
                             org_id,
@@ -611,128 +733,116 @@ def prepare_json_files(
                             label_storage_id,
                             task_dir,
                         )
-                        for fdata in file_data
-                    ],
-                    progress_bar_name="Converting MHD files to NIfTI",
-                )
+                    )
+                    for fdata in file_data
+                ]
             )
-            file_data = [items[0] for items in converted]
 
-        file_data = asyncio.run(
-            validate_json(context, file_data, storage_id, concurrency)
+        items = await validate_json(
+            context, file_data, storage_id, concurrency, session, conversion_semaphore
         )
+        if not items:
+            return []
+
+        if storage_id == str(StorageMethod.REDBRICK):
+            logger.debug("Looking in your local file system for items")
+
+        def prepare_items() -> List[Dict]:
+            return [
+                item
+                for item in items
+                if _prepare_json_item(item, task_dir, storage_id, uploaded)
+            ]
+
+        return await run_in_thread(prepare_items)
+
+    file_tasks = []
+    for file_data, task_dir in zip(files_data, task_dirs):
         if not file_data:
             continue
+        if not isinstance(file_data, list) or any(
+            not isinstance(obj, dict) for obj in file_data
+        ):
+            logger.warning("Invalid items list")
+            continue
 
-        if storage_id == str(StorageMethod.REDBRICK):
-            logger.info("Looking in your local file system for items")
         for item in file_data:
             if (
-                not isinstance(item.get("items"), list)
-                or not item["items"]
-                or not all(isinstance(i, str) for i in item["items"])
+                item.get("items")
+                and isinstance(item.get("segmentations"), list)
+                and len(item.get("segmentations", [])) > 1  # type: ignore
             ):
-                logger.warning(f"Invalid {item}")
-                continue
+                logger.warning(
+                    "Items list contains multiple segmentations."
+                    + " Please use new import format: "
+                    + "https://sdk.redbrickai.com/formats/index.html#import"
+                )
 
-            if "name" not in item:
-                item["name"] = item["items"][0]
-            if (uploaded and item["name"] in uploaded) or item["name"] in uploading:
-                logger.info(f"Skipping duplicate item name: {item['name']}")
-                continue
+        if task_segment_map:
+            for item in file_data:
+                item["segmentMap"] = item.get("segmentMap", task_segment_map)  # type: ignore
 
-            if "segmentations" in item:
-                if isinstance(item["segmentations"], list):
-                    item["segmentations"] = {
-                        str(idx): segmentation
-                        for idx, segmentation in enumerate(item["segmentations"])
-                    }
-                if "labelsMap" not in item and isinstance(item["segmentations"], dict):
-                    item["labelsMap"] = [
-                        (
-                            {"labelName": segmentation, "seriesIndex": int(idx)}
-                            if segmentation
-                            else None
-                        )
-                        for idx, segmentation in item["segmentations"].items()
-                    ]
-                del item["segmentations"]
-            elif "labelsPath" in item:
-                if "labelsMap" not in item:
-                    item["labelsMap"] = [
-                        {
-                            "labelName": item["labelsPath"],
-                            "seriesIndex": 0,
-                        }
-                    ]
-                del item["labelsPath"]
-
-            for label_map in item.get("labelsMap", []) or []:
-                if not isinstance(label_map, dict) or not label_map.get("labelName"):
-                    continue
-                if not isinstance(label_map["labelName"], list):
-                    label_map["labelName"] = [label_map["labelName"]]
-                label_map["labelName"] = [
-                    (
-                        label_name
-                        if os.path.isabs(label_name)
-                        or not os.path.exists(os.path.join(task_dir, label_name))
-                        else os.path.abspath(os.path.join(task_dir, label_name))
-                    )
-                    for label_name in label_map["labelName"]
-                ]
-                if len(label_map["labelName"]) == 1:
-                    label_map["labelName"] = label_map["labelName"][0]
-
-            for series_info in item.get("seriesInfo", []) or []:
-                for instance_id, mask in (series_info.get("masks", {}) or {}).items():
-                    series_info["masks"][instance_id] = (
-                        mask
-                        if not isinstance(mask, str)
-                        or os.path.isabs(mask)
-                        or not os.path.exists(os.path.join(task_dir, mask))
-                        else os.path.abspath(os.path.join(task_dir, mask))
-                    )
+        file_tasks.append((file_data, task_dir))
 
-            if storage_id != str(StorageMethod.REDBRICK):
-                uploading.add(item["name"])
-                points.append(item)
-                continue
+    async with get_session() as session:
+        prepared = await gather_with_concurrency(
+            MAX_CONCURRENCY,
+            *[
+                prepare_file(session, file_data, task_dir)
+                for file_data, task_dir in file_tasks
+            ],
+            progress_bar_name="Preparing files",
+        )
 
-            for idx, path in enumerate(item["items"]):
-                item_path = (
-                    path if os.path.isabs(path) else os.path.join(task_dir, path)
-                )
-                if os.path.isfile(item_path):
-                    item["items"][idx] = item_path
-                else:
-                    if path != DUMMY_FILE_PATH:
-                        logger.warning(
-                            f"Could not find {path}. "
-                            + "Perhaps you forgot to supply the --storage argument"
-                        )
-                    break
+    points: List[Dict] = []
+    uploading = set()
+    for items in prepared:
+        for point in items:
+            if point["name"] in uploading:
+                logger.info(f"Skipping duplicate item name: {point['name']}")
+                continue
+            uploading.add(point["name"])
+            points.append(point)
 
-            for idx, heat_map in enumerate(item.get("heatMaps") or []):
-                heat_map_path = (
-                    heat_map["item"]
-                    if os.path.isabs(heat_map["item"])
-                    else os.path.join(task_dir, heat_map["item"])
-                )
-                if os.path.isfile(heat_map_path):
-                    item["heatMaps"][idx]["item"] = heat_map_path
-                else:
-                    logger.warning(
-                        f"Could not find {heat_map['item']}. "
-                        + "Perhaps you forgot to supply the --storage argument"
-                    )
-                    break
+    return points
 
-            else:
-                uploading.add(item["name"])
-                points.append(item)
 
-    return points
+def prepare_json_files(
+    *,
+    context: RBContext,
+    org_id: str,
+    taxonomy: Optional[Taxonomy],
+    files_data: List[List[InputTask]],
+    storage_id: str,
+    label_storage_id: str,
+    task_segment_map: Optional[Dict] = None,
+    task_dirs: Optional[List[str]] = None,
+    uploaded: Optional[Set[str]] = None,
+    rt_struct: bool = False,
+    dicom_seg: bool = False,
+    mhd_mask: bool = False,
+    label_validate: bool = False,
+    concurrency: int = 50,
+) -> List[Dict]:
+    """Prepare items from json files for upload."""
+    return run_sync(
+        prepare_json_files_async(
+            context=context,
+            org_id=org_id,
+            taxonomy=taxonomy,
+            files_data=files_data,
+            storage_id=storage_id,
+            label_storage_id=label_storage_id,
+            task_segment_map=task_segment_map,
+            task_dirs=task_dirs,
+            uploaded=uploaded,
+            rt_struct=rt_struct,
+            dicom_seg=dicom_seg,
+            mhd_mask=mhd_mask,
+            label_validate=label_validate,
+            concurrency=concurrency,
+        )
+    )
 
 
 def upload_datapoints(
@@ -753,6 +863,7 @@ def upload_datapoints(
     label_validate: bool = False,
     prune_segmentations: bool = False,
     concurrency: int = 50,
+    dedup_uploads: bool = False,
 ) -> List[Dict]:
     """Prepare items from json files for upload."""
     # pylint: disable=too-many-locals
@@ -770,7 +881,7 @@ def upload_datapoints(
         label_validate=label_validate,
         concurrency=concurrency,
     )
-    return asyncio.run(
+    return run_sync(
         create_tasks(
             context=context,
             org_id=org_id,
@@ -784,6 +895,7 @@ def upload_datapoints(
             label_validate=label_validate,
             prune_segmentations=prune_segmentations,
             concurrency=concurrency,
+            dedup_uploads=dedup_uploads,
         )
     )
 
@@ -793,48 +905,79 @@ async def validate_json(
     input_data: List[InputTask],
     storage_id: str,
     concurrency: int,
+    aiosession: Optional[aiohttp.ClientSession] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
 ) -> List[Dict]:
-    """Validate and convert to import format."""
-    # pylint: disable=too-many-locals
+    """Validate and convert to import format.
+
+    Tasks already in the import format are accepted locally, and only the rest
+    are sent to the server. Tasks in a rejected batch are validated one by one,
+    so that only the invalid tasks are dropped. With ``semaphore``, validation
+    requests share the concurrency limit of the caller.
+    """
     total_input_data = len(input_data)
     logger.debug(f"Concurrency: {concurrency} for {total_input_data} items")
-    inputs: List[List[InputTask]] = []
-    for batch in range(0, total_input_data, concurrency):
-        inputs.append(input_data[batch : batch + concurrency])
 
-    async with get_session() as session:
-        coros = []
-        for data in inputs:
-            # temp handler for missing properties
-            temp_data = deepcopy(data)
-            for task in temp_data:
-                if "status" in task:
-                    del task["status"]  # type: ignore
-
-            coros.append(
-                context.upload.validate_and_convert_to_import_format(
-                    session, temp_data, True, storage_id
-                )
+    outputs: Dict[int, List[Dict]] = {}
+    pending: List[int] = []
+    for idx, task in enumerate(input_data):
+        if is_import_format(task):  # type: ignore
+            outputs[idx] = [task]  # type: ignore
+        else:
+            pending.append(idx)
+
+    logger.debug(f"{len(pending)} of {total_input_data} items need conversion")
+    if not pending:
+        return [output for idx in sorted(outputs) for output in outputs[idx]]
+
+    if aiosession is None:
+        async with get_session() as session:
+            return await validate_json(
+                context, input_data, storage_id, concurrency, session, semaphore
             )
-        outputs = await gather_with_concurrency(MAX_CONCURRENCY, *coros)
 
-    output_data: List[Dict] = []
-    for idx, (inp, out) in enumerate(zip(inputs, outputs)):
-        if not out.get("isValid"):
-            start = idx * concurrency
-            logger.debug(f"Error for batch: {idx}")
+    async def validate_batch(indices: List[int]) -> None:
+        # temp handler for missing properties
+        data = [
+            {key: val for key, val in input_data[idx].items() if key != "status"}
+            for idx in indices
+        ]
+        if semaphore is None:
+            out = await context.upload.validate_and_convert_to_import_format(
+                aiosession, data, True, storage_id  # type: ignore
+            )
+        else:
+            async with semaphore:
+                out = await context.upload.validate_and_convert_to_import_format(
+                    aiosession, data, True, storage_id  # type: ignore
+                )
+        if out.get("isValid"):
+            converted = json.loads(out["converted"]) if out.get("converted") else data
+            if len(converted) == len(indices):
+                outputs.update((idx, [task]) for idx, task in zip(indices, converted))
+            else:
+                outputs[indices[0]] = converted
+        elif len(indices) > 1:
+            logger.debug(f"Error for batch of {len(indices)} items, validating each")
+            await gather_with_concurrency(
+                MAX_CONCURRENCY, *[validate_batch([idx]) for idx in indices]
+            )
+        else:
             logger.warning(
-                f"Batch: {start}-{start + len(inp)} of {total_input_data}\n"
+                f"Task: {input_data[indices[0]].get('name')}\n"
                 + out.get(
                     "error",
                     "Error: Invalid format\nDocs: "
                     + "https://sdk.redbrickai.com/formats/index.html#import",
                 )
             )
-            return []
 
-        output_data.extend(
-            json.loads(out["converted"]) if out.get("converted") else inp  # type: ignore
-        )
+    await gather_with_concurrency(
+        MAX_CONCURRENCY,
+        *[
+            validate_batch(pending[batch : batch + concurrency])
+            for batch in range(0, len(pending), concurrency)
+        ],
+    )
 
-    return output_data
+    return [output for idx in sorted(outputs) for output in outputs[idx]]
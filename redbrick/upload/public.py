@@ -1,13 +1,13 @@
 """Public interface to upload module."""
 
-import asyncio
 import os
 import sys
 from copy import deepcopy
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
 import json
 
 import aiohttp
+from natsort import natsorted, ns
 
 from redbrick.common.entities import RBProject
 from redbrick.common.constants import DUMMY_FILE_PATH, MAX_CONCURRENCY
@@ -27,9 +27,15 @@ from redbrick.utils.upload import (
     convert_dicom_seg_to_nii_labels,
     process_segmentation_upload,
 )
-from redbrick.utils.async_utils import gather_with_concurrency, get_session
+from redbrick.utils.async_utils import (
+    gather_with_concurrency,
+    get_session,
+    run_in_thread,
+    run_sync,
+)
+from redbrick.utils.dicom import group_dicom_series
 from redbrick.utils.logging import log_error, logger
-from redbrick.utils.files import get_file_type, is_dicom_file
+from redbrick.utils.files import check_dicom_files, get_file_type
 from redbrick.types.task import InputTask, OutputTask, CommentPin
 
 
@@ -62,6 +68,7 @@ class UploadImpl(Upload):
         label_validate: bool = False,
         prune_segmentations: bool = False,
         concurrency: int = 50,
+        dedup_uploads: bool = False,
     ) -> List[Dict]:
         """
         Create datapoints in project.
@@ -130,6 +137,11 @@ class UploadImpl(Upload):
 
         concurrency: int = 50
 
+        dedup_uploads: bool = False
+            When doing direct upload, skip uploading files whose content was already
+            uploaded to this organization, and reference the existing files instead.
+            Uses a local index of file content hashes.
+
         Returns
         -------------
         List[Dict]
@@ -161,6 +173,7 @@ class UploadImpl(Upload):
             label_validate=label_validate,
             prune_segmentations=prune_segmentations,
             concurrency=concurrency,
+            dedup_uploads=dedup_uploads,
         )
 
     async def _delete_tasks(self, task_ids: List[str], concurrency: int) -> bool:
@@ -201,7 +214,7 @@ class UploadImpl(Upload):
             True if successful, else False.
         """
         concurrency = min(concurrency, 50)
-        return asyncio.run(self._delete_tasks(task_ids, concurrency))
+        return run_sync(self._delete_tasks(task_ids, concurrency))
 
     async def _delete_tasks_by_name(
         self, task_names: List[str], concurrency: int
@@ -245,18 +258,40 @@ class UploadImpl(Upload):
             True if successful, else False.
         """
         concurrency = min(concurrency, 50)
-        return asyncio.run(self._delete_tasks_by_name(task_names, concurrency))
+        return run_sync(self._delete_tasks_by_name(task_names, concurrency))
 
     async def generate_items_list(
         self,
-        items_list: List[List[str]],
+        items_list: Iterable[List[str]],
         import_file_type: str,
         as_study: bool,
         concurrency: int = 50,
+        local_grouping: bool = False,
     ) -> List[Dict]:
-        """Generate items list from local files."""
+        """Generate items list from local files.
+
+        ``items_list`` may be a generator, such as ``scan_files``, which is drained
+        in a worker thread before grouping. Items are ordered by directory, and
+        naturally sorted within each directory.
+
+        With ``local_grouping``, DICOM 3D files are grouped into series from their
+        headers locally, and only the remaining files are grouped on the server.
+        """
         # pylint: disable=too-many-locals, too-many-branches
-        logger.debug(f"Concurrency: {concurrency} for {len(items_list)} items")
+        logger.debug(f"Concurrency: {concurrency}")
+        items_list = await run_in_thread(list, items_list)
+        local_items: List[Dict] = []
+        if local_grouping and import_file_type == ImportTypes.DICOM3D:
+            local_items, remaining = await run_in_thread(
+                group_dicom_series,
+                [item for items in items_list for item in items],
+                as_study,
+            )
+            logger.debug(f"Grouped {len(local_items)} items locally")
+            if not remaining:
+                return local_items
+            items_list = [[item] for item in remaining]
+
         grouped_items_list: Dict[str, List[str]] = {}
         for items in items_list:
             if not items:
@@ -271,19 +306,28 @@ class UploadImpl(Upload):
 
         logger.debug(f"Grouped items list: {len(grouped_items_list)}")
 
-        items_list = list(grouped_items_list.values())
-        total_groups = len(items_list)
+        groups = [
+            list(natsorted(grouped_items_list[items_dir], alg=ns.IGNORECASE))
+            for items_dir in sorted(grouped_items_list)
+        ]
+        total_groups = len(groups)
         items_map: Dict[str, str] = {}
 
         if import_file_type == ImportTypes.DICOM3D:
-            for items in items_list:
+            candidates: List[Tuple[List[str], int]] = []
+            for items in groups:
                 for idx, item in enumerate(items):
                     file_ext, file_type = get_file_type(item)
-                    if (
-                        not file_ext or file_type != "application/dicom"
-                    ) and is_dicom_file(item):
-                        items[idx] = item + ".dcm"
-                        items_map[items[idx]] = item
+                    if not file_ext or file_type != "application/dicom":
+                        candidates.append((items, idx))
+
+            dicom_flags = await run_in_thread(
+                check_dicom_files, [items[idx] for items, idx in candidates]
+            )
+            for (items, idx), is_dicom in zip(candidates, dicom_flags):
+                if is_dicom:
+                    items_map[items[idx] + ".dcm"] = items[idx]
+                    items[idx] += ".dcm"
 
         is_win = sys.platform.startswith("win")
         async with get_session() as session:
@@ -292,7 +336,7 @@ class UploadImpl(Upload):
                     session,
                     [
                         item
-                        for items in items_list[batch : batch + concurrency]
+                        for items in groups[batch : batch + concurrency]
                         for item in items
                     ],
                     import_file_type,
@@ -303,7 +347,7 @@ class UploadImpl(Upload):
             ]
             outputs = await gather_with_concurrency(MAX_CONCURRENCY, *coros)
 
-        output_data: List[Dict] = []
+        output_data: List[Dict] = local_items
         for output in outputs:
             output_data.extend(json.loads(output))
 
@@ -395,7 +439,7 @@ class UploadImpl(Upload):
             for info in converted_point.get("seriesInfo", []) or []:
                 info.pop("itemsIndices", None)
 
-        return asyncio.run(
+        return run_sync(
             create_tasks(
                 context=self.context,
                 org_id=self.project.org_id,
@@ -485,7 +529,7 @@ class UploadImpl(Upload):
             We recommend keeping this less than or equal to 50.
         """
         concurrency = min(concurrency, 50)
-        errors = asyncio.run(self._update_tasks_priorities(tasks, concurrency))
+        errors = run_sync(self._update_tasks_priorities(tasks, concurrency))
 
         if errors:
             log_error(errors[0])
@@ -657,7 +701,7 @@ class UploadImpl(Upload):
 
         converted_tasks = tasks
         if rt_struct:
-            converted = asyncio.run(
+            converted = run_sync(
                 gather_with_concurrency(
                     concurrency,
                     *[
@@ -677,7 +721,7 @@ class UploadImpl(Upload):
             converted_tasks = [task[0] for task in converted]
 
         elif dicom_seg:
-            converted = asyncio.run(
+            converted = run_sync(
                 gather_with_concurrency(
                     concurrency,
                     *[
@@ -695,7 +739,7 @@ class UploadImpl(Upload):
             converted_tasks = [task[0] for task in converted]
 
         elif mhd:
-            converted = asyncio.run(
+            converted = run_sync(
                 gather_with_concurrency(
                     concurrency,
                     *[
@@ -735,7 +779,7 @@ class UploadImpl(Upload):
         if not points:
             return
 
-        validated = asyncio.run(
+        validated = run_sync(
             validate_json(
                 self.context,
                 points,  # type: ignore
@@ -745,7 +789,7 @@ class UploadImpl(Upload):
         )
 
         points_converted = validated if validated else []
-        asyncio.run(
+        run_sync(
             self._update_tasks_labels(
                 points_converted,
                 label_storage_id or project_label_storage_id,
@@ -806,7 +850,7 @@ class UploadImpl(Upload):
         if stage_name not in stage_names:
             raise ValueError(f"Stage {stage_name} not found in project")
 
-        errors = asyncio.run(
+        errors = run_sync(
             self._send_to_stage(task_ids, stage_name, min(concurrency, 50))
         )
         if errors:
@@ -1,12 +1,15 @@
 """AltaDB utils."""
 
 import os
+import shutil
+import struct
+import asyncio
 from typing import Any, Dict, List, Optional
 
+import aiofiles  # type: ignore
 import aiohttp
 import pydicom
 import pydicom.dataset
-import pydicom.encaps
 import pydicom.tag
 import pydicom.uid
 from pydicom.uid import (
@@ -16,10 +19,43 @@ from pydicom.uid import (
 )
 
 from redbrick.common.constants import DEFAULT_URL, MAX_CONCURRENCY, MAX_FILE_BATCH_SIZE
-from redbrick.utils.async_utils import gather_with_concurrency
+from redbrick.utils.async_utils import (
+    gather_with_concurrency,
+    get_session,
+    run_in_thread,
+)
 from redbrick.utils.logging import logger
 
 
+HTJ2KLosslessRPCL = pydicom.uid.UID(  # pylint: disable=invalid-name
+    "1.2.840.10008.1.2.4.202"
+)
+
+PIXEL_DATA_TAG = pydicom.tag.Tag(0x7FE0, 0x0010)
+ITEM_TAG = b"\xfe\xff\x00\xe0"
+SEQUENCE_DELIMITER_TAG = b"\xfe\xff\xdd\xe0"
+FRAME_CHUNK_SIZE = 1024 * 1024
+
+
+def register_transfer_syntaxes() -> None:
+    """Register transfer syntaxes unknown to pydicom."""
+    if HTJ2KLosslessRPCL in AllTransferSyntaxes:
+        return
+
+    AllTransferSyntaxes.append(HTJ2KLosslessRPCL)
+    JPEG2000TransferSyntaxes.append(HTJ2KLosslessRPCL)
+    UID_dictionary[HTJ2KLosslessRPCL] = (
+        "High-Throughput JPEG 2000 with RPCL Options Image Compression (Lossless Only)",
+        "Transfer Syntax",
+        "",
+        "",
+        "HTJ2KLosslessRPCL",
+    )
+
+
+register_transfer_syntaxes()
+
+
 def move_group2_to_file_meta(dataset: Any) -> Any:
     """Move all group 2 elements to file meta.
 
@@ -39,15 +75,61 @@ def move_group2_to_file_meta(dataset: Any) -> Any:
     return dataset
 
 
+def write_encapsulated_dataset(
+    dataset: Any, frame_files: List[str], destination_file: str
+) -> None:
+    """Write a DICOM dataset, streaming encapsulated pixel data from frame files.
+
+    Args
+    ------------
+    dataset: pydicom.Dataset
+        Dataset (with file meta) without pixel data.
+    frame_files: List[str]
+        Files containing the encoded image frames, in order.
+    destination_file: str
+        Destination file to save the DICOM dataset.
+    """
+    for tag in [tag for tag in dataset.keys() if tag >= PIXEL_DATA_TAG]:
+        del dataset[tag]
+
+    frame_sizes = [os.path.getsize(frame_file) for frame_file in frame_files]
+    padded_sizes = [size + size % 2 for size in frame_sizes]
+    offsets = [0]
+    for padded_size in padded_sizes[:-1]:
+        offsets.append(offsets[-1] + 8 + padded_size)
+
+    temp_file = f"{destination_file}.tmp"
+    dataset.save_as(temp_file, write_like_original=False)
+    with open(temp_file, "ab") as file_:
+        # (7FE0,0010) OB, undefined length
+        file_.write(b"\xe0\x7f\x10\x00OB\x00\x00\xff\xff\xff\xff")
+        file_.write(ITEM_TAG + struct.pack("<I", 4 * len(offsets)))
+        file_.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        for frame_file, frame_size, padded_size in zip(
+            frame_files, frame_sizes, padded_sizes
+        ):
+            file_.write(ITEM_TAG + struct.pack("<I", padded_size))
+            with open(frame_file, "rb") as frame:
+                shutil.copyfileobj(frame, file_, FRAME_CHUNK_SIZE)
+            if padded_size != frame_size:
+                file_.write(b"\x00")
+        file_.write(SEQUENCE_DELIMITER_TAG + b"\x00\x00\x00\x00")
+    os.replace(temp_file, destination_file)
+
+
 async def save_dicom_dataset(
     instance_metadata: Dict,
     instance_frames_metadata: List[Dict],
     presigned_image_urls: List[str],
     destination_file: str,
     aiosession: aiohttp.ClientSession,
+    frame_semaphore: Optional[asyncio.Semaphore] = None,
 ) -> None:
     """Create and save a DICOM dataset using metadata and image frame URLs.
 
+    Frames are streamed to disk and encapsulated into the destination file
+    incrementally, so memory use does not grow with the instance size.
+
     Args
     ------------
     instance_metadata: Dict
@@ -60,48 +142,53 @@ async def save_dicom_dataset(
         Destination file to save the DICOM dataset.
     aiosession: aiohttp.ClientSession
         aiohttp ClientSession to be used for the HTTP requests.
+    frame_semaphore: Optional[asyncio.Semaphore]
+        Semaphore limiting concurrent frame downloads across instances.
     """
-    HTJ2KLosslessRPCL = pydicom.uid.UID(  # pylint: disable=invalid-name
-        "1.2.840.10008.1.2.4.202"
-    )
-    AllTransferSyntaxes.append(HTJ2KLosslessRPCL)
-    JPEG2000TransferSyntaxes.append(HTJ2KLosslessRPCL)
-    UID_dictionary[HTJ2KLosslessRPCL] = (
-        "High-Throughput JPEG 2000 with RPCL Options Image Compression (Lossless Only)",
-        "Transfer Syntax",
-        "",
-        "",
-        "HTJ2KLosslessRPCL",
-    )
+    if frame_semaphore is None:
+        frame_semaphore = asyncio.Semaphore(MAX_FILE_BATCH_SIZE)
 
-    async def get_image_content(
-        aiosession: aiohttp.ClientSession, image_url: str
-    ) -> bytes:
-        """Get image content."""
-        async with aiosession.get(image_url) as response:
-            return await response.content.read()
-
-    frame_contents = await gather_with_concurrency(
-        MAX_FILE_BATCH_SIZE,
-        *[
-            get_image_content(aiosession, image_url=image_frame_url)
-            for image_frame_url in presigned_image_urls
-        ],
-    )
+    async def get_image_content(image_url: str, frame_file: str) -> None:
+        """Stream image content to file."""
+        async with frame_semaphore:  # type: ignore
+            async with aiosession.get(image_url) as response:
+                response.raise_for_status()
+                async with aiofiles.open(frame_file, "wb") as file_:
+                    async for chunk in response.content.iter_chunked(FRAME_CHUNK_SIZE):
+                        await file_.write(chunk)
 
-    ds_file = pydicom.Dataset.from_json(instance_metadata)
-    ds_file.TransferSyntaxUID = pydicom.uid.UID(
-        instance_frames_metadata[0]["metaData"]["00020010"]["Value"][0]
-    )
+    frame_files = [
+        f"{destination_file}.{idx}.frame" for idx in range(len(presigned_image_urls))
+    ]
+    try:
+        await asyncio.gather(
+            *[
+                get_image_content(image_frame_url, frame_file)
+                for image_frame_url, frame_file in zip(
+                    presigned_image_urls, frame_files
+                )
+            ]
+        )
+
+        ds_file = pydicom.Dataset.from_json(instance_metadata)
+        ds_file.TransferSyntaxUID = pydicom.uid.UID(
+            instance_frames_metadata[0]["metaData"]["00020010"]["Value"][0]
+        )
+
+        move_group2_to_file_meta(ds_file)
 
-    move_group2_to_file_meta(ds_file)
+        if ds_file.file_meta.TransferSyntaxUID == HTJ2KLosslessRPCL:
+            ds_file.is_little_endian = True
+            ds_file.is_implicit_VR = False
 
-    ds_file.PixelData = pydicom.encaps.encapsulate(frame_contents)
+        await run_in_thread(
+            write_encapsulated_dataset, ds_file, frame_files, destination_file
+        )
+    finally:
+        for frame_file in frame_files:
+            if os.path.isfile(frame_file):
+                os.remove(frame_file)
 
-    if ds_file.file_meta.TransferSyntaxUID == HTJ2KLosslessRPCL:
-        ds_file.is_little_endian = True
-        ds_file.is_implicit_VR = False
-    ds_file.save_as(destination_file, write_like_original=False)
     logger.debug(f"Saved DICOM dataset to {destination_file}")
 
 
@@ -110,6 +197,8 @@ async def save_dicom_series(
     series_dir: str,
     base_url: str = DEFAULT_URL,
     headers: Optional[Dict[str, str]] = None,
+    aiosession: Optional[aiohttp.ClientSession] = None,
+    frame_semaphore: Optional[asyncio.Semaphore] = None,
 ) -> List[str]:
     """Save DICOM files using AltaDB URLs.
     Given an AltaDB URL containing the metadata and image frames.
@@ -129,6 +218,10 @@ async def save_dicom_series(
     headers: Optional[Dict[str, str]]
         Headers to be used for the HTTP requests.
         If the altaDB_meta_content_url is unsigned, the headers should contain the authorization token.
+    aiosession: Optional[aiohttp.ClientSession]
+        Shared session to reuse pooled connections across series.
+    frame_semaphore: Optional[asyncio.Semaphore]
+        Semaphore limiting concurrent frame downloads across series.
 
     Returns
     ------------
@@ -146,43 +239,55 @@ async def save_dicom_series(
             "altadb://", "https://"
         )
 
-    async with aiohttp.ClientSession() as aiosession:
-        async with aiosession.get(altadb_meta_content_url, headers=headers) as response:
-            res_json = await response.json()
-            frameid_url_map: Dict[str, str] = {
-                frame["id"]: frame["path"] for frame in res_json.get("imageFrames", [])
-            }
-
-            tasks = []
-            metadata_url = res_json["metaData"]
-            instances: List[Dict[str, Any]] = []
-            async with aiosession.get(metadata_url) as response:
-                response.raise_for_status()
-                instances = (await response.json())["instances"]
-            for instance in instances:
-                frame_ids = [frame["id"] for frame in instance["frames"]]
-                image_frames_urls = [
-                    frameid_url_map[frame_id] for frame_id in frame_ids
-                ]
-                file_from_dataset_root = os.path.join(
-                    series_dir, f"{instance['frames'][0]['id']}.dcm"
-                )
-                tasks.append(
-                    save_dicom_dataset(
-                        instance["metaData"],
-                        instance["frames"],
-                        image_frames_urls,
-                        file_from_dataset_root,
-                        aiosession,
-                    )
-                )
-                res.append(file_from_dataset_root)
+    if aiosession is None:
+        async with get_session(api=False) as session:
+            return await save_dicom_series(
+                altadb_meta_content_url,
+                series_dir,
+                base_url,
+                headers,
+                session,
+                frame_semaphore,
+            )
+
+    if frame_semaphore is None:
+        frame_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
 
-            await gather_with_concurrency(
-                MAX_CONCURRENCY,
-                *tasks,
-                progress_bar_name=f"Saving series {series_dir.split('/')[-1]}",
-                keep_progress_bar=False,
+    async with aiosession.get(altadb_meta_content_url, headers=headers) as response:
+        res_json = await response.json()
+    frameid_url_map: Dict[str, str] = {
+        frame["id"]: frame["path"] for frame in res_json.get("imageFrames", [])
+    }
+
+    tasks = []
+    metadata_url = res_json["metaData"]
+    instances: List[Dict[str, Any]] = []
+    async with aiosession.get(metadata_url) as response:
+        response.raise_for_status()
+        instances = (await response.json())["instances"]
+    for instance in instances:
+        frame_ids = [frame["id"] for frame in instance["frames"]]
+        image_frames_urls = [frameid_url_map[frame_id] for frame_id in frame_ids]
+        file_from_dataset_root = os.path.join(
+            series_dir, f"{instance['frames'][0]['id']}.dcm"
+        )
+        tasks.append(
+            save_dicom_dataset(
+                instance["metaData"],
+                instance["frames"],
+                image_frames_urls,
+                file_from_dataset_root,
+                aiosession,
+                frame_semaphore,
             )
+        )
+        res.append(file_from_dataset_root)
+
+    await gather_with_concurrency(
+        MAX_CONCURRENCY,
+        *tasks,
+        progress_bar_name=f"Saving series {series_dir.split('/')[-1]}",
+        keep_progress_bar=False,
+    )
 
     return res
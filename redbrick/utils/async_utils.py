@@ -1,12 +1,20 @@
 """Async utils."""
 
+import os
+import atexit
 import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import partial
 from typing import (
     Any,
     AsyncGenerator,
     Awaitable,
+    Callable,
     Coroutine,
+    Dict,
     List,
     Tuple,
     TypeVar,
@@ -15,11 +23,22 @@ from typing import (
 import aiohttp
 import tqdm.asyncio  # type: ignore
 
-from redbrick.common.constants import MAX_CONCURRENCY, REQUEST_TIMEOUT
+from redbrick.common.constants import (
+    MAX_CONCURRENCY,
+    MAX_PROCESS_WORKERS,
+    REQUEST_TIMEOUT,
+)
 from redbrick.config import config
 
 ReturnType = TypeVar("ReturnType")  # pylint: disable=invalid-name
 
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_pid: Optional[int] = None
+_loop_lock = threading.Lock()
+_sessions: Dict[Tuple[bool, bool], aiohttp.ClientSession] = {}
+
 
 async def return_value(value: ReturnType) -> ReturnType:
     """Return the same parameter value."""
@@ -97,13 +116,144 @@ async def gather_with_concurrency(
     return [res[1] for res in sorted(result, key=lambda x: x[0])]
 
 
-@asynccontextmanager
-async def get_session(api: bool = True) -> AsyncGenerator[aiohttp.ClientSession, None]:
-    """Get async client session."""
-    async with aiohttp.ClientSession(
+async def gather_or_cancel(*coros: Awaitable[Any]) -> List[Any]:
+    """Run coroutines concurrently, cancelling the others if any of them fails."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _new_session(api: bool) -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
         connector=aiohttp.TCPConnector(verify_ssl=config.verify_ssl),
         timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT if api else None),
         trust_env=True,
-    ) as session:
+    )
+
+
+@asynccontextmanager
+async def get_session(api: bool = True) -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """Get async client session.
+
+    Sessions are kept open and reused across calls on the background event loop of
+    :func:`run_sync`, and are closed on exit otherwise.
+    """
+    if _loop is not None and asyncio.get_running_loop() is _loop:
+        key = (api, config.verify_ssl)
+        session = _sessions.get(key)
+        if session is None or session.closed:
+            session = _sessions[key] = _new_session(api)
+        yield session
+        return
+
+    async with _new_session(api) as session:
         yield session
         await asyncio.sleep(0.250)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop, starting it if required."""
+    global _loop, _loop_pid  # pylint: disable=global-statement
+    with _loop_lock:
+        if _loop is None or _loop_pid != os.getpid() or _loop.is_closed():
+            _sessions.clear()
+            _loop = asyncio.new_event_loop()
+            _loop_pid = os.getpid()
+            threading.Thread(
+                target=_loop.run_forever, name="redbrick-event-loop", daemon=True
+            ).start()
+        return _loop
+
+
+async def _close_sessions() -> None:
+    sessions = list(_sessions.values())
+    _sessions.clear()
+    for session in sessions:
+        await session.close()
+    if sessions:
+        await asyncio.sleep(0.250)
+
+
+@atexit.register
+def _stop_loop() -> None:
+    """Close shared sessions and stop the background event loop."""
+    if _loop is None or _loop_pid != os.getpid() or not _loop.is_running():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_close_sessions(), _loop).result(5)
+    except Exception:  # pylint: disable=broad-except
+        pass
+    _loop.call_soon_threadsafe(_loop.stop)
+
+
+def run_sync(coro: Coroutine[Any, Any, ReturnType]) -> ReturnType:
+    """Run a coroutine to completion from sync code.
+
+    Coroutines run on a shared background event loop, so that sync methods do not
+    set up a new event loop and new client sessions on every call.
+
+    Calls from many threads share that loop: their I/O runs concurrently, but any
+    blocking or CPU bound step in a coroutine stalls the calls of all threads, so
+    such steps must go through ``run_in_thread`` or ``run_in_process``.
+    Calling ``run_sync`` from a coroutine on the shared loop runs the coroutine on
+    a separate loop, and blocks the shared loop until it completes; coroutines
+    should ``await`` other coroutines instead.
+    """
+    loop = _get_loop()
+    try:
+        running_loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+
+    if running_loop is loop:
+        # Called from within the background loop, which cannot block on itself
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool for CPU bound work, used if ``config.process_pool``.
+
+    Workers are started with ``forkserver`` (or ``spawn`` where unavailable) rather
+    than forked from a process running the background event loop thread.
+    Like on Windows/macOS, workers import the ``__main__`` module of the calling
+    script, so scripts must guard their entry point with
+    ``if __name__ == "__main__":``.
+    """
+    global _process_pool  # pylint: disable=global-statement
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=max(1, min(MAX_PROCESS_WORKERS, os.cpu_count() or 1)),
+            mp_context=multiprocessing.get_context(
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            ),
+        )
+    return _process_pool
+
+
+async def run_in_process(func: Callable[..., ReturnType], *args: Any) -> ReturnType:
+    """Run a picklable function in the shared process pool, or a thread by default."""
+    if not config.process_pool:
+        return await run_in_thread(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(
+        get_process_pool(), partial(func, *args)
+    )
+
+
+async def run_in_thread(func: Callable[..., ReturnType], *args: Any) -> ReturnType:
+    """Run a blocking function in the default thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args))
@@ -0,0 +1,146 @@
+"""Local cache of downloaded files."""
+
+import os
+import shutil
+import hashlib
+import threading
+from typing import Optional
+from uuid import uuid4
+
+from redbrick.config import config
+from redbrick.utils.common_utils import config_path
+from redbrick.utils.logging import logger
+
+
+MAX_ETAG_LENGTH = 100
+
+
+class BlobCache:
+    """Persistent, size bounded cache of downloaded files, keyed by remote location.
+
+    Each entry is stored along with the ETag of the remote file, so it is only
+    served while the remote file is unchanged. Files are materialized from the
+    cache as copies, so they can be modified without affecting the cache.
+    Least recently used entries are evicted once the cache exceeds ``max_size``.
+    """
+
+    def __init__(self, max_size: int, cache_dir: Optional[str] = None) -> None:
+        """Construct BlobCache."""
+        self.max_size = max_size
+        self.cache_dir = cache_dir or os.path.join(config_path(), "cache", "blobs")
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _entry_dir(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest)
+
+    def _entry(self, key: str, etag: str) -> str:
+        return os.path.join(self._entry_dir(key), etag.encode().hex())
+
+    @staticmethod
+    def _copy(source: str, destination: str) -> None:
+        tmp_path = f"{destination}.{uuid4().hex}.tmp"
+        try:
+            shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, destination)
+        finally:
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+
+    def etag(self, key: str) -> Optional[str]:
+        """Get the ETag of the cached file of a key, if present."""
+        try:
+            names = os.listdir(self._entry_dir(key))
+        except OSError:
+            return None
+        for name in names:
+            if "." not in name:
+                try:
+                    return bytes.fromhex(name).decode()
+                except ValueError:
+                    continue
+        return None
+
+    def get(self, key: str, etag: str, path: str) -> bool:
+        """Copy the cached file of a key and ETag to path, if present."""
+        entry = self._entry(key, etag)
+        try:
+            os.utime(entry)
+            self._copy(entry, path)
+        except OSError:
+            return False
+        logger.debug(f"Using cached file for {key}")
+        return True
+
+    def put(self, key: str, etag: str, path: str) -> None:
+        """Add a downloaded file to the cache, replacing other versions of it."""
+        if not etag or len(etag) > MAX_ETAG_LENGTH:
+            return
+        entry_dir = self._entry_dir(key)
+        entry = self._entry(key, etag)
+        try:
+            os.makedirs(entry_dir, exist_ok=True)
+            self._copy(path, entry)
+            size = os.path.getsize(entry)
+            for name in os.listdir(entry_dir):
+                stale = os.path.join(entry_dir, name)
+                if "." not in name and stale != entry:
+                    size -= os.path.getsize(stale)
+                    os.remove(stale)
+        except OSError as error:
+            logger.debug(f"Failed to cache {key}: {error}")
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _scan_size(self) -> int:
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for file_ in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, file_))
+                except OSError:
+                    pass
+        return total
+
+    def _evict(self) -> None:
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for file_ in files:
+                file_path = os.path.join(root, file_)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, file_path))
+
+        entries.sort()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, file_path in entries:
+            if self._size <= self.max_size:
+                break
+            try:
+                os.remove(file_path)
+            except OSError:
+                continue
+            self._size -= size
+
+
+_blob_cache: Optional[BlobCache] = None
+
+
+def get_blob_cache() -> Optional[BlobCache]:
+    """Get the shared blob cache, if enabled by ``config.blob_cache_size``."""
+    global _blob_cache  # pylint: disable=global-statement
+    if config.blob_cache_size <= 0:
+        return None
+    if _blob_cache is None or _blob_cache.max_size != config.blob_cache_size:
+        _blob_cache = BlobCache(config.blob_cache_size)
+    return _blob_cache
@@ -0,0 +1,155 @@
+"""Local DICOM series grouping utils."""
+
+import os
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from natsort import natsort_keygen, ns
+
+from redbrick.config import config
+from redbrick.utils.async_utils import get_process_pool
+
+
+HEADER_TAGS = [
+    "StudyInstanceUID",
+    "SeriesInstanceUID",
+    "SeriesNumber",
+    "InstanceNumber",
+    "ImagePositionPatient",
+    "ImageOrientationPatient",
+]
+
+HEADER_CHUNK_SIZE = 64
+
+
+def _as_int(value: Optional[object]) -> Optional[int]:
+    """Convert a DICOM value to int, if possible."""
+    try:
+        return int(value)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+
+
+def read_dicom_header(path: str) -> Optional[Dict]:
+    """Read the grouping tags of a DICOM file, or None if it is not a DICOM file."""
+    # pylint: disable=import-outside-toplevel
+    from pydicom import dcmread
+    from pydicom.errors import InvalidDicomError
+
+    try:
+        dataset = dcmread(path, stop_before_pixels=True, specific_tags=HEADER_TAGS)
+    except (InvalidDicomError, OSError, ValueError, EOFError, KeyError):
+        return None
+
+    if not dataset.get("SeriesInstanceUID"):
+        return None
+
+    position: Optional[float] = None
+    try:
+        orientation = [float(val) for val in dataset.ImageOrientationPatient]
+        origin = [float(val) for val in dataset.ImagePositionPatient]
+        normal = [
+            orientation[1] * orientation[5] - orientation[2] * orientation[4],
+            orientation[2] * orientation[3] - orientation[0] * orientation[5],
+            orientation[0] * orientation[4] - orientation[1] * orientation[3],
+        ]
+        position = sum(axis * coord for axis, coord in zip(normal, origin))
+    except (AttributeError, TypeError, ValueError, IndexError):
+        pass
+
+    return {
+        "study": str(dataset.get("StudyInstanceUID") or ""),
+        "series": str(dataset.SeriesInstanceUID),
+        "seriesNumber": _as_int(dataset.get("SeriesNumber")),
+        "instanceNumber": _as_int(dataset.get("InstanceNumber")),
+        "position": position,
+    }
+
+
+def read_dicom_headers(files: Sequence[str]) -> List[Optional[Dict]]:
+    """Read the grouping tags of DICOM files, in parallel if ``config.process_pool``."""
+    if not config.process_pool or len(files) <= HEADER_CHUNK_SIZE:
+        return [read_dicom_header(file_) for file_ in files]
+
+    return list(
+        get_process_pool().map(read_dicom_header, files, chunksize=HEADER_CHUNK_SIZE)
+    )
+
+
+def group_dicom_series(
+    files: Sequence[str], as_study: bool = False
+) -> Tuple[List[Dict], List[str]]:
+    """Group DICOM files into items by Study/Series Instance UID using local headers.
+
+    Slices in a series are ordered by their position along the slice normal,
+    falling back to instance number and file name. Returns the grouped items
+    list, along with the files that could not be read as DICOM.
+    """
+    # pylint: disable=too-many-locals
+    path_key = natsort_keygen(alg=ns.IGNORECASE)
+    headers = read_dicom_headers(files)
+
+    series_files: Dict[Tuple[str, str], List[Tuple[Dict, str]]] = {}
+    others: List[str] = []
+    for file_, header in zip(files, headers):
+        if header is None:
+            others.append(file_)
+        else:
+            series_files.setdefault((header["study"], header["series"]), []).append(
+                (header, file_)
+            )
+
+    def slice_key(entry: Tuple[Dict, str]) -> Tuple:
+        header, file_ = entry
+        return (
+            header["position"] is None,
+            header["position"] or 0.0,
+            header["instanceNumber"] is None,
+            header["instanceNumber"] or 0,
+            path_key(file_),
+        )
+
+    groups: Dict[str, List[Tuple[Dict, List[str]]]] = {}
+    for (study, series), entries in series_files.items():
+        entries.sort(key=slice_key)
+        groups.setdefault(study if as_study else f"{study}/{series}", []).append(
+            (entries[0][0], [file_ for _, file_ in entries])
+        )
+
+    items_list: List[Dict] = []
+    for series_list in groups.values():
+        series_list.sort(
+            key=lambda series: (
+                series[0]["seriesNumber"] is None,
+                series[0]["seriesNumber"] or 0,
+                path_key(series[1][0]),
+            )
+        )
+        items_list.append(
+            {"items": [file_ for _, items in series_list for file_ in items]}
+        )
+
+    items_list.sort(key=lambda item: path_key(item["items"][0]))
+
+    # Name groups that would otherwise share a directory based task name
+    group_dirs = [
+        os.path.dirname(
+            os.path.dirname(item["items"][0]) if as_study else item["items"][0]
+        )
+        for item in items_list
+    ]
+    dir_counts = Counter(group_dirs)
+    if any(count > 1 for count in dir_counts.values()):
+        root = os.path.dirname(os.path.commonpath(group_dirs))
+        indices: Dict[str, int] = {}
+        for item, group_dir in zip(items_list, group_dirs):
+            if dir_counts[group_dir] > 1:
+                indices[group_dir] = indices.get(group_dir, 0) + 1
+                item["name"] = "/".join(
+                    [
+                        *os.path.relpath(group_dir, root).split(os.path.sep),
+                        str(indices[group_dir]),
+                    ]
+                )
+
+    return items_list, others
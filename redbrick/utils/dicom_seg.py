@@ -1,11 +1,10 @@
 """DICOM Seg utils."""
 
 import os
-from typing import List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import pathlib
 
 import numpy as np
-import nibabel as nib
 import pydicom
 import pydicom_seg_rb  # type: ignore
 from pydicom.filereader import dcmread
@@ -16,24 +15,33 @@ from redbrick.utils.common_utils import get_color
 from redbrick.types.task import SegmentMap as TypeSegmentMap
 
 
-def convert_nii_to_dicom_seg(
+def load_series_headers(dicom_series_path: str) -> List[Any]:
+    """Parse headers of all files in a DICOM series directory."""
+    return [
+        dcmread(str(f), stop_before_pixels=True)
+        for f in pathlib.Path(dicom_series_path).glob("*")
+    ]
+
+
+def _segment_attributes(
     label: str,
-    dicom_series_path: str,
     categories: List[ObjectType],
     segment_map: TypeSegmentMap,
     binary_mask: bool,
-) -> Optional[str]:
-    """Convert nifti label to dicom seg."""
+) -> Tuple[Any, List[Dict]]:
+    """Read a nifti label, along with the DICOM SEG attributes of its segments."""
     # pylint: disable=too-many-locals
+    mask = SimpleITK.Cast(SimpleITK.ReadImage(label), SimpleITK.sitkUInt16)
+
     unique_labels: Set[int]
     if binary_mask:
         unique_labels = {
             int(label.removesuffix(".gz").removesuffix(".nii").rsplit("-")[-1])
         }
     else:
-        unique_labels = set(
-            np.unique(nib.load(label).get_fdata(caching="unchanged").astype(np.uint16))  # type: ignore
-        ) - {0}
+        unique_labels = {
+            int(inst) for inst in np.unique(SimpleITK.GetArrayViewFromImage(mask))
+        } - {0}
 
     segment_attributes = []
     for inst in unique_labels:
@@ -86,15 +94,13 @@ def convert_nii_to_dicom_seg(
         }
         segment_attributes.append(segment_attribute)
 
-    if not segment_attributes:
-        return None
-
-    image_files = pathlib.Path(dicom_series_path).glob("*")
-    image_datasets = [dcmread(str(f), stop_before_pixels=True) for f in image_files]
+    return mask, segment_attributes
 
-    mask = SimpleITK.ReadImage(label)
-    mask = SimpleITK.Cast(mask, SimpleITK.sitkUInt16)
 
+def _write_dicom_seg(
+    label: str, mask: Any, segment_attributes: List[Dict], image_datasets: List[Any]
+) -> str:
+    """Write a nifti label mask as DICOM SEG."""
     writer = pydicom_seg_rb.MultiClassWriter(
         template=pydicom_seg_rb.template.from_dcmqi_metainfo(
             {
@@ -117,6 +123,53 @@ def convert_nii_to_dicom_seg(
     return dicom_seg_file
 
 
+def convert_nii_to_dicom_segs(
+    labels: List[str],
+    dicom_series_path: str,
+    categories: List[ObjectType],
+    segment_map: TypeSegmentMap,
+    binary_mask: bool,
+) -> List[Union[Optional[str], Exception]]:
+    """Convert nifti labels of a series to dicom seg, parsing the series once.
+
+    The error of a label that fails to convert is returned in place of its output.
+    """
+    image_datasets: Optional[List[Any]] = None
+    outputs: List[Union[Optional[str], Exception]] = []
+    for label in labels:
+        try:
+            mask, segment_attributes = _segment_attributes(
+                label, categories, segment_map, binary_mask
+            )
+            if not segment_attributes:
+                outputs.append(None)
+                continue
+            if image_datasets is None:
+                image_datasets = load_series_headers(dicom_series_path)
+            outputs.append(
+                _write_dicom_seg(label, mask, segment_attributes, image_datasets)
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            outputs.append(error)
+    return outputs
+
+
+def convert_nii_to_dicom_seg(
+    label: str,
+    dicom_series_path: str,
+    categories: List[ObjectType],
+    segment_map: TypeSegmentMap,
+    binary_mask: bool,
+) -> Optional[str]:
+    """Convert nifti label to dicom seg."""
+    output = convert_nii_to_dicom_segs(
+        [label], dicom_series_path, categories, segment_map, binary_mask
+    )[0]
+    if isinstance(output, Exception):
+        raise output
+    return output
+
+
 def convert_dicom_seg_to_nii(
     masks: List[str],
     dicom_series_path: str,  # pylint: disable=unused-argument
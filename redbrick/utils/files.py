@@ -3,8 +3,23 @@
 import asyncio
 import os
 import gzip
-from typing import Any, Callable, Dict, List, Optional, Tuple, Set
+import heapq
+import itertools
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Set,
+)
 import urllib.parse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager
 
 import aiofiles  # type: ignore
 import aiohttp
@@ -16,10 +31,17 @@ from tenacity.wait import wait_random_exponential
 from natsort import natsorted, ns
 
 from redbrick.common.constants import (
+    MAX_CONCURRENCY,
     MAX_FILE_BATCH_SIZE,
     MAX_RETRY_ATTEMPTS,
+    MAX_TRANSFER_BYTES,
+)
+from redbrick.utils.async_utils import (
+    gather_with_concurrency,
+    get_session,
+    run_in_thread,
 )
-from redbrick.utils.async_utils import gather_with_concurrency, get_session
+from redbrick.utils.blob_cache import get_blob_cache
 from redbrick.utils.logging import log_error, logger
 from redbrick.config import config
 
@@ -65,6 +87,8 @@ FILE_TYPES = {
 
 ALL_FILE_TYPES = {"*": "*/*"}
 
+DICOM_PREFIX_SIZE = 132
+
 
 def get_file_type(file_path: str) -> Tuple[str, str]:
     """
@@ -88,50 +112,94 @@ def get_file_type(file_path: str) -> Tuple[str, str]:
     return file_ext, FILE_TYPES[file_ext]
 
 
-def find_files_recursive(
-    root: str, file_types: Set[str], multiple: bool = False
-) -> List[List[str]]:
-    """Find files recursively in a directory, that belong to a list of allowed file types."""
-    if not os.path.isdir(root):
-        return []
+def _matches_file_types(name: str, file_types: Set[str]) -> bool:
+    """Check if a file name belongs to a list of allowed file types."""
+    extensions = name.lower().rsplit(".", 2)
+    return (
+        "*" in file_types
+        or extensions[-1] in file_types
+        or ("." in name and extensions[-1] == "gz" and extensions[-2] in file_types)
+    )
+
 
-    items = []
-    list_items = []
+def _scan_directory(
+    directory: str, file_types: Set[str], multiple: bool
+) -> Tuple[List[List[str]], List[str]]:
+    """Scan a single directory, returning matched file groups and sub-directories."""
+    items: List[List[str]] = []
+    list_items: List[str] = []
+    sub_directories: List[str] = []
     discard_list_items = False
 
-    for item in os.listdir(root):
-        if item.startswith("."):
-            continue
-        path = os.path.join(root, item)
-        if os.path.isdir(path):
-            items.extend(find_files_recursive(path, file_types, multiple))
-            discard_list_items = True
-        elif os.path.isfile(path) and (  # pylint: disable=too-many-boolean-expressions
-            "*" in file_types
-            or (
-                item.rsplit(".", 1)[-1].lower() in file_types
-                or (
-                    "." in item
-                    and item.rsplit(".", 1)[-1].lower() == "gz"
-                    and item.rsplit(".", 2)[-2].lower() in file_types
-                )
-            )
-        ):
-            if multiple:
-                if not discard_list_items:
-                    list_items.append(path)
-            else:
-                items.append([path])
-        else:
-            discard_list_items = True
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    is_dir = entry.is_dir()
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    is_dir = is_file = False
+                if is_dir:
+                    sub_directories.append(entry.path)
+                    discard_list_items = True
+                elif is_file and _matches_file_types(entry.name, file_types):
+                    if multiple:
+                        list_items.append(entry.path)
+                    else:
+                        items.append([entry.path])
+                else:
+                    discard_list_items = True
+    except OSError as error:
+        logger.warning(f"Unable to scan {directory}: {error}")
+        return [], []
 
     if (
-        not discard_list_items
+        multiple
+        and not discard_list_items
         and len({item.rsplit(".", 1)[-1].lower() for item in list_items}) == 1
     ):
         items.append(list(natsorted(list_items, alg=ns.IGNORECASE)))  # type: ignore
 
-    return items
+    return items, sub_directories
+
+
+def scan_files(
+    root: str,
+    file_types: Set[str],
+    multiple: bool = False,
+    max_workers: int = MAX_CONCURRENCY,
+) -> Iterator[List[str]]:
+    """Scan a directory tree concurrently, yielding groups of files as they are found.
+
+    Directories are listed with ``os.scandir`` in a thread pool, so groups are
+    yielded in completion order rather than directory order.
+    """
+    if not os.path.isdir(root):
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        pending = {executor.submit(_scan_directory, root, file_types, multiple)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                items, sub_directories = future.result()
+                pending.update(
+                    executor.submit(_scan_directory, directory, file_types, multiple)
+                    for directory in sub_directories
+                )
+                yield from items
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def find_files_recursive(
+    root: str, file_types: Set[str], multiple: bool = False
+) -> List[List[str]]:
+    """Find files recursively in a directory, that belong to a list of allowed file types."""
+    return list(scan_files(root, file_types, multiple))
 
 
 def uniquify_path(path: str) -> str:
@@ -156,86 +224,213 @@ def is_gzipped_data(data: bytes) -> bool:
 
 
 def is_dicom_file(file_name: str) -> bool:
-    """Check if data is dicom."""
+    """Check if data is dicom, reading only the preamble and prefix."""
     with open(file_name, "rb") as fp_:
-        data = fp_.read()
-
-    if is_gzipped_data(data):
-        data = gzip.decompress(data)
+        data = fp_.read(DICOM_PREFIX_SIZE)
+        if is_gzipped_data(data):
+            fp_.seek(0)
+            try:
+                with gzip.GzipFile(fileobj=fp_) as gzip_file:
+                    data = gzip_file.read(DICOM_PREFIX_SIZE)
+            except (OSError, EOFError):
+                return False
 
     return data[128:132] == b"\x44\x49\x43\x4d"
 
 
-async def upload_files(
-    files: List[Tuple[str, str, str]],
-    progress_bar_name: Optional[str] = "Uploading files",
+def check_dicom_files(file_names: List[str]) -> List[bool]:
+    """Check which files are dicom, using a thread pool."""
+    if not file_names:
+        return []
+
+    with ThreadPoolExecutor(min(MAX_CONCURRENCY, len(file_names))) as executor:
+        return list(executor.map(is_dicom_file, file_names))
+
+
+async def upload_file(
+    session: aiohttp.ClientSession,
+    path: str,
+    url: str,
+    file_type: str,
     segmentations_upload: bool = False,
     zipped: bool = False,
-    keep_progress_bar: bool = False,
     upload_callback: Optional[Callable] = None,
-) -> List[bool]:
-    """Upload files from local path to url (file path, presigned url, file type)."""
-    timeout = aiohttp.ClientTimeout(connect=60)
-    verify_ssl = config.verify_ssl
+) -> bool:
+    """Upload a file from local path to a presigned url."""
+    if not path or not url or not file_type:
+        return False
+
+    status: int = 0
+    request_params: aiohttp.client._RequestOptions = {
+        "timeout": aiohttp.ClientTimeout(connect=60),
+        "headers": {"Content-Type": file_type},
+    }
+
+    tmp_path: Optional[str] = None
+
+    if zipped:
+        tmp_path = uniquify_path(path + ".gz")
+        request_params["headers"]["Content-Encoding"] = "gzip"  # type: ignore
+        with open(path, "rb") as f_:
+            data = gzip.compress(f_.read())
+        with open(tmp_path, "wb") as f_:
+            f_.write(data)
+
+    if segmentations_upload:
+        request_params["headers"]["x-ms-blob-type"] = "BlockBlob"  # type: ignore
+
+    if not config.verify_ssl:
+        request_params["ssl"] = False
+
+    try:
+        for attempt in Retrying(
+            reraise=True,
+            stop=stop_after_attempt(MAX_RETRY_ATTEMPTS),
+            wait=wait_random_exponential(min=5, max=30),
+            retry=retry_if_not_exception_type(KeyboardInterrupt),
+        ):
+            with attempt:
+                with open(tmp_path or path, "rb") as f_:
+                    request_params["data"] = f_
+                    async with session.put(url, **request_params) as response:
+                        status = response.status
+    except RetryError as error:
+        if tmp_path:
+            os.remove(tmp_path)
+        raise Exception("Unknown problem occurred") from error
 
-    async def _upload_file(
-        session: aiohttp.ClientSession, path: str, url: str, file_type: str
-    ) -> bool:
-        if not path or not url or not file_type:
-            return False
+    if tmp_path:
+        os.remove(tmp_path)
 
-        status: int = 0
-        request_params: aiohttp.client._RequestOptions = {
-            "timeout": timeout,
-            "headers": {"Content-Type": file_type},
-        }
+    if status in (200, 201):
+        if upload_callback:
+            upload_callback()
+        return True
 
-        tmp_path: Optional[str] = None
+    raise ConnectionError(f"Error in uploading {path} to RedBrick")
 
-        if zipped:
-            tmp_path = uniquify_path(path + ".gz")
-            request_params["headers"]["Content-Encoding"] = "gzip"  # type: ignore
-            with open(path, "rb") as f_:
-                data = gzip.compress(f_.read())
-            with open(tmp_path, "wb") as f_:
-                f_.write(data)
 
-        if segmentations_upload:
-            request_params["headers"]["x-ms-blob-type"] = "BlockBlob"  # type: ignore
+class TransferScheduler:
+    """Schedule file transfers of many tasks over a shared session.
 
-        if not verify_ssl:
-            request_params["ssl"] = False
+    Limits the total in-flight transfers and bytes, and starts waiting transfers
+    in priority order, so tasks that started earlier finish before later tasks
+    take up the link.
+    """
 
-        try:
-            for attempt in Retrying(
-                reraise=True,
-                stop=stop_after_attempt(MAX_RETRY_ATTEMPTS),
-                wait=wait_random_exponential(min=5, max=30),
-                retry=retry_if_not_exception_type(KeyboardInterrupt),
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        max_transfers: int = MAX_CONCURRENCY,
+        max_bytes: int = MAX_TRANSFER_BYTES,
+    ) -> None:
+        """Construct TransferScheduler."""
+        self.session = session
+        self.max_transfers = max(1, max_transfers)
+        self.max_bytes = max_bytes
+        self._transfers = 0
+        self._bytes = 0
+        self._waiters: List[Tuple[int, int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._priorities = itertools.count()
+
+    def next_priority(self) -> int:
+        """Get the priority for a new task, served after those of all previous tasks.
+
+        Priorities increase with each call, and waiting transfers with smaller
+        priority values are started first.
+        """
+        return next(self._priorities)
+
+    def _release(self, size: int) -> None:
+        self._transfers -= 1
+        self._bytes -= size
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            _, _, size, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._transfers >= self.max_transfers or (
+                self._transfers and self._bytes + size > self.max_bytes
             ):
-                with attempt:
-                    with open(tmp_path or path, "rb") as f_:
-                        request_params["data"] = f_
-                        async with session.put(url, **request_params) as response:
-                            status = response.status
-        except RetryError as error:
-            if tmp_path:
-                os.remove(tmp_path)
-            raise Exception("Unknown problem occurred") from error
+                break
+            heapq.heappop(self._waiters)
+            self._transfers += 1
+            self._bytes += size
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, size: int, priority: int = 0) -> AsyncIterator[None]:
+        """Wait for a transfer slot of the given size and priority."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), size, future))
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release(size)
+            raise
 
-        if tmp_path:
-            os.remove(tmp_path)
+        try:
+            yield
+        finally:
+            self._release(size)
+
+
+async def upload_files(
+    files: List[Tuple[str, str, str]],
+    progress_bar_name: Optional[str] = "Uploading files",
+    segmentations_upload: bool = False,
+    zipped: bool = False,
+    keep_progress_bar: bool = False,
+    upload_callback: Optional[Callable] = None,
+    scheduler: Optional[TransferScheduler] = None,
+    priority: int = 0,
+) -> List[bool]:
+    """Upload files from local path to url (file path, presigned url, file type)."""
+    if scheduler:
 
-        if status in (200, 201):
-            if upload_callback:
-                upload_callback()
-            return True
+        async def _scheduled_upload(path: str, url: str, file_type: str) -> bool:
+            try:
+                size = os.path.getsize(path)
+            except (OSError, TypeError):
+                size = 0
+            async with scheduler.slot(size, priority):  # type: ignore
+                return await upload_file(
+                    scheduler.session,  # type: ignore
+                    path,
+                    url,
+                    file_type,
+                    segmentations_upload,
+                    zipped,
+                    upload_callback,
+                )
 
-        raise ConnectionError(f"Error in uploading {path} to RedBrick")
+        return await gather_with_concurrency(
+            scheduler.max_transfers,
+            *[
+                _scheduled_upload(path, url, file_type)
+                for path, url, file_type in files
+            ],
+            progress_bar_name=progress_bar_name,
+            keep_progress_bar=keep_progress_bar,
+        )
 
     async with get_session(api=False) as session:
         coros = [
-            _upload_file(session, path, url, file_type)
+            upload_file(
+                session,
+                path,
+                url,
+                file_type,
+                segmentations_upload,
+                zipped,
+                upload_callback,
+            )
             for path, url, file_type in files
         ]
         uploaded = await gather_with_concurrency(
@@ -244,8 +439,6 @@ async def upload_files(
             progress_bar_name=progress_bar_name,
             keep_progress_bar=keep_progress_bar,
         )
-        await asyncio.sleep(0.5)
-        await session.close()
 
     return uploaded
 
@@ -256,14 +449,24 @@ async def download_files(
     keep_progress_bar: bool = True,
     overwrite: bool = False,
     zipped: bool = False,
+    cache_keys: Optional[Sequence[Optional[str]]] = None,
 ) -> List[Optional[str]]:
-    """Download files from url to local path (presigned url, file path)."""
-    # pylint: disable=too-many-statements
+    """Download files from url to local path (presigned url, file path).
+
+    With ``cache_keys`` (unique keys of the remote files), files are served from
+    and added to the local blob cache, if enabled. Cached files are revalidated
+    with their ETag on each download.
+    """
+    # pylint: disable=too-many-locals, too-many-statements
+    blob_cache = get_blob_cache() if cache_keys else None
 
     async def _download_file(
-        session: aiohttp.ClientSession, url: Optional[str], path: Optional[str]
+        session: aiohttp.ClientSession,
+        url: Optional[str],
+        path: Optional[str],
+        cache_key: Optional[str],
     ) -> Optional[str]:
-        # pylint: disable=no-member, too-many-branches
+        # pylint: disable=no-member, too-many-branches, too-many-return-statements
         if not url or not path:
             logger.debug(f"Downloading empty '{url}' to '{path}'")
             return None
@@ -271,6 +474,8 @@ async def download_files(
         path = urllib.parse.unquote(path)
         if zipped and not path.endswith(".gz"):
             path += ".gz"
+            if cache_key:
+                cache_key += ":gz"
 
         if not overwrite and os.path.isfile(path):
             logger.debug(f"File already exists: {path}")
@@ -280,6 +485,10 @@ async def download_files(
             logger.warning(f"Cannot download to a directory: {path}")
             return None
 
+        etag: Optional[str] = None
+        if blob_cache and cache_key:
+            etag = await run_in_thread(blob_cache.etag, cache_key)
+
         headers: Dict = {}
         tmp_path = f"{path}.tmp"
 
@@ -294,9 +503,20 @@ async def download_files(
                     request_params: Dict[str, Any] = {}
                     if not config.verify_ssl:
                         request_params["ssl"] = False
+                    if etag:
+                        request_params["headers"] = {"If-None-Match": etag}
                     async with session.get(
                         URL(url, encoded=True), **request_params
                     ) as response:
+                        if response.status == 304 and blob_cache and etag:
+                            cached: bool = await run_in_thread(
+                                blob_cache.get, cache_key, etag, path
+                            )
+                            if cached:
+                                return path
+                            etag = None
+                            raise ConnectionError("Cached file is not available")
+
                         if 400 <= response.status < 500:
                             log_error(f"Client error {response.status} for {url}")
                             return None
@@ -305,6 +525,7 @@ async def download_files(
 
                         if response.status == 200:
                             headers = dict(response.headers)
+                            etag = response.headers.get("ETag")
                             async with aiofiles.open(tmp_path, "wb") as temp_file:
                                 async for chunk in response.content.iter_chunked(8192):
                                     await temp_file.write(chunk)
@@ -344,6 +565,9 @@ async def download_files(
                 with open(path, "wb") as file_:
                     file_.write(data)
 
+        if blob_cache and cache_key and etag:
+            await run_in_thread(blob_cache.put, cache_key, etag, path)
+
         return path
 
     dirs: Set[str] = set()
@@ -359,7 +583,10 @@ async def download_files(
         dirs.add(parent)
 
     async with get_session(api=False) as session:
-        coros = [_download_file(session, url, path) for url, path in files]
+        coros = [
+            _download_file(session, url, path, cache_key)
+            for (url, path), cache_key in zip(files, cache_keys or [None] * len(files))
+        ]
         paths = await gather_with_concurrency(
             MAX_FILE_BATCH_SIZE,
             *coros,
@@ -367,8 +594,6 @@ async def download_files(
             keep_progress_bar=keep_progress_bar,
             return_exceptions=True,
         )
-        await asyncio.sleep(0.5)
-        await session.close()
 
     output: List[Optional[str]] = []
     for path in paths:
@@ -390,13 +615,20 @@ async def download_files_altadb(
     # pylint: disable=import-outside-toplevel, cyclic-import
     from redbrick.utils.altadb import save_dicom_series
 
-    paths = await gather_with_concurrency(
-        MAX_FILE_BATCH_SIZE,
-        *[save_dicom_series(url, path) for url, path in files],
-        progress_bar_name=progress_bar_name,
-        keep_progress_bar=keep_progress_bar,
-        return_exceptions=True,
-    )
+    frame_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    async with get_session(api=False) as session:
+        paths = await gather_with_concurrency(
+            MAX_FILE_BATCH_SIZE,
+            *[
+                save_dicom_series(
+                    url, path, aiosession=session, frame_semaphore=frame_semaphore
+                )
+                for url, path in files
+            ],
+            progress_bar_name=progress_bar_name,
+            keep_progress_bar=keep_progress_bar,
+            return_exceptions=True,
+        )
 
     output: List[Optional[List[str]]] = []
     for path in paths:
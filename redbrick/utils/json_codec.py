@@ -0,0 +1,122 @@
+"""JSON codec, using an accelerated backend (orjson/ujson) when installed.
+
+Output of the accelerated backends parses to the same values as stdlib json,
+but is not always byte identical: orjson writes NaN and Infinity as null, and
+writes exponents without padding or sign (1e-7 and 1e16 instead of 1e-07 and
+1e+16). Set ``config.json_backend`` to ``json`` to keep stdlib output.
+"""
+
+import json
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple, Optional, Tuple, Union
+
+from redbrick.config import config
+
+
+JSON_BACKENDS = ("orjson", "ujson", "json")
+
+
+class JSONCodec(NamedTuple):
+    """JSON backend functions."""
+
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumpb: Callable[[Any, bool, Optional[Callable[[Any], Any]]], bytes]
+
+
+def _json_dumpb(
+    obj: Any, indent: bool, default: Optional[Callable[[Any], Any]]
+) -> bytes:
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        default=default,
+    ).encode("utf-8")
+
+
+def _orjson_codec() -> JSONCodec:
+    # pylint: disable=import-outside-toplevel, import-error, no-member
+    import orjson  # type: ignore
+
+    def dumpb(obj: Any, indent: bool, default: Optional[Callable[[Any], Any]]) -> bytes:
+        try:
+            return orjson.dumps(
+                obj,
+                default=default,
+                option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0),
+            )
+        except TypeError:
+            # orjson does not support some values, e.g. integers over 64 bits
+            return _json_dumpb(obj, indent, default)
+
+    return JSONCodec("orjson", orjson.loads, dumpb)
+
+
+def _ujson_codec() -> JSONCodec:
+    # pylint: disable=import-outside-toplevel, import-error
+    import ujson  # type: ignore
+
+    def dumpb(obj: Any, indent: bool, default: Optional[Callable[[Any], Any]]) -> bytes:
+        try:
+            return ujson.dumps(
+                obj,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+                indent=2 if indent else 0,
+                default=default,
+            ).encode("utf-8")
+        except (TypeError, OverflowError):
+            return _json_dumpb(obj, indent, default)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        try:
+            return ujson.loads(data)
+        except ValueError as error:
+            raise json.JSONDecodeError(str(error), str(data), 0) from error
+
+    return JSONCodec("ujson", loads, dumpb)
+
+
+@lru_cache(maxsize=None)
+def get_codec(backend: str = "") -> JSONCodec:
+    """Get the codec of a JSON backend, or the fastest installed one.
+
+    Falls back to the next installed backend in ``JSON_BACKENDS`` order if
+    the requested backend is not installed.
+    """
+    backends: Tuple[str, ...] = JSON_BACKENDS
+    if backend in JSON_BACKENDS:
+        backends = JSON_BACKENDS[JSON_BACKENDS.index(backend) :]
+    for name in backends:
+        try:
+            if name == "orjson":
+                return _orjson_codec()
+            if name == "ujson":
+                return _ujson_codec()
+        except ImportError:
+            continue
+    return JSONCodec("json", json.loads, _json_dumpb)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document, raising json.JSONDecodeError if invalid."""
+    return get_codec(config.json_backend).loads(data)
+
+
+def json_dumpb(
+    obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """Serialize an object to compact (or 2 space indented) UTF-8 JSON.
+
+    With orjson, NaN and Infinity are serialized as null.
+    """
+    return get_codec(config.json_backend).dumpb(obj, indent, default)
+
+
+def json_dumps(
+    obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> str:
+    """Serialize an object to a compact (or 2 space indented) JSON string."""
+    return json_dumpb(obj, indent, default).decode("utf-8")
@@ -0,0 +1,196 @@
+"""Read-through caches of project, stage, taxonomy and member metadata."""
+
+import os
+import copy
+import time
+import hashlib
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from redbrick.common.constants import MEMBER_DIRECTORY_TTL
+from redbrick.common.member import MemberRepo
+from redbrick.config import config
+from redbrick.utils.common_utils import config_path
+from redbrick.utils.json_codec import json_dumps, json_loads
+
+
+ValueType = TypeVar("ValueType")  # pylint: disable=invalid-name
+
+
+class MetadataCache:
+    """TTL cache of metadata entities, shared by objects built on the same context.
+
+    Entries expire after ``config.metadata_cache_ttl`` seconds, and are also
+    persisted to disk if ``config.metadata_cache_persist`` is set.
+    Entries are scoped to the API key and URL of the context.
+    """
+
+    def __init__(
+        self, api_key: str, url: str, cache_file: Optional[str] = None
+    ) -> None:
+        """Construct MetadataCache."""
+        self.scope = hashlib.sha256(f"{url}\n{api_key}".encode()).hexdigest()
+        self.cache_file = cache_file or os.path.join(
+            config_path(), "cache", "metadata.db"
+        )
+        self._memory: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+        self._fetch_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if not config.metadata_cache_persist:
+            return None
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+                conn = sqlite3.connect(
+                    self.cache_file, timeout=30, check_same_thread=False
+                )
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS metadata (scope TEXT, kind TEXT, "
+                        + "key TEXT, expires REAL, value TEXT, "
+                        + "PRIMARY KEY (scope, kind, key))"
+                    )
+            except sqlite3.Error:
+                return None
+            self._conn = conn
+        return self._conn
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """Get a cached entity, if present and not expired."""
+        if config.metadata_cache_ttl <= 0:
+            return None
+
+        now = time.time()
+        with self._lock:
+            expires, value = self._memory.get((kind, key), (0.0, None))
+            if expires > now:
+                return copy.deepcopy(value)
+
+            conn = self._connection()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT expires, value FROM metadata "
+                    + "WHERE scope = ? AND kind = ? AND key = ? AND expires > ?",
+                    (self.scope, kind, key, now),
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if not row:
+                return None
+            value = json_loads(row[1])
+            self._memory[(kind, key)] = (row[0], value)
+            return copy.deepcopy(value)
+
+    def put(self, kind: str, key: str, value: Any) -> None:
+        """Cache an entity."""
+        ttl = config.metadata_cache_ttl
+        if ttl <= 0:
+            return
+
+        expires = time.time() + ttl
+        with self._lock:
+            self._memory[(kind, key)] = (expires, copy.deepcopy(value))
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?)",
+                        (
+                            self.scope,
+                            kind,
+                            key,
+                            expires,
+                            json_dumps(value, default=str),
+                        ),
+                    )
+            except sqlite3.Error:
+                pass
+
+    def invalidate(self, kind: str, key: Optional[str] = None) -> None:
+        """Drop a cached entity, or all entities of a kind if no key is given."""
+        with self._lock:
+            for entry in list(self._memory):
+                if entry[0] == kind and key in (None, entry[1]):
+                    del self._memory[entry]
+            conn = self._connection()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    if key is None:
+                        conn.execute(
+                            "DELETE FROM metadata WHERE scope = ? AND kind = ?",
+                            (self.scope, kind),
+                        )
+                    else:
+                        conn.execute(
+                            "DELETE FROM metadata "
+                            + "WHERE scope = ? AND kind = ? AND key = ?",
+                            (self.scope, kind, key),
+                        )
+            except sqlite3.Error:
+                pass
+
+    def fetch(self, kind: str, key: str, fetcher: Callable[[], ValueType]) -> ValueType:
+        """Get a cached entity, fetching it once across threads on a miss."""
+        value = self.get(kind, key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            fetch_lock = self._fetch_locks.setdefault((kind, key), threading.Lock())
+
+        with fetch_lock:
+            value = self.get(kind, key)
+            if value is not None:
+                return value
+            value = fetcher()
+            self.put(kind, key, value)
+            return value
+
+
+class MemberDirectory:
+    """Directory of org members for userId to email lookups.
+
+    Members are fetched lazily, kept in memory independently of the metadata
+    cache config, and refetched once they are older than ``ttl`` seconds.
+    """
+
+    def __init__(self, member_repo: MemberRepo, ttl: int = MEMBER_DIRECTORY_TTL):
+        """Construct MemberDirectory."""
+        self.member_repo = member_repo
+        self.ttl = ttl
+        self._orgs: Dict[str, Tuple[float, Dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def emails(self, org_id: str) -> Dict[str, str]:
+        """Get the userId to email mapping of all org members (do not modify)."""
+        with self._lock:
+            expires, users = self._orgs.get(org_id, (0.0, {}))
+            if expires > time.time():
+                return users
+
+            users = {}
+            for member in self.member_repo.list_org_members(org_id, False):
+                user = member.get("user", {})
+                if user.get("userId") and user.get("email"):
+                    users[user["userId"]] = user["email"]
+
+            self._orgs[org_id] = (time.time() + self.ttl, users)
+            return users
+
+    def invalidate(self, org_id: Optional[str] = None) -> None:
+        """Drop the cached members of an org, or of all orgs."""
+        with self._lock:
+            if org_id is None:
+                self._orgs.clear()
+            else:
+                self._orgs.pop(org_id, None)
@@ -1,12 +1,14 @@
 """Dicom/nifti related functions."""
 
 import os
+import hashlib
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, TypedDict
 from asyncio import BoundedSemaphore
 import shutil
 from uuid import uuid4
 
 from redbrick.utils.common_utils import config_path
+from redbrick.utils.async_utils import run_in_thread
 from redbrick.utils.files import uniquify_path
 from redbrick.utils.logging import log_error, logger
 
@@ -201,7 +203,7 @@ def convert_to_semantic(
     return True, list(files)
 
 
-async def process_download(
+def _process_download(
     labels: List[Dict],
     labels_path: Optional[str],
     png_mask: bool,
@@ -222,110 +224,134 @@ async def process_download(
         png_mask=False,
         masks=labels_path,
     )
-    async with semaphore:
-        try:
-            if not (labels_path and os.path.isfile(labels_path)):
-                return label_map_data
-
-            filtered_labels = [
-                label
-                for label in labels
-                if label.get("dicom")
-                and (
-                    volume_index is None
-                    or label.get("volumeindex") is None
-                    or label["volumeindex"] == volume_index
-                )
-            ]
-
-            binary_mask = (
-                binary_mask
-                if binary_mask is not None
-                else any(label["dicom"].get("groupids") for label in filtered_labels)
+    try:
+        if not (labels_path and os.path.isfile(labels_path)):
+            return label_map_data
+
+        filtered_labels = [
+            label
+            for label in labels
+            if label.get("dicom")
+            and (
+                volume_index is None
+                or label.get("volumeindex") is None
+                or label["volumeindex"] == volume_index
             )
+        ]
 
-            if not (png_mask or binary_mask or semantic_mask or mhd_mask):
-                return label_map_data
+        binary_mask = (
+            binary_mask
+            if binary_mask is not None
+            else any(label["dicom"].get("groupids") for label in filtered_labels)
+        )
 
-            dirname = (
-                os.path.splitext(labels_path)[0]
-                if labels_path.endswith(".gz")
-                else labels_path
+        if not (png_mask or binary_mask or semantic_mask or mhd_mask):
+            return label_map_data
+
+        dirname = (
+            os.path.splitext(labels_path)[0]
+            if labels_path.endswith(".gz")
+            else labels_path
+        )
+        dirname = os.path.splitext(dirname)[0]
+        shutil.rmtree(dirname, ignore_errors=True)
+        os.makedirs(dirname, exist_ok=True)
+
+        if binary_mask:
+            (
+                label_map_data["binary_mask"],
+                label_map_data["masks"],
+            ) = convert_to_binary(labels_path, filtered_labels, dirname)
+        else:
+            label_map_data["masks"] = [labels_path]
+
+        if semantic_mask and label_map_data["masks"]:
+            (
+                label_map_data["semantic_mask"],
+                label_map_data["masks"],
+            ) = convert_to_semantic(
+                (
+                    [label_map_data["masks"]]
+                    if isinstance(label_map_data["masks"], str)
+                    else label_map_data["masks"]
+                ),
+                filtered_labels,
+                dirname,
+                label_map_data["binary_mask"],
+                is_tax_v2,
             )
-            dirname = os.path.splitext(dirname)[0]
-            shutil.rmtree(dirname, ignore_errors=True)
-            os.makedirs(dirname, exist_ok=True)
 
-            if binary_mask:
+        if label_map_data["semantic_mask"]:
+            for path in os.listdir(dirname):
+                if path.startswith("instance-"):
+                    os.remove(os.path.join(dirname, path))
+
+        if png_mask and label_map_data["masks"]:
+            label_map_data["png_mask"], label_map_data["masks"] = convert_nii_to_png(
                 (
-                    label_map_data["binary_mask"],
-                    label_map_data["masks"],
-                ) = convert_to_binary(labels_path, filtered_labels, dirname)
-            else:
-                label_map_data["masks"] = [labels_path]
+                    [label_map_data["masks"]]
+                    if isinstance(label_map_data["masks"], str)
+                    else label_map_data["masks"]
+                ),
+                color_map,
+                filtered_labels,
+                dirname,
+                label_map_data["binary_mask"],
+                label_map_data["semantic_mask"],
+                is_tax_v2,
+            )
+
+        if label_map_data["png_mask"]:
+            for path in os.listdir(dirname):
+                if path.startswith("instance-") or path.startswith("category-"):
+                    os.remove(os.path.join(dirname, path))
 
-            if semantic_mask and label_map_data["masks"]:
+        if mhd_mask and label_map_data["masks"]:
+            _, label_map_data["masks"] = convert_nii_to_mhd(
                 (
-                    label_map_data["semantic_mask"],
-                    label_map_data["masks"],
-                ) = convert_to_semantic(
-                    (
-                        [label_map_data["masks"]]
-                        if isinstance(label_map_data["masks"], str)
-                        else label_map_data["masks"]
-                    ),
-                    filtered_labels,
-                    dirname,
-                    label_map_data["binary_mask"],
-                    is_tax_v2,
+                    [label_map_data["masks"]]
+                    if isinstance(label_map_data["masks"], str)
+                    else label_map_data["masks"]
                 )
+            )
 
-            if label_map_data["semantic_mask"]:
-                for path in os.listdir(dirname):
-                    if path.startswith("instance-"):
-                        os.remove(os.path.join(dirname, path))
-
-            if png_mask and label_map_data["masks"]:
-                label_map_data["png_mask"], label_map_data["masks"] = (
-                    convert_nii_to_png(
-                        (
-                            [label_map_data["masks"]]
-                            if isinstance(label_map_data["masks"], str)
-                            else label_map_data["masks"]
-                        ),
-                        color_map,
-                        filtered_labels,
-                        dirname,
-                        label_map_data["binary_mask"],
-                        label_map_data["semantic_mask"],
-                        is_tax_v2,
-                    )
-                )
+        if not os.listdir(dirname):
+            shutil.rmtree(dirname)
 
-            if label_map_data["png_mask"]:
-                for path in os.listdir(dirname):
-                    if path.startswith("instance-") or path.startswith("category-"):
-                        os.remove(os.path.join(dirname, path))
-
-            if mhd_mask and label_map_data["masks"]:
-                _, label_map_data["masks"] = convert_nii_to_mhd(
-                    (
-                        [label_map_data["masks"]]
-                        if isinstance(label_map_data["masks"], str)
-                        else label_map_data["masks"]
-                    )
-                )
+    except Exception as error:
+        log_error(f"Failed to process {labels_path}: {error}")
 
-            if not os.listdir(dirname):
-                shutil.rmtree(dirname)
+    return label_map_data
 
-        except Exception as error:
-            log_error(f"Failed to process {labels_path}: {error}")
 
-        return label_map_data
+async def process_download(
+    labels: List[Dict],
+    labels_path: Optional[str],
+    png_mask: bool,
+    color_map: Dict,
+    semantic_mask: bool,
+    binary_mask: Optional[bool],  # None for auto-judgement
+    mhd_mask: bool,
+    volume_index: Optional[int],
+    is_tax_v2: bool = True,
+) -> LabelMapData:
+    """Process nifti download file."""
+    async with semaphore:
+        return await run_in_thread(
+            _process_download,
+            labels,
+            labels_path,
+            png_mask,
+            color_map,
+            semantic_mask,
+            binary_mask,
+            mhd_mask,
+            volume_index,
+            is_tax_v2,
+        )
 
 
-async def process_upload(
+def _process_upload(
     files: Union[str, List[str]],
     instances: Dict[int, Optional[List[int]]],
     binary_mask: bool,
@@ -341,252 +367,337 @@ async def process_upload(
     from nibabel.nifti2 import Nifti2Image  # type: ignore
     from redbrick.utils.png import convert_png_to_nii
 
-    async with semaphore:
-        if isinstance(files, str):
-            files = [files]
+    if isinstance(files, str):
+        files = [files]
 
-        if not files or any(
-            not isinstance(file_, str) or not os.path.isfile(file_) for file_ in files
-        ):
-            return None, {}, "Files do not exist"
+    if not files or any(
+        not isinstance(file_, str) or not os.path.isfile(file_) for file_ in files
+    ):
+        return None, {}, "Files do not exist"
 
-        reverse_masks: Dict[str, Tuple[int, ...]] = {}
-        for inst_id, mask in masks.items():
-            reverse_masks[mask] = reverse_masks.setdefault(mask, tuple()) + (
-                int(inst_id),
-            )
+    reverse_masks: Dict[str, Tuple[int, ...]] = {}
+    for inst_id, mask in masks.items():
+        reverse_masks[mask] = reverse_masks.setdefault(mask, tuple()) + (int(inst_id),)
 
-        if binary_mask or png_mask:
-            if not binary_mask:
-                return None, {}, "PNG mask upload only supports binary masks"
+    if binary_mask or png_mask:
+        if not binary_mask:
+            return None, {}, "PNG mask upload only supports binary masks"
 
-            for mask, inst_ids in reverse_masks.items():
-                if len(inst_ids) > 1:
-                    return (
-                        None,
-                        {},
-                        f"Binary mask upload only supports single instance per file: '{mask}'",
-                    )
+        for mask, inst_ids in reverse_masks.items():
+            if len(inst_ids) > 1:
+                return (
+                    None,
+                    {},
+                    f"Binary mask upload only supports single instance per file: '{mask}'",
+                )
 
-            if png_mask:
-                convert_png_to_nii(reverse_masks)
-                files = list(reverse_masks.keys())
+        if png_mask:
+            convert_png_to_nii(reverse_masks)
+            files = list(reverse_masks.keys())
 
-        try:
-            base_img = nib_load(files[0])
+    try:
+        base_img = nib_load(files[0])
 
-            if not isinstance(base_img, (Nifti1Image, Nifti2Image)):
-                return None, {}, "Invalid base mask type"
+        if not isinstance(base_img, (Nifti1Image, Nifti2Image)):
+            return None, {}, "Invalid base mask type"
 
-            base_img_dtype = base_img.get_data_dtype()
-            if base_img_dtype in (np.uint8, np.uint16):
-                base_data = np.asanyarray(base_img.dataobj, dtype=np.uint16)
-            else:
-                base_data = np.round(base_img.get_fdata(caching="unchanged")).astype(
-                    np.uint16
+        base_img_dtype = base_img.get_data_dtype()
+        if base_img_dtype in (np.uint8, np.uint16):
+            base_data = np.asanyarray(base_img.dataobj, dtype=np.uint16)
+        else:
+            base_data = np.round(base_img.get_fdata(caching="unchanged")).astype(
+                np.uint16
+            )
+            base_img.set_data_dtype(np.uint16)
+
+        if base_data.ndim != 3:
+            return None, {}, "Invalid base mask shape"
+
+        group_map: Dict[int, Set[int]] = {}
+        map_instances: Set[int] = set()
+        file_instances: Set[int] = set()
+        reverse_map: Dict[Tuple[int, ...], int] = {}
+        for instance_id, instance_groups in instances.items():
+            map_instances.add(instance_id)
+            reverse_map[(instance_id,)] = instance_id
+            if instance_groups:
+                map_instances.update(instance_groups)
+                for instance_group in instance_groups:
+                    group_map.setdefault(instance_group, set()).add(instance_id)
+
+        if group_map:
+            if common_instances := (set(instances.keys()) & set(group_map.keys())):
+                raise ValueError(
+                    f"Found common instance and group ids: {common_instances}"
                 )
-                base_img.set_data_dtype(np.uint16)
-
-            if base_data.ndim != 3:
-                return None, {}, "Invalid base mask shape"
-
-            group_map: Dict[int, Set[int]] = {}
-            map_instances: Set[int] = set()
-            file_instances: Set[int] = set()
-            reverse_map: Dict[Tuple[int, ...], int] = {}
-            for instance_id, instance_groups in instances.items():
-                map_instances.add(instance_id)
-                reverse_map[(instance_id,)] = instance_id
-                if instance_groups:
-                    map_instances.update(instance_groups)
-                    for instance_group in instance_groups:
-                        group_map.setdefault(instance_group, set()).add(instance_id)
-
-            if group_map:
-                if common_instances := (set(instances.keys()) & set(group_map.keys())):
-                    raise ValueError(
-                        f"Found common instance and group ids: {common_instances}"
-                    )
-                for group_id, instance_ids in group_map.items():
-                    reverse_map[tuple(sorted(instance_ids))] = group_id
-
-            base_nz = np.nonzero(base_data)
-            if binary_mask:
-                if files[0] in reverse_masks:
-                    inst = reverse_masks[files[0]][0]
-                    base_data[base_nz] = inst
-                    file_instances.add(inst)
+            for group_id, instance_ids in group_map.items():
+                reverse_map[tuple(sorted(instance_ids))] = group_id
+
+        base_nz = np.nonzero(base_data)
+        if binary_mask:
+            if files[0] in reverse_masks:
+                inst = reverse_masks[files[0]][0]
+                base_data[base_nz] = inst
+                file_instances.add(inst)
+        else:
+            file_instances.update([x.item() for x in np.unique(base_data[base_nz])])
+
+        final_instances: Set[int] = set(file_instances)
+
+        mask_data: List[Tuple[Tuple[np.ndarray, ...], Union[int, np.ndarray]]] = []
+        for file_ in files[1:]:
+            img = nib_load(file_)
+            if not isinstance(img, (Nifti1Image, Nifti2Image)):
+                return None, {}, "Invalid mask type"
+
+            if (img_dtype := img.get_data_dtype()) in (np.uint8, np.uint16):
+                data = np.asanyarray(img.dataobj, dtype=img_dtype)
             else:
-                file_instances.update([x.item() for x in np.unique(base_data[base_nz])])
+                data = np.round(img.get_fdata(caching="unchanged")).astype(np.uint16)
 
-            final_instances: Set[int] = set(file_instances)
+            if data.ndim != 3:
+                return None, {}, "Invalid mask shape"
 
-            mask_data: List[Tuple[Tuple[np.ndarray, ...], Union[int, np.ndarray]]] = []
-            for file_ in files[1:]:
-                img = nib_load(file_)
-                if not isinstance(img, (Nifti1Image, Nifti2Image)):
-                    return None, {}, "Invalid mask type"
+            # Take the non-zero indices of the mask. These are the indices
+            # that we want to merge from the current mask into the base mask.
+            data_nz = np.nonzero(data)
 
-                if (img_dtype := img.get_data_dtype()) in (np.uint8, np.uint16):
-                    data = np.asanyarray(img.dataobj, dtype=img_dtype)
-                else:
-                    data = np.round(img.get_fdata(caching="unchanged")).astype(
-                        np.uint16
-                    )
+            if data_nz[0].size == 0:
+                continue
 
-                if data.ndim != 3:
-                    return None, {}, "Invalid mask shape"
+            if binary_mask:
+                if file_ in reverse_masks:
+                    inst = reverse_masks[file_][0]
+                    mask_data.append((data_nz, inst))
+                    file_instances.add(inst)
+            else:
+                data_nz_data = data[data_nz]
+                mask_data.append((data_nz, data_nz_data))
+                file_instances.update([x.item() for x in np.unique(data_nz_data)])
+
+        for inst in list(file_instances):
+            if inst in group_map:
+                file_instances.update(group_map[inst])
+
+        instance_pool = set(range(1, 65536)) - map_instances - file_instances
+        file_excess: Set[int] = set()
+        map_excess: Set[int] = set()
+
+        if prune_segmentations:
+            if file_excess := file_instances - map_instances:
+                logger.info(
+                    f"Pruning segmentation instances: {file_excess}\n"
+                    + f"Segmentation(s): {files}"
+                )
+                excess_instances = np.array(list(file_excess), dtype=np.uint16)
+                match = np.isin(base_data[base_nz], excess_instances)
+                base_data[base_nz[0][match], base_nz[1][match], base_nz[2][match]] = 0
+                file_instances -= file_excess
+                final_instances -= file_excess
+
+            if map_excess := map_instances - file_instances:
+                logger.info(
+                    f"Pruning segmentMap instances: {map_excess}\n"
+                    + f"Segmentation(s): {files}"
+                )
+                map_instances -= map_excess
+
+        if label_validate and (file_instances != map_instances):
+            raise ValueError(
+                "Instance IDs in segmentation file(s) and segmentMap do not match.\n"
+                + f"Segmentation file(s) have instances: {file_instances} and "
+                + f"segmentMap has instances: {map_instances}\n"
+                + f"Segmentation(s): {files}"
+            )
 
-                # Take the non-zero indices of the mask. These are the indices
-                # that we want to merge from the current mask into the base mask.
-                data_nz = np.nonzero(data)
+        for nzidx, maskv in mask_data:
+            # Take the values of the base mask at the current mask's non-zero
+            # indices. These may be:
+            #   - 0 (no instance),
+            #   - a value from instances (an instance), or
+            #   - another value not in instances (an overlap group).
+            basev = base_data[nzidx]
 
-                if data_nz[0].size == 0:
+            if is_int := isinstance(maskv, int):
+                if maskv in file_excess:  # has been pruned
                     continue
-
-                if binary_mask:
-                    if file_ in reverse_masks:
-                        inst = reverse_masks[file_][0]
-                        mask_data.append((data_nz, inst))
-                        file_instances.add(inst)
-                else:
-                    data_nz_data = data[data_nz]
-                    mask_data.append((data_nz, data_nz_data))
-                    file_instances.update([x.item() for x in np.unique(data_nz_data)])
-
-            for inst in list(file_instances):
-                if inst in group_map:
-                    file_instances.update(group_map[inst])
-
-            instance_pool = set(range(1, 65536)) - map_instances - file_instances
-            file_excess: Set[int] = set()
-            map_excess: Set[int] = set()
-
-            if prune_segmentations:
-                if file_excess := file_instances - map_instances:
-                    logger.info(
-                        f"Pruning segmentation instances: {file_excess}\n"
-                        + f"Segmentation(s): {files}"
-                    )
-                    excess_instances = np.array(list(file_excess), dtype=np.uint16)
-                    match = np.isin(base_data[base_nz], excess_instances)
-                    base_data[
-                        base_nz[0][match], base_nz[1][match], base_nz[2][match]
-                    ] = 0
-                    file_instances -= file_excess
-                    final_instances -= file_excess
-
-                if map_excess := map_instances - file_instances:
-                    logger.info(
-                        f"Pruning segmentMap instances: {map_excess}\n"
-                        + f"Segmentation(s): {files}"
-                    )
-                    map_instances -= map_excess
-
-            if label_validate and (file_instances != map_instances):
-                raise ValueError(
-                    "Instance IDs in segmentation file(s) and segmentMap do not match.\n"
-                    + f"Segmentation file(s) have instances: {file_instances} and "
-                    + f"segmentMap has instances: {map_instances}\n"
-                    + f"Segmentation(s): {files}"
+                unique_pairs, inv = np.unique(basev, return_inverse=True)
+            else:
+                # We identify the unique pairs of base and mask values, and update all
+                # indices that have the same pair at once.
+                unique_pairs, inv = np.unique(
+                    np.column_stack([basev, maskv]), axis=0, return_inverse=True
                 )
+            for idx, unique_idxs in enumerate(unique_pairs):
+                mask_v: int = maskv if is_int else unique_idxs[1].item()  # type: ignore
+                if mask_v in file_excess:  # has been pruned
+                    continue
 
-            for nzidx, maskv in mask_data:
-                # Take the values of the base mask at the current mask's non-zero
-                # indices. These may be:
-                #   - 0 (no instance),
-                #   - a value from instances (an instance), or
-                #   - another value not in instances (an overlap group).
-                basev = base_data[nzidx]
-
-                if is_int := isinstance(maskv, int):
-                    if maskv in file_excess:  # has been pruned
-                        continue
-                    unique_pairs, inv = np.unique(basev, return_inverse=True)
+                base_v: int = (unique_idxs if is_int else unique_idxs[0]).item()
+                mask_instances = group_map.get(mask_v, {mask_v})
+                if base_v == 0:
+                    # No instance, so we can just set the base value to the instance number
+                    group_key = tuple(sorted(mask_instances))
                 else:
-                    # We identify the unique pairs of base and mask values, and update all
-                    # indices that have the same pair at once.
-                    unique_pairs, inv = np.unique(
-                        np.column_stack([basev, maskv]), axis=0, return_inverse=True
-                    )
-                for idx, unique_idxs in enumerate(unique_pairs):
-                    mask_v: int = maskv if is_int else unique_idxs[1].item()  # type: ignore
-                    if mask_v in file_excess:  # has been pruned
+                    # An existing instance or group, so we create a new group with the
+                    # current instance/group and merge it with the overlapping instance/group
+                    base_instances = group_map.get(base_v, {base_v})
+
+                    if base_instances == mask_instances:
                         continue
 
-                    base_v: int = (unique_idxs if is_int else unique_idxs[0]).item()
-                    mask_instances = group_map.get(mask_v, {mask_v})
-                    if base_v == 0:
-                        # No instance, so we can just set the base value to the instance number
-                        group_key = tuple(sorted(mask_instances))
+                    group_instances = base_instances | mask_instances
+                    group_key = tuple(sorted(group_instances))
+                    if group_key in reverse_map:
+                        mask_v = reverse_map[group_key]
                     else:
-                        # An existing instance or group, so we create a new group with the
-                        # current instance/group and merge it with the overlapping instance/group
-                        base_instances = group_map.get(base_v, {base_v})
-
-                        if base_instances == mask_instances:
-                            continue
-
-                        group_instances = base_instances | mask_instances
-                        group_key = tuple(sorted(group_instances))
-                        if group_key in reverse_map:
-                            mask_v = reverse_map[group_key]
-                        else:
-                            mask_v = min(instance_pool)
-                            group_map[mask_v] = group_instances
-
-                    # Determine the indices into the base mask that have the current value pair
-                    midx = inv == idx
-
-                    base_data[nzidx[0][midx], nzidx[1][midx], nzidx[2][midx]] = mask_v
-                    reverse_map[group_key] = mask_v
-                    if mask_v in instance_pool:
-                        instance_pool.remove(mask_v)
-                    if mask_v in group_map:
-                        instance_pool -= group_map[mask_v]
-
-            if mask_data:
-                final_instances = {
-                    x.item() for x in np.unique(base_data[np.nonzero(base_data)])
-                }
-
-            if not final_instances:  # no segmentations
-                return None, {}, None
-
-            if max(final_instances) < 256:
-                base_img.set_data_dtype(np.uint8)
-                base_data = base_data.astype(np.uint8)
-
-            filename = files[0]
-            if (  # base_data or base_img changed
-                binary_mask
-                or file_excess
-                or mask_data
-                or base_img_dtype != base_img.get_data_dtype()
-            ):
-                if isinstance(base_img, Nifti1Image):
-                    new_img = Nifti1Image(base_data, base_img.affine, base_img.header)
-                else:
-                    new_img = Nifti2Image(base_data, base_img.affine, base_img.header)
-
-                dirname = os.path.join(config_path(), "temp", str(uuid4()))
-                os.makedirs(dirname, exist_ok=True)
-                filename = uniquify_path(os.path.join(dirname, "label.nii.gz"))
-                nib_save(new_img, filename)
-
-            segment_map: Dict[int, Optional[List[int]]] = {}
-            for instance in final_instances:
-                if instance in group_map:
-                    for instance_id in group_map[instance]:
-                        groups = segment_map.get(instance_id)
-                        if groups is None:
-                            groups = []
-                            segment_map[instance_id] = groups
-                        groups.append(instance)
-                elif instance not in segment_map:
-                    segment_map[instance] = None
-
-            return (filename, segment_map, None)
-
-        except Exception as error:
-            return None, {}, str(error)
+                        mask_v = min(instance_pool)
+                        group_map[mask_v] = group_instances
+
+                # Determine the indices into the base mask that have the current value pair
+                midx = inv == idx
+
+                base_data[nzidx[0][midx], nzidx[1][midx], nzidx[2][midx]] = mask_v
+                reverse_map[group_key] = mask_v
+                if mask_v in instance_pool:
+                    instance_pool.remove(mask_v)
+                if mask_v in group_map:
+                    instance_pool -= group_map[mask_v]
+
+        if mask_data:
+            final_instances = {
+                x.item() for x in np.unique(base_data[np.nonzero(base_data)])
+            }
+
+        if not final_instances:  # no segmentations
+            return None, {}, None
+
+        if max(final_instances) < 256:
+            base_img.set_data_dtype(np.uint8)
+            base_data = base_data.astype(np.uint8)
+
+        filename = files[0]
+        if (  # base_data or base_img changed
+            binary_mask
+            or file_excess
+            or mask_data
+            or base_img_dtype != base_img.get_data_dtype()
+        ):
+            if isinstance(base_img, Nifti1Image):
+                new_img = Nifti1Image(base_data, base_img.affine, base_img.header)
+            else:
+                new_img = Nifti2Image(base_data, base_img.affine, base_img.header)
+
+            dirname = os.path.join(config_path(), "temp", str(uuid4()))
+            os.makedirs(dirname, exist_ok=True)
+            filename = uniquify_path(os.path.join(dirname, "label.nii.gz"))
+            nib_save(new_img, filename)
+
+        segment_map: Dict[int, Optional[List[int]]] = {}
+        for instance in final_instances:
+            if instance in group_map:
+                for instance_id in group_map[instance]:
+                    groups = segment_map.get(instance_id)
+                    if groups is None:
+                        groups = []
+                        segment_map[instance_id] = groups
+                    groups.append(instance)
+            elif instance not in segment_map:
+                segment_map[instance] = None
+
+        return (filename, segment_map, None)
+
+    except Exception as error:
+        return None, {}, str(error)
+
+
+async def process_upload(
+    files: Union[str, List[str]],
+    instances: Dict[int, Optional[List[int]]],
+    binary_mask: bool,
+    png_mask: bool,
+    masks: Dict[str, str],
+    label_validate: bool = False,
+    prune_segmentations: bool = False,
+) -> Tuple[Optional[str], Dict[int, Optional[List[int]]], Optional[str]]:
+    """Process nifti upload files."""
+    async with semaphore:
+        return await run_in_thread(
+            _process_upload,
+            files,
+            instances,
+            binary_mask,
+            png_mask,
+            masks,
+            label_validate,
+            prune_segmentations,
+        )
+
+
+def series_content_hash(series_dir: str) -> str:
+    """Hash the names and contents of all files in a series directory."""
+    sha256 = hashlib.sha256()
+    for file_name in sorted(os.listdir(series_dir)):
+        file_path = os.path.join(series_dir, file_name)
+        if not os.path.isfile(file_path):
+            continue
+        sha256.update(file_name.encode())
+        with open(file_path, "rb") as file_:
+            while chunk := file_.read(1024 * 1024):
+                sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def convert_dicom_series_to_nifti(
+    series_dir: str, output_file: str, cache_size: int = 0
+) -> str:
+    """Convert a DICOM series to NIfTI (process pool worker).
+
+    With a positive ``cache_size`` (``config.dcm2nii_cache_size``), converted
+    volumes are cached by series content, up to ``cache_size`` bytes.
+    """
+    from dicom2nifti import settings, dicom_series_to_nifti  # type: ignore
+
+    if cache_size <= 0:
+        settings.disable_validate_slice_increment()
+        return dicom_series_to_nifti(series_dir, output_file)["NII_FILE"]
+
+    cache_dir = os.path.join(config_path(), "cache", "dcm2nii")
+    os.makedirs(cache_dir, exist_ok=True)
+    cache_file = os.path.join(cache_dir, series_content_hash(series_dir) + ".nii.gz")
+
+    if os.path.isfile(cache_file):
+        logger.debug(f"Using cached NIfTI volume for {series_dir}")
+        os.utime(cache_file)
+        shutil.copyfile(cache_file, output_file)
+        return output_file
+
+    settings.disable_validate_slice_increment()
+    output_file = dicom_series_to_nifti(series_dir, output_file)["NII_FILE"]
+
+    temp_file = f"{cache_file}.{uuid4()}"
+    shutil.copyfile(output_file, temp_file)
+    os.replace(temp_file, cache_file)
+
+    cached = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".nii.gz"):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            cached.append((stat.st_mtime, stat.st_size, entry.path))
+
+    # evict the least recently used volumes
+    cached.sort()
+    total_size = sum(size for _, size, _ in cached)
+    for _, size, path in cached:
+        if total_size <= cache_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
+
+    return output_file
@@ -1,11 +1,11 @@
 """Utilities for working with event objects."""
 
-import json
 from typing import List, Dict
 
 from typing import Optional
 
 from redbrick.common.enums import TaskEventTypes
+from redbrick.utils.json_codec import json_loads
 from redbrick.utils.rb_label_utils import clean_rb_label, flat_rb_format, user_format
 
 
@@ -113,7 +113,7 @@ def task_event_format(
                 else:
                     labels = [
                         clean_rb_label(label)
-                        for label in json.loads(task_data.get("labelsData") or "[]")
+                        for label in json_loads(task_data.get("labelsData") or "[]")
                     ]
                     labels_data_path = None
                 label_storage_id = task_data["labelsStorage"]["storageId"]
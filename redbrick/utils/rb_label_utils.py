@@ -2,13 +2,14 @@
 
 import os
 from typing import Any, Dict, List, Optional, Sequence, Union
-import json
+from json import JSONDecodeError
 from copy import deepcopy
 
 from redbrick.common.storage import StorageMethod
 from redbrick.stage import ReviewStage
 from redbrick.types import task as TaskType
 from redbrick.types.taxonomy import Taxonomy
+from redbrick.utils.json_codec import json_loads
 from redbrick.utils.logging import logger
 
 
@@ -29,22 +30,22 @@ def user_format(
 
     users = users or {}
     if isinstance(user, dict):
-        return (
-            user_format(
-                user["userId"],
-                {
-                    **{
-                        user["userId"]: (  # type: ignore
-                            user.get("givenName")
-                            if user["userId"].startswith("API:")
-                            else user.get("email")
-                        )
-                    },
-                    **users,
-                },
-            )
-            if user.get("userId")
-            else None
+        user_id: Optional[str] = user.get("userId")
+        if not user_id:
+            return None
+        return user_format(
+            user_id,
+            {
+                user_id: (  # type: ignore
+                    users[user_id]
+                    if user_id in users
+                    else (
+                        user.get("givenName")
+                        if user_id.startswith("API:")
+                        else user.get("email")
+                    )
+                )
+            },
         )
 
     if user.startswith("RB:"):
@@ -104,7 +105,7 @@ def from_rb_task_data(task_data: Dict) -> Dict:
     else:
         labels = [
             clean_rb_label(label)
-            for label in json.loads(task_data.get("labelsData") or "[]")
+            for label in json_loads(task_data.get("labelsData") or "[]")
         ]
         labels_data_path = None
     return {
@@ -181,7 +182,7 @@ def flat_rb_format(
     labels_map: Sequence[Optional[Dict]],
     series_info: Optional[List[Dict]],
     meta_data: Optional[Dict],
-    storage_id: str,
+    storage_id: Optional[str],
     label_storage_id: Optional[str],
     current_stage_sub_task: Optional[Dict],
     heat_maps: Optional[List[Dict]],
@@ -271,7 +272,7 @@ def clean_centerline(centerline_data: Dict) -> TaskType.Centerline:
     """Clean centerline."""
     return {
         "name": centerline_data["name"],
-        "centerline": json.loads(centerline_data["centerline"]),
+        "centerline": json_loads(centerline_data["centerline"]),
     }
 
 
@@ -282,7 +283,7 @@ def parse_entry_latest(item: Dict) -> Dict:
         task_id = item["taskId"]
         task_data = item["latestTaskData"] or {}
         datapoint = item["datapoint"]
-        items = datapoint["items"]
+        items = datapoint.get("items", []) or []
         items_presigned = datapoint.get("itemsPresigned", []) or []
         name = datapoint["name"]
         created_by = (datapoint.get("createdByEntity", {}) or {}).get("email")
@@ -296,11 +297,11 @@ def parse_entry_latest(item: Dict) -> Dict:
         else:
             labels = [
                 clean_rb_label(label)
-                for label in json.loads(task_data.get("labelsData") or "[]")
+                for label in json_loads(task_data.get("labelsData") or "[]")
             ]
             labels_data_path = None
 
-        storage_id = datapoint["storageMethod"]["storageId"]
+        storage_id = (datapoint.get("storageMethod") or {}).get("storageId")
         label_storage_id = (task_data.get("labelsStorage") or {}).get(
             "storageId"
         ) or StorageMethod.REDBRICK
@@ -308,7 +309,7 @@ def parse_entry_latest(item: Dict) -> Dict:
         transforms = datapoint.get("transforms")
         centerlines = datapoint.get("centerline")
         if datapoint.get("attributes"):
-            datapoint_attributes = json.loads(datapoint["attributes"])
+            datapoint_attributes = json_loads(datapoint["attributes"])
         else:
             datapoint_attributes = None
 
@@ -327,7 +328,7 @@ def parse_entry_latest(item: Dict) -> Dict:
             item["priority"],
             task_data.get("labelsMap", []) or [],
             datapoint.get("seriesInfo"),
-            json.loads(datapoint["metaData"]) if datapoint.get("metaData") else None,
+            json_loads(datapoint["metaData"]) if datapoint.get("metaData") else None,
             storage_id,
             label_storage_id,
             item.get("currentStageSubTask"),
@@ -336,7 +337,7 @@ def parse_entry_latest(item: Dict) -> Dict:
             centerlines,
             datapoint_attributes,
         )
-    except (AttributeError, KeyError, TypeError, json.decoder.JSONDecodeError):
+    except (AttributeError, KeyError, TypeError, JSONDecodeError):
         return {}
 
 
@@ -787,7 +788,7 @@ def dicom_rb_format(
 
     if task.get("metaData"):
         output["metaData"] = (
-            json.loads(task["metaData"])
+            json_loads(task["metaData"])
             if isinstance(task["metaData"], str)
             else task["metaData"]
         )
@@ -811,7 +812,7 @@ def dicom_rb_format(
 
         series_meta_data = series_info.get("metaData")
         if isinstance(series_meta_data, str):
-            series["metaData"] = json.loads(series_meta_data)
+            series["metaData"] = json_loads(series_meta_data)
 
         series["items"] = []
         for item_index in series_info["itemsIndices"]:
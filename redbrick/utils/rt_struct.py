@@ -1,7 +1,10 @@
 """DICOM RT Struct utils."""
 
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
-from asyncio import BoundedSemaphore
+import os
+import copy
+import asyncio
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy  # type: ignore
 from nibabel.loadsave import load as nib_load  # type: ignore
@@ -10,11 +13,124 @@ from nibabel.nifti2 import Nifti2Image  # type: ignore
 from rt_utils import RTStructBuilder  # type: ignore
 
 from redbrick.types.taxonomy import ObjectType
+from redbrick.utils.async_utils import run_in_process, run_in_thread
 from redbrick.utils.logging import log_error, logger
 from redbrick.types.task import SegmentMap as TypeSegmentMap
 
 
-semaphore = BoundedSemaphore(1)
+def load_label_volume(nifti_file: str) -> Optional[numpy.ndarray]:
+    """Load a 3D NIfTI label volume as integers, in RT-Struct (row, col, slice) order."""
+    img = nib_load(nifti_file)
+    if not isinstance(img, (Nifti1Image, Nifti2Image)):
+        return None
+
+    data = numpy.asanyarray(img.dataobj)
+    if data.ndim != 3:
+        return None
+
+    if not numpy.issubdtype(data.dtype, numpy.integer):
+        data = numpy.round(data)
+
+    return numpy.ascontiguousarray(data.astype(numpy.uint16, copy=False).swapaxes(0, 1))
+
+
+def instance_indices(data: numpy.ndarray) -> Dict[int, numpy.ndarray]:
+    """Group flat voxel indices of every non-zero instance in a single pass."""
+    flat = data.ravel()
+    nonzero = numpy.flatnonzero(flat)
+    values = flat[nonzero]
+    order = numpy.argsort(values, kind="stable")
+    instances, starts = numpy.unique(values[order], return_index=True)
+    return {
+        int(instance): indices
+        for instance, indices in zip(instances, numpy.split(nonzero[order], starts[1:]))
+    }
+
+
+def roi_contours(
+    indices: numpy.ndarray,
+    shape: Tuple[int, int, int],
+    transformation_matrix: numpy.ndarray,
+) -> List[Tuple[int, List[List[float]]]]:
+    """Generate patient space contours for an ROI, per slice (process pool worker)."""
+    # pylint: disable=import-outside-toplevel, too-many-locals, unbalanced-tuple-unpacking
+    from rt_utils.image_helper import (  # type: ignore
+        apply_transformation_to_3d_points,
+        find_mask_contours,
+    )
+
+    if indices.size == 0:
+        return []
+
+    rows, cols, slices = numpy.unravel_index(indices, shape)
+    # Crop to the ROI bounding box with a 1 voxel margin so that border contours match
+    row_min, col_min = max(int(rows.min()) - 1, 0), max(int(cols.min()) - 1, 0)
+    mask = numpy.zeros(
+        (int(rows.max()) + 2 - row_min, int(cols.max()) + 2 - col_min, shape[2]),
+        dtype=numpy.uint8,
+    )
+    mask[rows - row_min, cols - col_min, slices] = 1
+
+    series_contours: List[Tuple[int, List[List[float]]]] = []
+    for slice_idx in numpy.unique(slices):
+        contours, _ = find_mask_contours(mask[:, :, slice_idx], True)
+        formatted_contours: List[List[float]] = []
+        for contour in contours:
+            points = numpy.array(contour, dtype=numpy.float64) + (col_min, row_min)
+            points = numpy.concatenate(
+                (points, numpy.full((len(points), 1), slice_idx)), axis=1
+            )
+            formatted_contours.append(
+                numpy.ravel(
+                    apply_transformation_to_3d_points(points, transformation_matrix)
+                ).tolist()
+            )
+        series_contours.append((int(slice_idx), formatted_contours))
+
+    return series_contours
+
+
+def add_roi_contours(
+    rtstruct: Any,
+    contours: List[Tuple[int, List[List[float]]]],
+    name: str,
+    color: Optional[Union[str, List[int]]] = None,
+    description: str = "",
+) -> None:
+    """Add an ROI with precomputed contours to the rtstruct."""
+    # pylint: disable=import-outside-toplevel
+    from pydicom.dataset import Dataset
+    from pydicom.sequence import Sequence
+    from rt_utils import ds_helper  # type: ignore
+    from rt_utils.utils import ROIData  # type: ignore
+
+    roi_data = ROIData(
+        None,
+        color,  # type: ignore
+        len(rtstruct.ds.StructureSetROISequence) + 1,
+        name,
+        rtstruct.frame_of_reference_uid,
+        description,
+    )
+
+    roi_contour = Dataset()
+    roi_contour.ROIDisplayColor = roi_data.color
+    roi_contour.ContourSequence = Sequence(
+        [
+            ds_helper.create_contour(rtstruct.series_data[slice_idx], contour_data)
+            for slice_idx, slice_contours in contours
+            for contour_data in slice_contours
+        ]
+    )
+    roi_contour.ReferencedROINumber = str(roi_data.number)
+
+    rtstruct.ds.ROIContourSequence.append(roi_contour)
+    rtstruct.ds.StructureSetROISequence.append(
+        ds_helper.create_structure_set_roi(roi_data)
+    )
+    rtstruct.ds.RTROIObservationsSequence.append(
+        ds_helper.create_rtroi_observation(roi_data)
+    )
 
 
 async def convert_nii_to_rt_struct(
@@ -27,104 +143,120 @@ async def convert_nii_to_rt_struct(
 ) -> Tuple[Optional[Any], TypeSegmentMap]:
     """Convert nifti mask to dicom rt-struct."""
     # pylint: disable=too-many-locals, too-many-branches, too-many-statements
-    async with semaphore:
-        try:
-            category_map = {
-                category.get("category", ""): (
-                    int(category.get("classId", -1)),
-                    category.get("color", ""),
-                    category.get("parents", []) or [],
+    # pylint: disable=import-outside-toplevel
+    from rt_utils.image_helper import (  # type: ignore
+        get_pixel_to_patient_transformation_matrix,
+    )
+
+    try:
+        category_map = {
+            category.get("category", ""): (
+                int(category.get("classId", -1)),
+                category.get("color", ""),
+                category.get("parents", []) or [],
+            )
+            for category in categories
+        }
+        rtstruct = await run_in_thread(RTStructBuilder.create_new, dicom_series_path)
+        rtstruct.ds.InstitutionName = "RedBrick AI"
+        rtstruct.ds.Manufacturer = "RedBrick AI"
+        rtstruct.ds.ManufacturerModelName = "redbrick-sdk"
+        transformation_matrix = get_pixel_to_patient_transformation_matrix(
+            rtstruct.series_data
+        )
+
+        new_segment_map: TypeSegmentMap = {}
+        for nifti_file in nifti_files:
+            data = await run_in_thread(load_label_volume, nifti_file)
+            if data is None:
+                return None, {}
+
+            shape: Tuple[int, int, int] = data.shape  # type: ignore
+            if shape[2] != len(rtstruct.series_data):
+                raise ValueError(
+                    "Mask must have the same number of slices as the series. "
+                    + f"Expected {len(rtstruct.series_data)}, got {shape[2]}"
                 )
-                for category in categories
-            }
-            rtstruct = RTStructBuilder.create_new(dicom_series_path=dicom_series_path)
-            rtstruct.ds.InstitutionName = "RedBrick AI"
-            rtstruct.ds.Manufacturer = "RedBrick AI"
-            rtstruct.ds.ManufacturerModelName = "redbrick-sdk"
-
-            new_segment_map: TypeSegmentMap = {}
-            for nifti_file in nifti_files:
-                img: Nifti1Image = nib_load(nifti_file)  # type: ignore
-
-                if not isinstance(img, Nifti1Image) and not isinstance(
-                    img, Nifti2Image
-                ):
-                    return None, {}
-
-                # Load NIfTI file
-                data = img.get_fdata(caching="unchanged")
-                data = numpy.round(data).astype(numpy.uint16)  # type: ignore
-
-                if data.ndim != 3:
-                    return None, {}
-
-                data = data.swapaxes(0, 1)
-                unique_instances: Set[int] = set(numpy.unique(data))
-                if 0 in unique_instances:
-                    unique_instances.remove(0)
-
-                if binary_mask:
-                    unique_instances = {
-                        int(nifti_file.replace(".nii.gz", "").rsplit("-")[-1])
-                    }
-
-                cat: Optional[Union[str, Dict]] = None
-                category: Optional[str] = None
-                segment_remap: Dict[str, Union[str, Dict]] = {}
-                if semantic_mask:
-                    new_data = numpy.zeros_like(data)
-                    for instance in unique_instances:
-                        cat = segment_map.get(str(instance))  # type: ignore
-                        category = cat.get("category") if isinstance(cat, dict) else cat
-                        if not (
-                            category
-                            and category_map.get(category)
-                            and category_map[category][0] >= 0
-                        ):
-                            continue
-
-                        new_instance = category_map[category][0] + 1
-                        if binary_mask:
-                            new_data[data != 0] = new_instance
-                        else:
-                            new_data[data == instance] = new_instance
-                        if str(new_instance) not in segment_remap:
-                            segment_remap[str(new_instance)] = cat  # type: ignore
-
-                    data = new_data
-                    unique_instances.clear()
-                    unique_instances.update({int(new_key) for new_key in segment_remap})
-
-                for instance in unique_instances:
-                    kwargs = {}
-                    cat = segment_remap.get(str(instance), segment_map.get(str(instance)))  # type: ignore
+            indices_map = await run_in_thread(instance_indices, data)
+            del data
+
+            if binary_mask:
+                indices_map = {
+                    int(nifti_file.replace(".nii.gz", "").rsplit("-")[-1]): (
+                        numpy.sort(numpy.concatenate(list(indices_map.values())))
+                        if indices_map
+                        else numpy.array([], dtype=numpy.intp)
+                    )
+                }
+
+            cat: Optional[Union[str, Dict]] = None
+            category: Optional[str] = None
+            segment_remap: Dict[str, Union[str, Dict]] = {}
+            if semantic_mask:
+                semantic_indices: Dict[int, List[numpy.ndarray]] = {}
+                for instance in sorted(indices_map):
+                    cat = segment_map.get(str(instance))  # type: ignore
                     category = cat.get("category") if isinstance(cat, dict) else cat
-                    roi_name = (
+                    if not (
                         category
-                        if category and semantic_mask
-                        else f"Segment_{instance}"
+                        and category_map.get(category)
+                        and category_map[category][0] >= 0
+                    ):
+                        continue
+
+                    new_instance = category_map[category][0] + 1
+                    semantic_indices.setdefault(new_instance, []).append(
+                        indices_map[instance]
                     )
-                    if cat:
-                        new_segment_map[roi_name] = cat  # type: ignore
+                    if str(new_instance) not in segment_remap:
+                        segment_remap[str(new_instance)] = cat  # type: ignore
+
+                indices_map = {
+                    new_instance: numpy.sort(numpy.concatenate(indices_list))
+                    for new_instance, indices_list in semantic_indices.items()
+                }
+
+            # empty ROIs have no contours to add
+            indices_map = {
+                instance: indices
+                for instance, indices in indices_map.items()
+                if indices.size
+            }
 
-                    if category and category_map.get(category):
-                        selected_cat = category_map[category]
-                        kwargs["color"] = selected_cat[1]
-                        kwargs["description"] = (
-                            f"{selected_cat[0]} - "
-                            + "".join((parent + "/") for parent in selected_cat[2])
-                            + category
-                        )
+            rois: List[Tuple[str, Dict[str, Any]]] = []
+            for instance in indices_map:
+                kwargs: Dict[str, Any] = {}
+                cat = segment_remap.get(str(instance), segment_map.get(str(instance)))  # type: ignore
+                category = cat.get("category") if isinstance(cat, dict) else cat
+                roi_name = (
+                    category if category and semantic_mask else f"Segment_{instance}"
+                )
+                if cat:
+                    new_segment_map[roi_name] = cat  # type: ignore
+
+                if category and category_map.get(category):
+                    selected_cat = category_map[category]
+                    kwargs["color"] = selected_cat[1]
+                    kwargs["description"] = (
+                        f"{selected_cat[0]} - "
+                        + "".join((parent + "/") for parent in selected_cat[2])
+                        + category
+                    )
+                rois.append((roi_name, kwargs))
 
-                    if binary_mask:
-                        rtstruct.add_roi(mask=data != 0, name=roi_name, **kwargs)
-                    else:
-                        rtstruct.add_roi(mask=data == instance, name=roi_name, **kwargs)
+            contours_list = await asyncio.gather(
+                *(
+                    run_in_process(roi_contours, indices, shape, transformation_matrix)
+                    for indices in indices_map.values()
+                )
+            )
+            for (roi_name, kwargs), contours in zip(rois, contours_list):
+                add_roi_contours(rtstruct, contours, roi_name, **kwargs)
 
-            return rtstruct, new_segment_map
-        except Exception as error:  # pylint: disable=broad-exception-caught
-            log_error(error)
-            return None, {}
+        return rtstruct, new_segment_map
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        log_error(error)
+        return None, {}
 
 
 def merge_rtstructs(rtstruct1: Any, rtstruct2: Any) -> Any:
@@ -178,6 +310,135 @@ def merge_rtstructs(rtstruct1: Any, rtstruct2: Any) -> Any:
     return rtstruct2
 
 
+def _series_signature(dicom_series_path: str) -> Tuple[Tuple[str, int, int], ...]:
+    """Get the path, size and modification time of all files in a DICOM series."""
+    signature = []
+    for root, _, files in os.walk(dicom_series_path):
+        for file in files:
+            file_path = os.path.join(root, file)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            signature.append((file_path, stat.st_size, stat.st_mtime_ns))
+    return tuple(sorted(signature))
+
+
+def _load_series_headers(
+    dicom_series_path: str, signature: Tuple[Tuple[str, int, int], ...]
+) -> List[Any]:
+    """Load sorted image headers of a DICOM series."""
+    # pylint: disable=import-outside-toplevel, unused-argument
+    from pydicom import dcmread
+    from rt_utils.image_helper import get_slice_position  # type: ignore
+
+    series_data = []
+    for root, _, files in os.walk(dicom_series_path):
+        for file in files:
+            try:
+                dataset = dcmread(os.path.join(root, file), stop_before_pixels=True)
+            except Exception:  # pylint: disable=broad-except
+                continue
+            if "Rows" in dataset and "ImagePositionPatient" in dataset:
+                series_data.append(dataset)
+
+    if not series_data:
+        raise Exception("No DICOM Images found in input path")
+
+    series_data.sort(key=get_slice_position)
+    return series_data
+
+
+_cached_series_headers = lru_cache(maxsize=4)(_load_series_headers)
+
+
+def load_series_headers(dicom_series_path: str) -> List[Any]:
+    """Load sorted image headers of a DICOM series.
+
+    Headers are cached until any file of the series changes, and copies of the
+    cached headers are returned, so callers may modify them.
+    """
+    dicom_series_path = os.path.abspath(dicom_series_path)
+    return copy.deepcopy(
+        _cached_series_headers(dicom_series_path, _series_signature(dicom_series_path))
+    )
+
+
+def load_rt_struct(dicom_series_path: str, rt_struct_file: str) -> Any:
+    """Load an existing rt-struct for a DICOM series using cached series headers."""
+    # pylint: disable=import-outside-toplevel
+    from pydicom import dcmread
+    from rt_utils import RTStruct  # type: ignore
+
+    series_data = load_series_headers(dicom_series_path)
+    dataset = dcmread(rt_struct_file)
+    RTStructBuilder.validate_rtstruct(dataset)
+    RTStructBuilder.validate_rtstruct_series_references(dataset, series_data)
+    return RTStruct(series_data, dataset)
+
+
+def roi_slice_contours(rt_struct: Any, name: str) -> Dict[int, List[numpy.ndarray]]:
+    """Get contour data of an ROI grouped by series slice index."""
+    # pylint: disable=import-outside-toplevel
+    from rt_utils import RTStruct, ds_helper  # type: ignore
+
+    roi_number = next(
+        (
+            structure_roi.ROINumber
+            for structure_roi in rt_struct.ds.StructureSetROISequence
+            if structure_roi.ROIName == name
+        ),
+        None,
+    )
+    if roi_number is None:
+        raise RTStruct.ROIException(f"ROI of name `{name}` does not exist in RTStruct")
+
+    slice_index = {
+        series_slice.SOPInstanceUID: idx
+        for idx, series_slice in enumerate(rt_struct.series_data)
+    }
+    slice_contours: Dict[int, List[numpy.ndarray]] = {}
+    for contour in ds_helper.get_contour_sequence_by_roi_number(
+        rt_struct.ds, roi_number
+    ):
+        for contour_image in contour.ContourImageSequence:
+            idx = slice_index.get(contour_image.ReferencedSOPInstanceUID)
+            if idx is not None:
+                slice_contours.setdefault(idx, []).append(
+                    numpy.asarray(contour.ContourData, dtype=numpy.float64)
+                )
+
+    return slice_contours
+
+
+def roi_mask_slices(
+    slice_contours: Dict[int, List[numpy.ndarray]],
+    transformation_matrix: numpy.ndarray,
+    slice_shape: Tuple[int, int],
+) -> Tuple[List[int], numpy.ndarray]:
+    """Rasterize ROI contours into bit-packed slice masks (process pool worker)."""
+    # pylint: disable=import-outside-toplevel, no-member
+    import cv2  # type: ignore
+    from rt_utils.image_helper import apply_transformation_to_3d_points  # type: ignore
+
+    slice_indices = sorted(slice_contours)
+    masks = numpy.zeros((len(slice_indices), *slice_shape), dtype=numpy.uint8)
+    for pos, slice_idx in enumerate(slice_indices):
+        polygons = []
+        for contour_coords in slice_contours[slice_idx]:
+            translated = apply_transformation_to_3d_points(
+                contour_coords.reshape(-1, 3), transformation_matrix
+            )
+            polygons.append(
+                numpy.array(
+                    [numpy.around([translated[:, :2]]).astype(numpy.int32)]
+                ).squeeze()
+            )
+        cv2.fillPoly(img=masks[pos], pts=polygons, color=1)
+
+    return slice_indices, numpy.packbits(masks)
+
+
 async def convert_rt_struct_to_nii(
     rt_struct_files: List[str],
     dicom_series_path: str,
@@ -186,68 +447,89 @@ async def convert_rt_struct_to_nii(
     categories: List[ObjectType],
 ) -> Tuple[Optional[Any], TypeSegmentMap]:
     """Convert dicom rt-struct to nifti mask."""
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-locals, import-outside-toplevel
+    from rt_utils.image_helper import (  # type: ignore
+        get_patient_to_pixel_transformation_matrix,
+    )
+
     if not rt_struct_files:
         log_error("No segmentations found")
         return None, {}
 
-    async with semaphore:
-        rt_struct = RTStructBuilder.create_from(dicom_series_path, rt_struct_files[0])
-        for rt_struct_file in rt_struct_files[1:]:
-            rt_struct = merge_rtstructs(
-                rt_struct,
-                RTStructBuilder.create_from(dicom_series_path, rt_struct_file),
-            )
-
-        roi_names = set(rt_struct.get_roi_names())
-
-        for name in set(segment_map.keys()):
-            if name not in roi_names:
-                del segment_map[name]
-
-        misses = roi_names - set(segment_map.keys())  # type: ignore
-        if misses:
-            logger.warning(
-                f"Following ROI names are present in the file, but not in segmentMap: {misses}"
-            )
+    rt_struct = await run_in_thread(
+        load_rt_struct, dicom_series_path, rt_struct_files[0]
+    )
+    for rt_struct_file in rt_struct_files[1:]:
+        rt_struct = merge_rtstructs(
+            rt_struct,
+            await run_in_thread(load_rt_struct, dicom_series_path, rt_struct_file),
+        )
 
-        if label_validate:
-            category_names = {cat["category"] for cat in categories}
-            for cat in segment_map.values():
-                if isinstance(cat, dict):
-                    cat = cat.get("category")  # type: ignore
-                if cat not in category_names:
-                    log_error(
-                        f"ROI '{cat}' of labelType SEGMENTATION is not present in the taxonomy"
-                    )
-                    return None, {}
+    roi_names = set(rt_struct.get_roi_names())
 
-        new_segment_map: TypeSegmentMap = {}
-        dtype = numpy.uint16 if len(roi_names) >= 250 else numpy.uint8
+    for name in set(segment_map.keys()):
+        if name not in roi_names:
+            del segment_map[name]
 
-        nii_mask = numpy.zeros(
-            (
-                rt_struct.series_data[0].Columns,
-                rt_struct.series_data[0].Rows,
-                len(rt_struct.series_data),
-            ),
-            dtype,
+    misses = roi_names - set(segment_map.keys())  # type: ignore
+    if misses:
+        logger.warning(
+            f"Following ROI names are present in the file, but not in segmentMap: {misses}"
         )
 
-        for idx, name in enumerate(segment_map.keys()):
-            if name not in roi_names:
-                continue
+    if label_validate:
+        category_names = {cat["category"] for cat in categories}
+        for cat in segment_map.values():
+            if isinstance(cat, dict):
+                cat = cat.get("category")  # type: ignore
+            if cat not in category_names:
+                log_error(
+                    f"ROI '{cat}' of labelType SEGMENTATION is not present in the taxonomy"
+                )
+                return None, {}
+
+    new_segment_map: TypeSegmentMap = {}
+    dtype = numpy.uint16 if len(roi_names) >= 250 else numpy.uint8
+    slice_shape = (
+        int(rt_struct.series_data[0].Columns),
+        int(rt_struct.series_data[0].Rows),
+    )
+    nii_mask = numpy.zeros((*slice_shape, len(rt_struct.series_data)), dtype)
+    transformation_matrix = get_patient_to_pixel_transformation_matrix(
+        rt_struct.series_data
+    )
+
+    async def rasterize(name: str) -> Tuple[List[int], numpy.ndarray]:
+        return await run_in_process(
+            roi_mask_slices,
+            roi_slice_contours(rt_struct, name),
+            transformation_matrix,
+            slice_shape,
+        )
 
-            try:
-                roi_mask = rt_struct.get_roi_mask_by_name(name)
-            except Exception as error:  # pylint: disable=broad-except
-                logger.warning(f"Error processing mask for ROI: {name} - {error}")
-                continue
+    names = list(segment_map.keys())
+    roi_masks = await asyncio.gather(
+        *(rasterize(str(name)) for name in names), return_exceptions=True
+    )
 
-            new_segment_map[str(idx + 1)] = segment_map[name]
-            nii_mask[roi_mask] = idx + 1
+    for idx, (name, roi_mask) in enumerate(zip(names, roi_masks)):
+        if isinstance(roi_mask, BaseException):
+            logger.warning(f"Error processing mask for ROI: {name} - {roi_mask}")
+            continue
 
-        return (
-            Nifti1Image(nii_mask.swapaxes(0, 1), numpy.diag([-1, -1, 1, 1])),
-            new_segment_map,
+        slice_indices, packed = roi_mask
+        masks = (
+            numpy.unpackbits(
+                packed, count=len(slice_indices) * slice_shape[0] * slice_shape[1]
+            )
+            .reshape((len(slice_indices), *slice_shape))
+            .astype(bool)
         )
+        for slice_idx, mask in zip(slice_indices, masks):
+            nii_mask[:, :, slice_idx][mask] = idx + 1
+        new_segment_map[str(idx + 1)] = segment_map[name]
+
+    return (
+        Nifti1Image(nii_mask.swapaxes(0, 1), numpy.diag([-1, -1, 1, 1])),
+        new_segment_map,
+    )
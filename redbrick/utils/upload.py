@@ -4,7 +4,7 @@ import json
 import os
 import shutil
 from uuid import uuid4
-from typing import List, Dict, Tuple, TypeVar, Union, Optional, Sequence
+from typing import Any, Callable, List, Dict, Tuple, TypeVar, Union, Optional, Sequence
 from urllib.parse import urlparse
 
 import aiohttp
@@ -13,7 +13,7 @@ from redbrick.common.constants import LABELS_ARRAY_LIMIT
 from redbrick.common.context import RBContext
 from redbrick.common.storage import StorageMethod
 from redbrick.types.taxonomy import Taxonomy
-from redbrick.types.task import InputTask, OutputTask
+from redbrick.types.task import HeatMap, InputTask, OutputTask
 from redbrick.utils.common_utils import config_path
 from redbrick.utils.files import (
     NIFTI_FILE_TYPES,
@@ -27,6 +27,75 @@ from redbrick.utils.logging import log_error, logger
 T = TypeVar("T", InputTask, OutputTask)
 
 
+def _is_str_list(value: object) -> bool:
+    """Check if value is a non-empty list of non-empty strings."""
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(isinstance(val, str) and val for val in value)
+    )
+
+
+def _is_series_info(value: object) -> bool:
+    """Check if value is a list of series info, with item indices and names."""
+    return isinstance(value, list) and all(
+        isinstance(series, dict)
+        and set(series).issubset({"name", "itemsIndices", "dataType"})
+        and isinstance(series.get("name", ""), str)
+        and isinstance(series.get("dataType", ""), str)
+        and isinstance(series.get("itemsIndices"), list)
+        and all(
+            isinstance(idx, int) and not isinstance(idx, bool) and idx >= 0
+            for idx in series["itemsIndices"]
+        )
+        for series in value
+    )
+
+
+def _is_heat_maps(value: object) -> bool:
+    """Check if value is a list of heat maps, with a file and optional settings."""
+    return isinstance(value, list) and all(
+        isinstance(heat_map, dict)
+        and set(heat_map).issubset(HeatMap.__annotations__)
+        and isinstance(heat_map.get("item"), str)
+        and isinstance(heat_map.get("name", ""), str)
+        for heat_map in value
+    )
+
+
+# Labels (labels, labelsMap, segmentMap etc.) are always validated by the server
+IMPORT_FORMAT_VALIDATORS: Dict[str, Callable[[Any], bool]] = {
+    "name": lambda value: isinstance(value, str) and bool(value),
+    "items": _is_str_list,
+    "seriesInfo": _is_series_info,
+    "heatMaps": _is_heat_maps,
+    "priority": lambda value: isinstance(value, (int, float))
+    and not isinstance(value, bool)
+    and 0 <= value <= 1,
+    "metaData": lambda value: isinstance(value, dict)
+    and all(
+        isinstance(key, str) and isinstance(val, str) for key, val in value.items()
+    ),
+}
+
+
+def is_import_format(task: Dict) -> bool:
+    """Check if a task is already in the import format, needing no server conversion.
+
+    Only tasks with a flat list of ``items`` and known, well typed fields qualify.
+    Tasks with labels, ``series``, ``segmentations`` etc. still need to be converted.
+    """
+    return (
+        isinstance(task, dict)
+        and "name" in task
+        and "items" in task
+        and all(
+            key in IMPORT_FORMAT_VALIDATORS and IMPORT_FORMAT_VALIDATORS[key](value)
+            for key, value in task.items()
+        )
+    )
+
+
 async def convert_rt_struct_to_nii_labels(
     context: RBContext,
     org_id: str,
@@ -0,0 +1,163 @@
+"""Content addressed index of uploaded files."""
+
+import os
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from typing import List, Optional, Sequence
+
+import aiohttp
+
+from redbrick.common.context import RBContext
+from redbrick.common.storage import StorageMethod
+from redbrick.utils.async_utils import run_in_thread
+from redbrick.utils.common_utils import config_path
+from redbrick.utils.logging import logger
+
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadIndex:
+    """Local index mapping file contents to previously uploaded remote file paths.
+
+    Content hashes are cached by path, size and modification time,
+    so unchanged files are only hashed once.
+    """
+
+    def __init__(self, org_id: str, index_file: Optional[str] = None) -> None:
+        """Construct UploadIndex."""
+        self.org_id = org_id
+        self.index_file = index_file or os.path.join(
+            config_path(), "cache", "uploads.db"
+        )
+        os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.index_file, timeout=30, check_same_thread=False
+        )
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes (path TEXT PRIMARY KEY, "
+                + "size INTEGER, mtime_ns INTEGER, sha256 TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS uploads (org_id TEXT, sha256 TEXT, "
+                + "file_type TEXT, file_path TEXT, PRIMARY KEY (org_id, sha256, file_type))"
+            )
+
+    def close(self) -> None:
+        """Close the index."""
+        with self._lock:
+            self._conn.close()
+
+    def file_hash(self, path: str) -> str:
+        """Get the content hash of a file, hashing it only if it changed."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256 FROM hashes WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, stat.st_size, stat.st_mtime_ns),
+            ).fetchone()
+        if row:
+            return row[0]
+
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as file_:
+            while chunk := file_.read(HASH_CHUNK_SIZE):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime_ns, digest),
+            )
+        return digest
+
+    def lookup(
+        self, paths: Sequence[str], file_types: Sequence[str]
+    ) -> List[Optional[str]]:
+        """Get previously uploaded remote file paths for local files, if any."""
+        remote_paths: List[Optional[str]] = []
+        for path, file_type in zip(paths, file_types):
+            try:
+                digest = self.file_hash(path)
+            except OSError:
+                remote_paths.append(None)
+                continue
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT file_path FROM uploads "
+                    + "WHERE org_id = ? AND sha256 = ? AND file_type = ?",
+                    (self.org_id, digest, file_type),
+                ).fetchone()
+            remote_paths.append(row[0] if row else None)
+        return remote_paths
+
+    def record(
+        self,
+        paths: Sequence[str],
+        file_types: Sequence[str],
+        remote_paths: Sequence[str],
+    ) -> None:
+        """Record the remote file paths of uploaded local files."""
+        rows = [
+            (self.org_id, self.file_hash(path), file_type, remote_path)
+            for path, file_type, remote_path in zip(paths, file_types, remote_paths)
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO uploads VALUES (?, ?, ?, ?)", rows
+            )
+
+    def invalidate(self, remote_paths: Sequence[str]) -> None:
+        """Forget remote file paths that are no longer available."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM uploads WHERE org_id = ? AND file_path = ?",
+                [(self.org_id, remote_path) for remote_path in remote_paths],
+            )
+
+
+async def reusable_uploads(
+    upload_index: UploadIndex,
+    context: RBContext,
+    session: aiohttp.ClientSession,
+    org_id: str,
+    paths: Sequence[str],
+    file_types: Sequence[str],
+) -> List[Optional[str]]:
+    """Get previously uploaded remote file paths for local files, if still available.
+
+    Remote files that can no longer be downloaded are removed from the index.
+    """
+    remote_paths = await run_in_thread(upload_index.lookup, paths, file_types)
+    reused = [remote_path for remote_path in remote_paths if remote_path]
+    if not reused:
+        return remote_paths
+
+    try:
+        presigned = await run_in_thread(
+            context.export.presign_items, org_id, StorageMethod.REDBRICK, reused
+        )
+    except Exception as error:  # pylint: disable=broad-except
+        logger.debug(f"Failed to presign uploaded files: {error}")
+        return [None] * len(remote_paths)
+
+    async def _exists(url: Optional[str]) -> bool:
+        if not url:
+            return False
+        try:
+            async with session.get(url, headers={"Range": "bytes=0-0"}) as response:
+                return response.status in (200, 206)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    available = await asyncio.gather(*(_exists(url) for url in presigned))
+    stale = {path for path, exists in zip(reused, available) if not exists}
+    if stale:
+        await run_in_thread(upload_index.invalidate, sorted(stale))
+    return [None if path in stale else path for path in remote_paths]
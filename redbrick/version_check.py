@@ -1,17 +1,29 @@
 """Management of versions to help users update."""
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 import os
 import re
+import atexit
+import threading
 from configparser import ConfigParser
 from datetime import datetime
+from uuid import uuid4
 
 
 from .utils.common_utils import config_path
 from .utils.logging import logger  # pylint: disable=cyclic-import
 
 
-def get_updated_versions(current_version: str) -> List[Dict]:
+VERSION_CHECK_TIMEOUT = 5
+VERSION_CHECK_EXIT_TIMEOUT = 1
+
+_update_thread: Optional[threading.Thread] = None
+_updated_versions: List[Dict] = []
+
+
+def get_updated_versions(
+    current_version: str, timeout: float = VERSION_CHECK_TIMEOUT
+) -> List[Dict]:
     """Get latest version from PyPI."""
     # pylint: disable=import-outside-toplevel
     import requests  # type: ignore
@@ -19,7 +31,7 @@ def get_updated_versions(current_version: str) -> List[Dict]:
 
     url = "https://api.github.com/repos/redbrick-ai/redbrick-sdk/releases"
     try:
-        releases = requests.get(url, timeout=30).json()
+        releases = requests.get(url, timeout=timeout).json()
         releases = [
             (Version(release["tag_name"]), release)
             for release in releases
@@ -41,9 +53,99 @@ def get_updated_versions(current_version: str) -> List[Dict]:
     return updated_versions
 
 
+def _warn_update(current_version: str, latest_version: str) -> None:
+    warn = (
+        "You are using version '%s' of the SDK. However, version '%s' is available!\n"
+        + "Please update as soon as possible to get the latest features and bug fixes.\n"
+        + "You can use 'python -m pip install redbrick-sdk==%s' to get the latest version."
+    )
+    logger.warning(warn, current_version, latest_version, latest_version)
+
+
+def _write_cache(cache_file: str, cache_config: ConfigParser) -> None:
+    tmp_file = f"{cache_file}.{uuid4().hex}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as file_:
+            cache_config.write(file_)
+        os.replace(tmp_file, cache_file)
+    finally:
+        if os.path.isfile(tmp_file):
+            os.remove(tmp_file)
+
+
+def _record_warning(cache_file: str) -> None:
+    """Record that the update found by the last check has been reported."""
+    cache_config = ConfigParser()
+    cache_config.read(cache_file)
+    if "version" not in cache_config:
+        return
+    cache_config["version"]["last_warned"] = str(int(datetime.now().timestamp()))
+    try:
+        _write_cache(cache_file, cache_config)
+    except OSError:
+        pass
+
+
+def _check_updates(current_version: str, cache_file: str) -> None:
+    """Fetch the latest releases and record them in the version cache."""
+    updated_versions = get_updated_versions(current_version)
+    latest_version = re.sub(
+        r"^v",
+        "",
+        updated_versions[0]["tag_name"] if updated_versions else current_version,
+    )
+
+    cache_config = ConfigParser()
+    cache_config.read(cache_file)
+    cache_config["version"] = {
+        "current_version": current_version,
+        "latest_version": latest_version,
+        "last_checked": str(int(datetime.now().timestamp())),
+    }
+    try:
+        _write_cache(cache_file, cache_config)
+    except OSError:
+        pass
+
+    _updated_versions[:] = updated_versions
+
+
+def _report_updates(current_version: str, cache_file: str) -> None:
+    """Report updates found by the background version check, waiting briefly for it."""
+    if _update_thread is None:
+        return
+    _update_thread.join(VERSION_CHECK_EXIT_TIMEOUT)
+    if _update_thread.is_alive() or not _updated_versions:
+        return
+
+    _warn_update(current_version, re.sub(r"^v", "", _updated_versions[0]["tag_name"]))
+    _record_warning(cache_file)
+    logger.info("\nCHANGELOG:\n" + "=" * 20 + "\n")
+    for updated_version in _updated_versions:
+        version_name: str = updated_version["name"]
+        version_log: str = updated_version["body"]
+
+        version_log = re.sub(
+            r" by @[\w-]+ in https://github.com/redbrick-ai/redbrick-sdk/pull/\d+",
+            "",
+            re.sub(
+                r".*: https://github.com/redbrick-ai/redbrick-sdk/compare/.*",
+                "",
+                version_log,
+            ),
+        ).strip()
+        logger.info(f"{version_name}\n{'-' * len(version_name)}\n{version_log}\n\n")
+
+
 def version_check(current_version: str, check_version: bool) -> None:
-    """Check if current installed version of the SDK is up to date with latest pypi release."""
-    if not check_version:
+    """Check if current installed version of the SDK is up to date with latest pypi release.
+
+    Stale checks run in a background daemon thread, at most once a day even if
+    interrupted, and newly found updates are reported at exit. Updates found by
+    an earlier check are reported right away, once per check.
+    """
+    global _update_thread  # pylint: disable=global-statement
+    if not check_version or _update_thread is not None:
         return
 
     cache_file = os.path.join(config_path(), "version")
@@ -52,59 +154,41 @@ def version_check(current_version: str, check_version: bool) -> None:
     cache_config = ConfigParser()
     cache_config.read(cache_file)
 
-    update_cache = False
-
     if (
         "version" not in cache_config
         or "current_version" not in cache_config["version"]
         or cache_config["version"]["current_version"] != current_version
     ):
         cache_config["version"] = {"current_version": current_version}
-        update_cache = True
+        _write_cache(cache_file, cache_config)
 
+    version_cache = cache_config["version"]
     current_timestamp = int(datetime.now().timestamp())
-
-    if (
-        "latest_version" not in cache_config["version"]
-        or "last_checked" not in cache_config["version"]
-        or current_timestamp - int(cache_config["version"]["last_checked"]) > 86400
-    ):
-        updated_versions = get_updated_versions(current_version)
-        latest_version = re.sub(
-            r"^v",
-            "",
-            updated_versions[0]["tag_name"] if updated_versions else current_version,
+    last_attempted = max(
+        int(version_cache.get("last_checked", "0")),
+        int(version_cache.get("last_attempted", "0")),
+    )
+
+    if current_timestamp - last_attempted > 86400:
+        # record the attempt first, as the check is cut short if the process exits
+        version_cache["last_attempted"] = str(current_timestamp)
+        try:
+            _write_cache(cache_file, cache_config)
+        except OSError:
+            pass
+        _update_thread = threading.Thread(
+            target=_check_updates,
+            args=(current_version, cache_file),
+            name="redbrick-version-check",
+            daemon=True,
         )
-        # Comparing with current installed version
-        if latest_version != current_version:
-            warn = (
-                "You are using version '%s' of the SDK. However, version '%s' is available!\n"
-                + "Please update as soon as possible to get the latest features and bug fixes.\n"
-                + "You can use 'python -m pip install redbrick-sdk==%s' to get the latest version."
-            )
-            logger.warning(warn, current_version, latest_version, latest_version)
-            logger.info("\nCHANGELOG:\n" + "=" * 20 + "\n")
-            for updated_version in updated_versions:
-                version_name: str = updated_version["name"]
-                version_log: str = updated_version["body"]
-
-                version_log = re.sub(
-                    r" by @[\w-]+ in https://github.com/redbrick-ai/redbrick-sdk/pull/\d+",
-                    "",
-                    re.sub(
-                        r".*: https://github.com/redbrick-ai/redbrick-sdk/compare/.*",
-                        "",
-                        version_log,
-                    ),
-                ).strip()
-                logger.info(
-                    f"{version_name}\n{'-' * len(version_name)}\n{version_log}\n\n"
-                )
-
-        cache_config["version"]["latest_version"] = latest_version
-        cache_config["version"]["last_checked"] = str(current_timestamp)
-        update_cache = True
-
-    if update_cache:
-        with open(cache_file, "w", encoding="utf-8") as file_:
-            cache_config.write(file_)
+        _update_thread.start()
+        atexit.register(_report_updates, current_version, cache_file)
+        return
+
+    latest_version = version_cache.get("latest_version", current_version)
+    if latest_version != current_version and int(
+        version_cache.get("last_warned", "0")
+    ) < int(version_cache.get("last_checked", "0")):
+        _warn_update(current_version, latest_version)
+        _record_warning(cache_file)
@@ -1,6 +1,5 @@
 """Interface for interacting with your RedBrick AI Workspaces."""
 
-import asyncio
 from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 from functools import partial
@@ -16,7 +15,7 @@ from redbrick.common.entities import RBWorkspace
 from redbrick.common.context import RBContext
 from redbrick.types.task import InputTask
 from redbrick.upload.interact import upload_datapoints
-from redbrick.utils.async_utils import gather_with_concurrency, get_session
+from redbrick.utils.async_utils import gather_with_concurrency, get_session, run_sync
 from redbrick.utils.logging import log_error, logger
 from redbrick.utils.pagination import PaginationIterator
 from redbrick.utils.rb_dicom_utils import dicom_dp_format
@@ -234,6 +233,7 @@ class RBWorkspaceImpl(RBWorkspace):
         points: List[InputTask],
         *,
         concurrency: int = 50,
+        dedup_uploads: bool = False,
     ) -> List[Dict]:
         """
         Create datapoints in workspace.
@@ -272,6 +272,11 @@ class RBWorkspaceImpl(RBWorkspace):
 
         concurrency: int = 50
 
+        dedup_uploads: bool = False
+            When doing direct upload, skip uploading files whose content was already
+            uploaded to this organization, and reference the existing files instead.
+            Uses a local index of file content hashes.
+
         Returns
         -------------
         List[Dict]
@@ -297,6 +302,7 @@ class RBWorkspaceImpl(RBWorkspace):
             is_ground_truth=False,
             segmentation_mapping={},
             concurrency=concurrency,
+            dedup_uploads=dedup_uploads,
         )
 
     async def _update_datapoints_metadata(
@@ -346,7 +352,7 @@ class RBWorkspaceImpl(RBWorkspace):
         points: List[:obj:`~redbrick.types.task.InputTask`]
             List of datapoints with dpId and metaData values.
         """
-        asyncio.run(self._update_datapoints_metadata(storage_id, points))
+        run_sync(self._update_datapoints_metadata(storage_id, points))
 
     async def _delete_datapoints(self, dp_ids: List[str], concurrency: int) -> bool:
         async with get_session() as session:
@@ -388,7 +394,7 @@ class RBWorkspaceImpl(RBWorkspace):
             True if successful, else False.
         """
         concurrency = min(concurrency, 50)
-        return asyncio.run(self._delete_datapoints(dp_ids, concurrency))
+        return run_sync(self._delete_datapoints(dp_ids, concurrency))
 
     def import_from_dataset(
         self,
@@ -11,6 +11,23 @@ from redbrick.project import RBProjectImpl
 from redbrick.repo import ExportRepoImpl
 
 
+def pytest_addoption(parser):
+    """Add the option to run benchmarks"""
+    parser.addoption(
+        "--benchmark", action="store_true", help="run performance benchmarks"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless they are requested"""
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="needs --benchmark to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 @pytest.fixture(scope="function", name="rb_context")
 def mock_rb_context() -> RBContext:
     """Get a new mock RBContext for each test"""
@@ -125,6 +125,7 @@ def test_handle_upload(
             json=is_json,
             type=ImportTypes.DICOM3D,
             as_study=False,
+            local_grouping=False,
             as_frames=True,
             segment_map=None,
             storage=controller.STORAGE_REDBRICK,
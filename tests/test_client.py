@@ -0,0 +1,166 @@
+"""Tests for `redbrick.common.client`."""
+
+import base64
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+import tenacity
+
+from redbrick.common import client as client_module
+from redbrick.common.client import RBClientImpl
+from redbrick.config import config
+
+
+API_KEY = "mock_api_key_000000000000000000000000000000"
+
+RESPONSE_DELAY = 0.02
+
+
+class GraphQLHandler(BaseHTTPRequestHandler):
+    """Stand-in GraphQL server responding after a fixed delay."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        """Respond to a query."""
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(RESPONSE_DELAY)
+        body = json.dumps(
+            {"data": {"thread": threading.current_thread().name}}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Silence request logs."""
+
+
+@pytest.fixture(name="graphql_url")
+def graphql_server():
+    """Run a stand-in GraphQL server"""
+    server = ThreadingHTTPServer(("localhost", 0), GraphQLHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _throughput(client: RBClientImpl, threads: int, queries: int) -> float:
+    """Get the number of queries executed per second using a number of threads."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(
+            executor.map(
+                lambda _: client.execute_query("query { thread }", {}),
+                range(queries),
+            )
+        )
+    assert len(results) == queries
+    return queries / (time.perf_counter() - start)
+
+
+@pytest.mark.unit
+def test_client_thread_sessions(graphql_url):
+    """Test each thread uses its own HTTP session"""
+    client = RBClientImpl(API_KEY, graphql_url)
+    sessions = {}
+
+    def get_session(idx):
+        client.execute_query("query { thread }", {})
+        sessions[idx] = client.session
+
+    threads = [threading.Thread(target=get_session, args=(idx,)) for idx in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(session) for session in sessions.values()}) == 4
+
+    # sessions of exited threads are closed once another session is created
+    for session in sessions.values():
+        session.close = Mock()
+    main_session = client.session
+    assert client.session is main_session
+    for session in sessions.values():
+        session.close.assert_called_once()
+
+    client.close()
+    assert client.session is not main_session
+    client.close()
+
+
+@pytest.mark.benchmark
+def test_client_thread_scaling(graphql_url):
+    """Benchmark execute_query throughput scaling with threads"""
+    client = RBClientImpl(API_KEY, graphql_url)
+    _throughput(client, 8, 8)  # warm up connections
+
+    single = _throughput(client, 1, 20)
+    multi = _throughput(client, 8, 160)
+    client.close()
+
+    # ideal scaling is 8x, allow for scheduling overhead on busy machines
+    assert multi >= 4 * single, f"{single:.1f} q/s -> {multi:.1f} q/s"
+
+
+@pytest.mark.unit
+def test_execute_query_invalid_json(monkeypatch):
+    """Test responses that are not valid JSON are retried"""
+    client = RBClientImpl(API_KEY, "http://localhost")
+    contents = [b"<html>Bad Gateway</html>", b'{"data": {"ok": true}}']
+    session = Mock()
+    session.post.side_effect = lambda *args, **kwargs: Mock(
+        status_code=200, content=contents.pop(0)
+    )
+    # pylint: disable=protected-access
+    monkeypatch.setattr(client._local, "session", session, raising=False)
+    monkeypatch.setattr(
+        RBClientImpl.execute_query.retry, "wait", tenacity.wait_none()  # type: ignore
+    )
+
+    assert client.execute_query("query { ok }", {}) == {"ok": True}
+    assert session.post.call_count == 2
+
+
+@pytest.mark.unit
+def test_prepare_query(monkeypatch):
+    """Test queries are compressed only when large, as base64 or raw gzip"""
+    client = RBClientImpl(API_KEY, "http://localhost")
+    query = "query sdkTest($items: [String!]!) { test(items: $items) }"
+
+    small = {"items": ["a"]}
+    # pylint: disable=protected-access
+    client_module._query_compressor.cache_clear()
+    data, headers = client.prepare_query(query, small)
+    assert client_module._query_compressor.cache_info().currsize == 0
+    assert json.loads(data) == {"query": query, "variables": small}
+    assert "Content-Encoding" not in headers
+    assert "Content-Encoding-RB" not in headers
+
+    large = {"items": [f"item-{idx}" for idx in range(500)]}
+    expected = {"query": query, "variables": large}
+    monkeypatch.setattr(config, "binary_transport", False)
+    data, headers = client.prepare_query(query, large)
+    assert headers["Content-Encoding-RB"] == "gzip"
+    assert json.loads(gzip.decompress(base64.b64decode(data))) == expected
+
+    monkeypatch.setattr(config, "binary_transport", True)
+    hits = client_module._query_compressor.cache_info().hits
+    data, headers = client.prepare_query(query, large)
+    assert headers["Content-Encoding"] == "gzip"
+    assert "Content-Encoding-RB" not in headers
+    assert json.loads(gzip.decompress(data)) == expected
+    assert len(data) < len(json.dumps(expected))
+    assert client_module._query_compressor.cache_info().hits == hits + 1
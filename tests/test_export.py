@@ -274,6 +274,7 @@ def test_list_tasks(
     filters = call_args[4]
 
     assert set(filters) == set(expected_filters)
+    assert "labels" not in calls[0].kwargs["fields"]
     assert isinstance(task, dict)
     assert isinstance(task.get("taskId"), str)
     assert stage_name_ == expected_stage_name
@@ -0,0 +1,103 @@
+"""Tests for redbrick.export.dataset"""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redbrick.export.dataset import DatasetExportImpl
+
+
+def get_series(idx: int, num_files: int = 2):
+    """Get a mock dataset import series entry"""
+    return {
+        "seriesId": f"series{idx}",
+        "importId": "import",
+        "createdAt": "2024-01-01",
+        "createdBy": "user",
+        "numFiles": num_files,
+        "url": f"altadb:///series{idx}",
+    }
+
+
+def write_series(dataset_root: str, series_id: str, num_files: int, missing: int = 0):
+    """Write the files of a previously exported series, and get its manifest entry"""
+    series_dir = os.path.join(dataset_root, series_id)
+    os.makedirs(series_dir)
+    items = [os.path.join(series_dir, f"{idx}.dcm") for idx in range(num_files)]
+    for file_path in items[missing:]:
+        with open(file_path, "wb") as file_:
+            file_.write(b"dicom")
+    return {"seriesId": series_id, "items": items}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("resume", [False, True])
+def test_export_to_files(tmpdir, resume):
+    """Test `redbrick.export.dataset.DatasetExportImpl.export_to_files`"""
+    dataset = MagicMock()
+    dataset.dataset_name = "mock_dataset"
+    dataset.context.client.url = "https://api.redbrickai.com/graphql/"
+    dataset.context.export.get_dataset_import_series = MagicMock(
+        return_value=([get_series(idx) for idx in range(5)], None)
+    )
+
+    dataset_root = os.path.join(str(tmpdir), "mock_dataset")
+    # series1 is complete, series2 has fewer files than the server and series3
+    # has a missing file, while the entry of series4 is cut off by an interruption
+    previous = [
+        write_series(dataset_root, "series1", 2),
+        write_series(dataset_root, "series2", 1),
+        write_series(dataset_root, "series3", 2, missing=1),
+        write_series(dataset_root, "series4", 2),
+    ]
+    with open(
+        os.path.join(dataset_root, "series.json"), "w", encoding="utf-8"
+    ) as file_:
+        file_.write(json.dumps(previous, indent=2)[:-10])
+
+    async def mock_save_dicom_series(url, series_dir, *args):
+        # pylint: disable=unused-argument
+        os.makedirs(series_dir, exist_ok=True)
+        return [os.path.join(series_dir, f"{idx}.dcm") for idx in range(2)]
+
+    with patch(
+        "redbrick.utils.altadb.save_dicom_series", side_effect=mock_save_dicom_series
+    ) as save_series:
+        DatasetExportImpl(dataset).export_to_files(str(tmpdir), 2, resume=resume)
+
+    assert save_series.call_count == (4 if resume else 5)
+    with open(os.path.join(dataset_root, "series.json"), encoding="utf-8") as file_:
+        series = json.load(file_)
+    assert sorted(entry["seriesId"] for entry in series) == [
+        f"series{idx}" for idx in range(5)
+    ]
+    assert all(len(entry["items"]) == 2 for entry in series)
+
+
+@pytest.mark.unit
+def test_export_to_files_failure(tmpdir):
+    """Test a failing series cancels the rest of the export, keeping resumed series"""
+    dataset = MagicMock()
+    dataset.dataset_name = "mock_dataset"
+    dataset.context.client.url = "https://api.redbrickai.com/graphql/"
+    dataset.context.export.get_dataset_import_series = MagicMock(
+        return_value=([get_series(idx) for idx in range(20)], None)
+    )
+
+    dataset_root = os.path.join(str(tmpdir), "mock_dataset")
+    previous = [write_series(dataset_root, "series19", 2)]
+    with open(
+        os.path.join(dataset_root, "series.json"), "w", encoding="utf-8"
+    ) as file_:
+        json.dump(previous, file_, indent=2)
+
+    with patch(
+        "redbrick.utils.altadb.save_dicom_series", side_effect=OSError("failed")
+    ) as save_series:
+        DatasetExportImpl(dataset).export_to_files(str(tmpdir), 2, resume=True)
+
+    assert save_series.call_count < 20
+    with open(os.path.join(dataset_root, "series.json"), encoding="utf-8") as file_:
+        assert json.load(file_) == previous
@@ -0,0 +1,97 @@
+"""Startup tests for `import redbrick` and the CLI, by the modules they load."""
+
+import subprocess
+import sys
+from typing import List, Optional
+
+import pytest
+
+
+HEAVY_MODULES = [
+    "aiohttp",
+    "requests",
+    "tenacity",
+    "tqdm",
+    "natsort",
+    "nest_asyncio",
+    "rich",
+    "nibabel",
+    "pydicom",
+    "redbrick.organization",
+    "redbrick.project",
+    "redbrick.export",
+    "redbrick.upload",
+]
+
+CLI_COMMANDS = ["config", "init", "clone", "info", "export", "upload", "report"]
+
+
+def _loaded_modules(statement: str, cwd: Optional[str] = None) -> List[str]:
+    """Run a statement, and get all loaded modules."""
+    result = subprocess.run(
+        [sys.executable, "-c", statement + "\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=cwd,
+    )
+    return result.stdout.splitlines()
+
+
+@pytest.mark.unit
+def test_import_time():
+    """Test `import redbrick` does not load heavy dependencies"""
+    modules = _loaded_modules("import sys, redbrick")
+    assert "redbrick" in modules
+    for module in HEAVY_MODULES:
+        assert module not in modules, f"{module} is imported by `import redbrick`"
+
+
+@pytest.mark.unit
+def test_lazy_attributes():
+    """Test public attributes load their modules on first access"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, redbrick; print('redbrick.project' in sys.modules); "
+            + "print(redbrick.RBProjectImpl.__module__); "
+            + "print('redbrick.project' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["False", "redbrick.project", "True"]
+
+
+def _cli_startup(argv: List[str], cwd: str) -> List[str]:
+    """Run the CLI, and get all loaded modules."""
+    return _loaded_modules(
+        "import sys\n"
+        + "try:\n"
+        + "    from redbrick.cli import cli_main\n"
+        + f"    cli_main({argv!r})\n"
+        + "except BaseException:\n"
+        + "    pass",
+        cwd,
+    )
+
+
+@pytest.mark.unit
+def test_cli_help_startup(tmpdir):
+    """Test `redbrick --help` does not load any command or the SDK"""
+    modules = _cli_startup(["--help"], str(tmpdir))
+    assert "redbrick.cli" in modules
+    for module in ["aiohttp", "InquirerPy", "shtab", "redbrick.cli.project"]:
+        assert module not in modules, f"{module} is imported by `redbrick --help`"
+    for command in CLI_COMMANDS:
+        assert f"redbrick.cli.command.{command}" not in modules
+
+
+@pytest.mark.unit
+def test_cli_info_startup(tmpdir):
+    """Test `redbrick info` loads only the info command"""
+    modules = _cli_startup(["info"], str(tmpdir))
+    for command in CLI_COMMANDS:
+        assert (f"redbrick.cli.command.{command}" in modules) == (command == "info")
@@ -54,6 +54,30 @@ def test_get_datapoints_latest(export_repo):
     assert all(isinstance(x, str) for x in dp_ids)
 
 
+@pytest.mark.unit
+def test_get_datapoints_latest_fields(export_repo):
+    """Test `redbrick.repo.export.Export.get_datapoints_latest` field projection"""
+    mock_query = Mock(return_value=fixtures.get_datapoints_latest_resp)
+    with patch.object(export_repo.client, "execute_query", mock_query):
+        export_repo.get_datapoints_latest(org_id="mock", project_id="mock")
+        export_repo.get_datapoints_latest(
+            org_id="mock", project_id="mock", fields=["metaData"]
+        )
+        with pytest.raises(ValueError):
+            export_repo.get_datapoints_latest(
+                org_id="mock", project_id="mock", fields=["invalid"]
+            )
+
+    full_query = mock_query.call_args_list[0].args[0]
+    lean_query = mock_query.call_args_list[1].args[0]
+    assert len(lean_query) < len(full_query)
+    for field in ["labelsData", "items(presigned", "heatMaps", "seriesInfo"]:
+        assert field in full_query
+        assert field not in lean_query
+    for field in ["taskId", "currentStageName", "metaData", "latestTaskData"]:
+        assert field in lean_query
+
+
 @pytest.mark.unit
 def test_task_search(export_repo):
     """Test `redbrick.repo.export.Export.task_search`"""
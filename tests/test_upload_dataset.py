@@ -0,0 +1,85 @@
+"""Tests for redbrick.upload.dataset"""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from redbrick.common.constants import MAX_PRESIGN_BATCH_SIZE
+from redbrick.upload.dataset import DatasetUploadImpl
+
+
+@pytest.mark.unit
+def test_upload_files(tmpdir):
+    """Test `redbrick.upload.dataset.DatasetUploadImpl.upload_files`"""
+    num_files = MAX_PRESIGN_BATCH_SIZE + 7
+    for idx in range(num_files):
+        with open(os.path.join(str(tmpdir), f"{idx}.dcm"), "wb") as file_:
+            file_.write(b"dicom")
+
+    async def mock_presign(*args, files, **kwargs):
+        # pylint: disable=unused-argument
+        return "import_id", [f"https://url/{file_['filePath']}" for file_ in files]
+
+    dataset = MagicMock()
+    dataset.context.upload.import_dataset_files = MagicMock(
+        return_value=("import_id", [])
+    )
+    dataset.context.upload.import_dataset_files_async = AsyncMock(
+        side_effect=mock_presign
+    )
+    dataset.context.upload.process_dataset_import = MagicMock(return_value=True)
+
+    with patch(
+        "redbrick.upload.dataset.upload_file", AsyncMock(return_value=True)
+    ) as upload_file:
+        DatasetUploadImpl(dataset).upload_files(str(tmpdir), "import", 20)
+
+    assert dataset.context.upload.import_dataset_files_async.await_count == 2
+    assert [
+        file_["filePath"]
+        for call in dataset.context.upload.import_dataset_files_async.await_args_list
+        for file_ in call.kwargs["files"]
+    ] == [f"{idx}.dcm" for idx in range(num_files)]
+    assert upload_file.await_count == num_files
+    assert {call.args[2] for call in upload_file.await_args_list} == {
+        f"https://url/{idx}.dcm" for idx in range(num_files)
+    }
+    dataset.context.upload.process_dataset_import.assert_called_once_with(
+        org_id=dataset.org_id,
+        data_store=dataset.dataset_name,
+        import_id="import_id",
+        total_files=num_files,
+    )
+
+
+@pytest.mark.unit
+def test_upload_files_failure(tmpdir):
+    """Test a failed upload stops presigning and does not finalize the import"""
+    for idx in range(5 * MAX_PRESIGN_BATCH_SIZE):
+        with open(os.path.join(str(tmpdir), f"{idx}.dcm"), "wb") as file_:
+            file_.write(b"dicom")
+
+    async def mock_presign(*args, files, **kwargs):
+        # pylint: disable=unused-argument
+        return "import_id", [f"https://url/{file_['filePath']}" for file_ in files]
+
+    dataset = MagicMock()
+    dataset.context.upload.import_dataset_files = MagicMock(
+        return_value=("import_id", [])
+    )
+    dataset.context.upload.import_dataset_files_async = AsyncMock(
+        side_effect=mock_presign
+    )
+
+    with (
+        patch(
+            "redbrick.upload.dataset.upload_file",
+            AsyncMock(side_effect=ConnectionError("upload failed")),
+        ),
+        pytest.raises(Exception, match="Error uploading files"),
+    ):
+        DatasetUploadImpl(dataset).upload_files(str(tmpdir), "import", 1)
+
+    assert dataset.context.upload.import_dataset_files_async.await_count < 5
+    dataset.context.upload.process_dataset_import.assert_not_called()
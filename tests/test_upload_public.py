@@ -0,0 +1,42 @@
+"""Tests for redbrick.upload.public"""
+
+import json
+import os
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from redbrick.common.enums import ImportTypes
+from redbrick.upload.public import UploadImpl
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_items_list():
+    """Test `redbrick.upload.public.UploadImpl.generate_items_list`"""
+    scan_threads = []
+
+    def scan_files():
+        for directory in ("b", "a"):
+            scan_threads.append(threading.get_ident())
+            yield [os.path.join(directory, f"{idx}.png") for idx in (10, 2)]
+
+    async def mock_generate_items_list(session, files, *args):
+        # pylint: disable=unused-argument
+        return json.dumps([{"items": files}])
+
+    project = MagicMock()
+    project.context.upload.generate_items_list = AsyncMock(
+        side_effect=mock_generate_items_list
+    )
+    output = await UploadImpl(project).generate_items_list(
+        scan_files(), ImportTypes.IMAGE2D, False, 1
+    )
+
+    # the scan is drained off the event loop thread
+    assert scan_threads and threading.get_ident() not in scan_threads
+    assert [item["items"] for item in output] == [
+        [os.path.join("a", "2.png"), os.path.join("a", "10.png")],
+        [os.path.join("b", "2.png"), os.path.join("b", "10.png")],
+    ]
@@ -0,0 +1,40 @@
+"""Tests for `redbrick.utils.altadb`."""
+
+import os
+
+import pydicom
+import pydicom.encaps
+import pydicom.uid
+import pytest
+
+from redbrick.utils import altadb
+
+
+@pytest.mark.unit
+def test_write_encapsulated_dataset(tmpdir):
+    """Test streamed pixel data matches pydicom encapsulation"""
+    # pylint: disable=invalid-name
+    frames = [b"\x01\x02\x03", b"\x04\x05\x06\x07", b"\x08"]
+    frame_files = []
+    for idx, frame in enumerate(frames):
+        frame_file = os.path.join(str(tmpdir), f"{idx}.frame")
+        with open(frame_file, "wb") as file_:
+            file_.write(frame)
+        frame_files.append(frame_file)
+
+    ds = pydicom.Dataset()
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.JPEG2000Lossless
+    ds.file_meta.MediaStorageSOPClassUID = pydicom.uid.CTImageStorage
+    ds.file_meta.MediaStorageSOPInstanceUID = pydicom.uid.generate_uid()
+    ds.SOPClassUID = pydicom.uid.CTImageStorage
+    ds.SOPInstanceUID = ds.file_meta.MediaStorageSOPInstanceUID
+    ds.PatientName = "Test"
+    ds.NumberOfFrames = len(frames)
+
+    destination = os.path.join(str(tmpdir), "instance.dcm")
+    altadb.write_encapsulated_dataset(ds, frame_files, destination)
+
+    saved = pydicom.dcmread(destination)
+    assert saved.PatientName == "Test"
+    assert saved.PixelData == pydicom.encaps.encapsulate(frames)
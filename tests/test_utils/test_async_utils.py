@@ -1,6 +1,7 @@
 """Tests for `redbrick.utils.async_utils`."""
 
 import asyncio
+import os
 import pytest
 
 from redbrick.utils import async_utils
@@ -90,3 +91,74 @@ async def test_gather_with_concurrency__no_tasks():
     tasks = []
     result = await async_utils.gather_with_concurrency(2, *tasks)
     assert result == []
+
+
+@pytest.mark.unit
+def test_run_sync():
+    """Ensure `run_sync` runs coroutines on one background loop with shared sessions"""
+
+    async def get_loop_and_session():
+        async with async_utils.get_session() as session:
+            return asyncio.get_running_loop(), session
+
+    loop, session = async_utils.run_sync(get_loop_and_session())
+    assert async_utils.run_sync(get_loop_and_session()) == (loop, session)
+    assert not session.closed
+
+    async def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        async_utils.run_sync(fail())
+
+    # nested calls from the background loop run on a separate loop
+    async def nested():
+        return async_utils.run_sync(get_loop_and_session())[0]
+
+    assert async_utils.run_sync(nested()) is not loop
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_sync__running_loop():
+    """Ensure `run_sync` works when called with an event loop already running"""
+
+    async def sample_task():
+        await asyncio.sleep(0.1)
+        return asyncio.get_running_loop()
+
+    assert async_utils.run_sync(sample_task()) is not asyncio.get_running_loop()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_gather_or_cancel():
+    """Ensure `gather_or_cancel` cancels the other coroutines when one fails"""
+    cancelled = asyncio.Event()
+
+    async def wait():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def fail():
+        raise ValueError("failed")
+
+    assert await async_utils.gather_or_cancel(
+        asyncio.sleep(0, 1), asyncio.sleep(0, 2)
+    ) == [1, 2]
+    with pytest.raises(ValueError, match="failed"):
+        await async_utils.gather_or_cancel(wait(), fail())
+    assert cancelled.is_set()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_in_process(monkeypatch):
+    """Ensure `run_in_process` only uses worker processes if enabled"""
+    monkeypatch.setattr(async_utils.config, "process_pool", False)
+    assert await async_utils.run_in_process(os.getpid) == os.getpid()
+    monkeypatch.setattr(async_utils.config, "process_pool", True)
+    assert await async_utils.run_in_process(os.getpid) != os.getpid()
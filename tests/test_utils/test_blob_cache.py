@@ -0,0 +1,91 @@
+"""Tests for `redbrick.utils.blob_cache`."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from redbrick.config import config
+from redbrick.utils import blob_cache, files
+
+
+@pytest.mark.unit
+def test_blob_cache(tmpdir):
+    """Test BlobCache copies cached files by ETag and evicts LRU entries"""
+    cache = blob_cache.BlobCache(10, os.path.join(str(tmpdir), "cache"))
+    source = os.path.join(str(tmpdir), "source")
+    with open(source, "wb") as file_:
+        file_.write(b"12345")
+
+    target = os.path.join(str(tmpdir), "target")
+    assert cache.etag("storage:a") is None
+    assert not cache.get("storage:a", '"v1"', target)
+    cache.put("storage:a", '"v1"', source)
+    assert cache.etag("storage:a") == '"v1"'
+    assert cache.get("storage:a", '"v1"', target)
+    assert not cache.get("storage:a", '"v2"', target)
+    assert not os.path.samefile(source, target)
+
+    # cached files are copies, so editing them does not change the cache
+    with open(target, "wb") as file_:
+        file_.write(b"edited")
+    copied = os.path.join(str(tmpdir), "copied")
+    assert cache.get("storage:a", '"v1"', copied)
+    with open(copied, "rb") as file_:
+        assert file_.read() == b"12345"
+
+    # a new version replaces the previous one
+    cache.put("storage:a", '"v2"', source)
+    assert cache.etag("storage:a") == '"v2"'
+    assert not cache.get("storage:a", '"v1"', target)
+
+    # adding beyond max size evicts the least recently used entries
+    cache.put("storage:b", '"v1"', copied)
+    # pylint: disable=protected-access
+    os.utime(cache._entry("storage:a", '"v2"'), (0, 0))
+    cache.put("storage:c", '"v1"', copied)
+    assert not cache.get("storage:a", '"v2"', target)
+    assert cache.get("storage:b", '"v1"', target)
+    assert cache.get("storage:c", '"v1"', target)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_files_blob_cache(tmpdir, monkeypatch):
+    """Test files.download_files serves unchanged files from the blob cache by ETag"""
+    monkeypatch.setattr(config, "blob_cache_size", 1024)
+    monkeypatch.setattr(
+        blob_cache,
+        "_blob_cache",
+        blob_cache.BlobCache(1024, os.path.join(str(tmpdir), "cache")),
+    )
+    responses = [(200, '"v1"', b"data"), (304, None, b""), (200, '"v2"', b"new")]
+    requests = []
+
+    def mock_get(*args, **kwargs):  # pylint: disable=unused-argument
+        status, etag, data = responses.pop(0)
+        requests.append(kwargs.get("headers"))
+
+        async def mock_iter_chunked(chunk_size):  # pylint: disable=unused-argument
+            yield data
+
+        mock_response = MagicMock()
+        mock_response.__aenter__.return_value.status = status
+        mock_response.__aenter__.return_value.headers = {"ETag": etag} if etag else {}
+        mock_response.__aenter__.return_value.content.iter_chunked = mock_iter_chunked
+        return mock_response
+
+    with patch("aiohttp.ClientSession.get", side_effect=mock_get):
+        for destination, expected in (
+            ("first", b"data"),
+            ("second", b"data"),
+            ("third", b"new"),
+        ):
+            path = os.path.join(str(tmpdir), destination, "item.dcm")
+            assert await files.download_files(
+                [("url", path)], cache_keys=["storage:item.dcm"]
+            ) == [path]
+            with open(path, "rb") as file_:
+                assert file_.read() == expected
+
+    assert requests == [None, {"If-None-Match": '"v1"'}, {"If-None-Match": '"v1"'}]
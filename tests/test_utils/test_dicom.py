@@ -0,0 +1,83 @@
+"""Tests for `redbrick.utils.dicom`."""
+
+import os
+
+import pydicom
+import pytest
+
+from redbrick.utils import dicom
+
+
+def _write_slice(path: str, study_uid: str, series_uid: str, **tags) -> None:
+    """Write a header-only DICOM slice."""
+    ds = pydicom.Dataset()
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.MediaStorageSOPClassUID = pydicom.uid.CTImageStorage
+    ds.file_meta.MediaStorageSOPInstanceUID = pydicom.uid.generate_uid()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+    ds.SOPClassUID = pydicom.uid.CTImageStorage
+    ds.SOPInstanceUID = ds.file_meta.MediaStorageSOPInstanceUID
+    ds.StudyInstanceUID, ds.SeriesInstanceUID = study_uid, series_uid
+    for key, value in tags.items():
+        setattr(ds, key, value)
+    ds.save_as(path, write_like_original=False)
+
+
+@pytest.mark.unit
+def test_group_dicom_series(tmpdir, monkeypatch):
+    """Test dicom.group_dicom_series groups by header UIDs and sorts slices"""
+    # pylint: disable=too-many-locals
+    # undo class level attributes patched in by other dicom fixtures
+    for attr in ("StudyDate", "StudyTime", "StudyID", "SOPInstanceUID"):
+        monkeypatch.delattr(pydicom.dataset.Dataset, attr, raising=False)
+
+    study_dir = os.path.join(str(tmpdir), "study")
+    os.makedirs(study_dir)
+    study_uid = pydicom.uid.generate_uid()
+    series1, series2 = pydicom.uid.generate_uid(), pydicom.uid.generate_uid()
+
+    # file names do not follow slice order, and both series share a directory
+    for name, pos in (("a.dcm", 4), ("b.dcm", -2), ("c.dcm", 1)):
+        _write_slice(
+            os.path.join(study_dir, name),
+            study_uid,
+            series1,
+            SeriesNumber=2,
+            ImagePositionPatient=[0, 0, pos],
+            ImageOrientationPatient=[1, 0, 0, 0, 1, 0],
+        )
+    for name, inst in (("d", 3), ("e", 1)):
+        _write_slice(
+            os.path.join(study_dir, name), study_uid, series2, InstanceNumber=inst
+        )
+    text_file = os.path.join(study_dir, "notes.txt")
+    with open(text_file, "w", encoding="utf-8") as file_:
+        file_.write("not dicom")
+
+    files = sorted(os.path.join(study_dir, name) for name in os.listdir(study_dir))
+
+    items_list, others = dicom.group_dicom_series(files)
+    assert others == [text_file]
+    assert [item["items"] for item in items_list] == [
+        [os.path.join(study_dir, name) for name in ("b.dcm", "c.dcm", "a.dcm")],
+        [os.path.join(study_dir, name) for name in ("e", "d")],
+    ]
+    assert [item["name"] for item in items_list] == ["study/1", "study/2"]
+
+    items_list, others = dicom.group_dicom_series(files, as_study=True)
+    assert others == [text_file]
+    assert items_list == [
+        {
+            "items": [
+                os.path.join(study_dir, name)
+                for name in ("b.dcm", "c.dcm", "a.dcm", "e", "d")
+            ]
+        }
+    ]
+
+    # headers are read in the process pool for large inputs, if enabled
+    expected = dicom.group_dicom_series(files)
+    monkeypatch.setattr(dicom, "HEADER_CHUNK_SIZE", 2)
+    assert dicom.group_dicom_series(files) == expected
+    monkeypatch.setattr(dicom.config, "process_pool", True)
+    assert dicom.group_dicom_series(files) == expected
@@ -0,0 +1,56 @@
+"""Tests for `redbrick.utils.dicom_seg`."""
+
+import os
+import shutil
+from unittest.mock import Mock, patch
+
+import pytest
+
+from redbrick.utils import dicom_seg
+
+
+@pytest.mark.unit
+def test_load_series_headers(dicom_file_and_image_tuples, tmpdir):
+    """Test series headers are parsed without pixel data"""
+    series_dir = os.path.join(str(tmpdir), "series")
+    os.makedirs(series_dir)
+    shutil.copy(dicom_file_and_image_tuples[0][0], series_dir)
+
+    headers = dicom_seg.load_series_headers(series_dir)
+    assert len(headers) == 1
+    assert "PixelData" not in headers[0]
+
+
+@pytest.mark.unit
+def test_convert_nii_to_dicom_segs():
+    """Test the series is parsed once for all labels, isolating failures"""
+
+    def segment_attributes(label, *args):
+        # pylint: disable=unused-argument
+        if label == "bad.nii.gz":
+            raise ValueError("bad label")
+        return "mask", ([] if label == "empty.nii.gz" else [{"labelID": 1}])
+
+    load_headers = Mock(return_value=["header"])
+    with (
+        patch.object(dicom_seg, "_segment_attributes", side_effect=segment_attributes),
+        patch.object(dicom_seg, "load_series_headers", load_headers),
+        patch.object(
+            dicom_seg,
+            "_write_dicom_seg",
+            side_effect=lambda label, *args: label + ".dcm",
+        ) as write_dicom_seg,
+    ):
+        outputs = dicom_seg.convert_nii_to_dicom_segs(
+            ["a.nii.gz", "bad.nii.gz", "empty.nii.gz", "b.nii.gz"],
+            "series",
+            [],
+            {},
+            False,
+        )
+
+    assert outputs[0] == "a.nii.gz.dcm"
+    assert isinstance(outputs[1], ValueError)
+    assert outputs[2:] == [None, "b.nii.gz.dcm"]
+    load_headers.assert_called_once_with("series")
+    assert write_dicom_seg.call_count == 2
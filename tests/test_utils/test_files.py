@@ -1,5 +1,6 @@
 """Tests for `redbrick.utils.files`."""
 
+import asyncio
 import gzip
 import os
 from functools import reduce
@@ -44,6 +45,41 @@ def test_find_files_recursive(create_temporary_files):
     assert set(reduce(add, result)) == set(file_paths[:4])
 
 
+@pytest.mark.unit
+def test_scan_files(tmpdir):
+    """Test files.scan_files groups series directories and yields lazily"""
+    root = str(tmpdir)
+    for series in range(3):
+        series_dir = os.path.join(root, "study", f"series{series}")
+        os.makedirs(series_dir)
+        for idx in (10, 2, 1):
+            with open(os.path.join(series_dir, f"{idx}.dcm"), "wb") as file_:
+                file_.write(b"")
+    mixed_dir = os.path.join(root, "mixed")
+    os.makedirs(mixed_dir)
+    for name in ("a.dcm", "b.png", ".hidden.dcm"):
+        with open(os.path.join(mixed_dir, name), "wb") as file_:
+            file_.write(b"")
+
+    scanner = files.scan_files(root, {"dcm", "png"}, multiple=True)
+    assert next(scanner)
+    scanner.close()
+
+    result = list(files.scan_files(root, {"dcm", "png"}, multiple=True))
+    assert sorted(result) == [
+        [
+            os.path.join(root, "study", f"series{series}", f"{idx}.dcm")
+            for idx in (1, 2, 10)
+        ]
+        for series in range(3)
+    ]
+
+    result = list(files.scan_files(root, {"dcm"}, max_workers=1))
+    assert len(result) == 10
+    assert [os.path.join(mixed_dir, "a.dcm")] in result
+    assert not list(files.scan_files(os.path.join(root, "missing"), {"*"}))
+
+
 @pytest.mark.unit
 def test_uniquify_path(create_temporary_files):
     """Test files.uniquify_path function"""
@@ -59,6 +95,32 @@ def test_is_dicom_file(dicom_file_and_image):
     assert files.is_dicom_file(file_path) is True
 
 
+@pytest.mark.unit
+def test_check_dicom_files(dicom_file_and_image, tmpdir):
+    """Test files.check_dicom_files reads only the prefix of (gzipped) files"""
+    file_path, _ = dicom_file_and_image
+    with open(file_path, "rb") as file_:
+        data = file_.read()
+
+    gzipped_path = os.path.join(str(tmpdir), "gzipped")
+    with open(gzipped_path, "wb") as file_:
+        file_.write(gzip.compress(data))
+    truncated_path = os.path.join(str(tmpdir), "truncated")
+    with open(truncated_path, "wb") as file_:
+        file_.write(gzip.compress(data)[:200])
+    corrupt_path = os.path.join(str(tmpdir), "corrupt")
+    with open(corrupt_path, "wb") as file_:
+        file_.write(b"\x1f\x8b" + b"\x00" * 200)
+    text_path = os.path.join(str(tmpdir), "text")
+    with open(text_path, "wb") as file_:
+        file_.write(b"not a dicom file" * 20)
+
+    assert files.check_dicom_files(
+        [file_path, gzipped_path, truncated_path, corrupt_path, text_path]
+    ) == [True, True, True, False, False]
+    assert not files.check_dicom_files([])
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_upload_files(nifti_instance_files_png):
@@ -155,3 +217,48 @@ async def test_download_files(tmpdir):
     assert os.path.isfile(result[0])
     with open(result[0], "rb") as file:
         assert gzip.decompress(file.read()) == mock_data
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_transfer_scheduler():
+    """Test files.TransferScheduler limits transfers and bytes, by priority"""
+    scheduler = files.TransferScheduler(MagicMock(), max_transfers=2, max_bytes=100)
+    first, second = scheduler.next_priority(), scheduler.next_priority()
+    started = []
+    release = asyncio.Event()
+    in_flight = 0
+    max_in_flight = 0
+
+    async def transfer(name, size, priority):
+        nonlocal in_flight, max_in_flight
+        async with scheduler.slot(size, priority):
+            started.append(name)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await release.wait()
+            in_flight -= 1
+
+    # the first task's transfers are queued after the second's, but start first
+    coros = [transfer(f"second{idx}", 10, second) for idx in range(3)]
+    coros += [transfer(f"first{idx}", 10, first) for idx in range(2)]
+    coros += [transfer("large", 200, first)]
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    await asyncio.sleep(0)
+    assert started == ["second0", "second1"]
+    release.set()
+    await asyncio.gather(*tasks)
+    assert started[2:] == ["first0", "first1", "large", "second2"]
+    assert max_in_flight == 2
+
+    # a transfer larger than max bytes runs alone
+    release.clear()
+    tasks = [
+        asyncio.ensure_future(transfer(name, size, first))
+        for name, size in (("large", 200), ("small", 10))
+    ]
+    await asyncio.sleep(0)
+    assert started[-1] == "large"
+    release.set()
+    await asyncio.gather(*tasks)
+    assert started[-1] == "small"
@@ -0,0 +1,103 @@
+"""Tests for `redbrick.utils.json_codec`."""
+
+import json
+import timeit
+
+import pytest
+
+from redbrick.config import config
+from redbrick.utils import json_codec
+
+
+def _task_payload(idx: int) -> dict:
+    """Get a representative exported task, with its raw labels data."""
+    labels = [
+        {
+            "category": ["object", f"category-{label}"],
+            "attributes": [{"name": "confidence", "value": 0.5 + label / 100}],
+            "labelid": f"label-{idx}-{label}",
+            "bbox3d": {"pointTopLeft": [1, 2, 3], "wDimension": 10},
+            "point": {"xnorm": 0.25, "ynorm": 0.75},
+            "seriesIndex": label % 4,
+        }
+        for label in range(50)
+    ]
+    return {
+        "taskId": f"task-{idx}",
+        "name": f"study/{idx}",
+        "currentStageName": "Review_1",
+        "priority": 0.5,
+        "metaData": json.dumps({"patient": f"P{idx}", "site": "Hôpital"}),
+        "labelsData": json.dumps(labels),
+        "series": [
+            {
+                "name": f"series-{series}",
+                "items": [
+                    f"s3://bucket/{idx}/{series}/{item}.dcm" for item in range(64)
+                ],
+                "segmentMap": {str(seg): {"category": "liver"} for seg in range(8)},
+            }
+            for series in range(4)
+        ],
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", json_codec.JSON_BACKENDS)
+def test_json_codec(backend, monkeypatch):
+    """Test each installed backend round trips and matches stdlib formatting"""
+    codec = json_codec.get_codec(backend)
+    if codec.name != backend:
+        pytest.skip(f"{backend} is not installed")
+    monkeypatch.setattr(config, "json_backend", backend)
+
+    task = _task_payload(0)
+    assert json_codec.json_loads(json_codec.json_dumps(task)) == task
+    assert json_codec.json_loads(json_codec.json_dumpb(task)) == task
+    assert json_codec.json_dumps(task) == json.dumps(
+        task, ensure_ascii=False, separators=(",", ":")
+    )
+    assert json_codec.json_dumps(task, indent=True) == json.dumps(
+        task, ensure_ascii=False, indent=2
+    )
+    assert json_codec.json_dumps({1: [2**70]}) == '{"1":[1180591620717411303424]}'
+    assert json_codec.json_dumps({"set": {1}}, default=sorted) == '{"set":[1]}'
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.json_loads(b"{invalid")
+
+    floats = [1e-07, 1e16, float("inf")]
+    assert json_codec.json_loads(json_codec.json_dumps(floats[:2])) == floats[:2]
+    if backend == "orjson":
+        assert json_codec.json_dumps(floats) == "[1e-7,1e16,null]"
+    elif backend == "json":
+        assert json_codec.json_dumps(floats) == "[1e-07,1e+16,Infinity]"
+
+
+@pytest.mark.unit
+def test_json_codec_fallback(monkeypatch):
+    """Test unknown or missing backends fall back to an installed one"""
+    assert json_codec.get_codec("json").name == "json"
+    assert json_codec.get_codec("unknown").name == json_codec.get_codec().name
+    monkeypatch.setattr(config, "json_backend", "json")
+    assert json_codec.json_loads('{"a": 1}') == {"a": 1}
+
+
+@pytest.mark.benchmark
+def test_json_codec_benchmark():
+    """Benchmark the default backend against stdlib json over task payloads"""
+    codec = json_codec.get_codec()
+    if codec.name == "json":
+        pytest.skip("no accelerated JSON backend is installed")
+    stdlib = json_codec.get_codec("json")
+    tasks = [_task_payload(idx) for idx in range(20)]
+
+    def roundtrip(backend: json_codec.JSONCodec) -> None:
+        for task in tasks:
+            task = dict(task)
+            task["labels"] = backend.loads(task.pop("labelsData"))
+            task["metaData"] = backend.loads(task["metaData"])
+            backend.loads(backend.dumpb(task, True, None))
+
+    fast = min(timeit.repeat(lambda: roundtrip(codec), number=5, repeat=5))
+    slow = min(timeit.repeat(lambda: roundtrip(stdlib), number=5, repeat=5))
+    assert fast < slow, f"{codec.name} ({fast:.3f}s) is slower than json ({slow:.3f}s)"
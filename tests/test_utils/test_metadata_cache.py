@@ -0,0 +1,184 @@
+"""Tests for `redbrick.utils.metadata_cache`."""
+
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from redbrick.config import config
+from redbrick.organization import RBOrganizationImpl
+from redbrick.project import RBProjectImpl
+from redbrick.utils.metadata_cache import MemberDirectory, MetadataCache
+
+
+@pytest.mark.unit
+def test_metadata_cache(tmpdir, monkeypatch):
+    """Test MetadataCache expiry, invalidation and disk persistence"""
+    monkeypatch.setattr(config, "metadata_cache_ttl", 60)
+    monkeypatch.setattr(config, "metadata_cache_persist", False)
+    cache_file = os.path.join(str(tmpdir), "metadata.db")
+    cache = MetadataCache("key", "url", cache_file)
+
+    assert cache.get("project", "org/a") is None
+    cache.put("project", "org/a", {"name": "a"})
+    cache.put("taxonomy", "org/t1", {"name": "t1"})
+    cache.put("taxonomy", "org/t2", {"name": "t2"})
+    value = cache.get("project", "org/a")
+    assert value == {"name": "a"}
+    value["name"] = "changed"
+    assert cache.get("project", "org/a") == {"name": "a"}
+    assert not os.path.exists(cache_file)
+
+    cache.invalidate("project", "org/a")
+    cache.invalidate("taxonomy")
+    assert cache.get("project", "org/a") is None
+    assert cache.get("taxonomy", "org/t1") is None
+    assert cache.get("taxonomy", "org/t2") is None
+
+    # entries expire after the ttl
+    cache.put("project", "org/a", {"name": "a"})
+    monkeypatch.setattr(time, "time", lambda: 10**10)
+    assert cache.get("project", "org/a") is None
+    monkeypatch.undo()
+
+    # persisted entries are shared across instances of the same scope
+    monkeypatch.setattr(config, "metadata_cache_ttl", 60)
+    monkeypatch.setattr(config, "metadata_cache_persist", True)
+    cache.put("stages", "org/a", [{"stageName": "Label"}])
+    assert MetadataCache("key", "url", cache_file).get("stages", "org/a") == [
+        {"stageName": "Label"}
+    ]
+    assert MetadataCache("other", "url", cache_file).get("stages", "org/a") is None
+
+    # disabled cache always misses
+    monkeypatch.setattr(config, "metadata_cache_ttl", 0)
+    assert cache.get("stages", "org/a") is None
+
+
+@pytest.mark.unit
+def test_metadata_cache_fetch(monkeypatch):
+    """Test MetadataCache.fetch fetches an entity once across threads"""
+    monkeypatch.setattr(config, "metadata_cache_ttl", 60)
+    monkeypatch.setattr(config, "metadata_cache_persist", False)
+    cache = MetadataCache("key", "url")
+    calls = []
+
+    def fetcher():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"name": "tax"}
+
+    threads = [
+        threading.Thread(target=cache.fetch, args=("taxonomy", "org/tax", fetcher))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert cache.fetch("taxonomy", "org/tax", fetcher) == {"name": "tax"}
+    assert len(calls) == 1
+
+
+@pytest.mark.unit
+def test_project_metadata_cache(rb_context, monkeypatch):
+    """Test projects reuse cached metadata and invalidate it on updates"""
+    monkeypatch.setattr(config, "metadata_cache_ttl", 60)
+    monkeypatch.setattr(config, "metadata_cache_persist", False)
+    project = {
+        "orgId": "org",
+        "projectId": "project",
+        "name": "Project",
+        "status": "CREATION_SUCCESS",
+        "tdType": "DICOM_SEGMENTATION",
+        "taxonomy": {"name": "Taxonomy"},
+        "projectUrl": "url",
+        "createdAt": "2024-01-01T00:00:00+00:00",
+        "consensusSettings": {"enabled": False},
+        "workspace": None,
+    }
+    stages = [{"stageName": "Output", "brickName": "labelset-output"}]
+    rb_context.project = MagicMock()
+    rb_context.project.get_project.return_value = project
+    rb_context.project.get_projects.return_value = [project]
+    rb_context.project.get_stages.return_value = stages
+    rb_context.project.get_taxonomy.return_value = {"name": "Taxonomy"}
+
+    first = RBProjectImpl(rb_context, "org", "project")
+    second = RBProjectImpl(rb_context, "org", "project")
+    assert first.name == second.name == "Project"
+    assert second.taxonomy == {"name": "Taxonomy"}
+    assert rb_context.project.get_project.call_count == 1
+    assert rb_context.project.get_stages.call_count == 1
+    assert rb_context.project.get_taxonomy.call_count == 1
+
+    # listing projects primes the project cache
+    rb_context.metadata.invalidate("project")
+    org = RBOrganizationImpl.__new__(RBOrganizationImpl)
+    org.context = rb_context
+    org._org_id = "org"  # pylint: disable=protected-access
+    assert [proj.project_id for proj in org.projects()] == ["project"]
+    assert rb_context.project.get_project.call_count == 1
+
+    new_stages = [
+        {
+            "stageName": "Label",
+            "brickName": "manual-labeling",
+            "routing": {"nextStageName": "Output"},
+        }
+    ]
+    rb_context.project.update_stage.return_value = (True, new_stages)
+    stage = MagicMock(stage_name="Label")
+    first.update_stage(stage)
+    project_obj = RBProjectImpl(rb_context, "org", "project")
+    assert project_obj._stages == new_stages  # pylint: disable=protected-access
+    assert rb_context.project.get_stages.call_count == 1
+
+    rb_context.project.update_taxonomy.return_value = True
+    org.update_taxonomy("tax_id", object_types=[])
+    RBProjectImpl(rb_context, "org", "project")
+    assert rb_context.project.get_taxonomy.call_count == 2
+
+    # projects that are not ready are checked again instead of using the cache
+    rb_context.metadata.put(
+        "project", "org/project", {**project, "status": "CREATION_FAILURE"}
+    )
+    rb_context.project.get_project.return_value = {
+        **project,
+        "status": "CREATION_FAILURE",
+    }
+    with pytest.raises(Exception, match="failed to be created"):
+        RBProjectImpl(rb_context, "org", "project")
+    assert rb_context.project.get_project.call_count == 2
+    assert rb_context.metadata.get("project", "org/project") is None
+
+
+@pytest.mark.unit
+def test_member_directory(monkeypatch):
+    """Test MemberDirectory reuses org members until the ttl expires"""
+    # the metadata cache config does not apply to members
+    monkeypatch.setattr(config, "metadata_cache_ttl", 0)
+    member_repo = MagicMock()
+    member_repo.list_org_members.return_value = [
+        {"user": {"userId": "user1", "email": "user1@redbrick.ai"}},
+        {"user": {"userId": "user2"}},
+        {},
+    ]
+    directory = MemberDirectory(member_repo)
+
+    assert directory.emails("org") == {"user1": "user1@redbrick.ai"}
+    assert directory.emails("org") is directory.emails("org")
+    member_repo.list_org_members.assert_called_once_with("org", False)
+
+    directory.invalidate("org")
+    directory.emails("org")
+    assert member_repo.list_org_members.call_count == 2
+
+    directory = MemberDirectory(member_repo, ttl=0)
+    directory.emails("org")
+    directory.emails("org")
+    assert member_repo.list_org_members.call_count == 4
@@ -571,6 +571,52 @@ async def test_convert_nii_to_rt_struct(
     assert new_segment_map == expected_segment_map
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_convert_nii_to_rt_struct_slices(dicom_file_and_image, tmpdir):
+    """Test rt_struct.convert_nii_to_rt_struct rejects masks with other slice counts"""
+    import nibabel as nib  # type: ignore
+
+    dicom_file, image_data = dicom_file_and_image
+    nifti_file = os.path.join(str(tmpdir), "mask.nii.gz")
+    data = np.zeros((*image_data.shape[:2], 3), dtype=np.uint16)
+    data[1:3, 1:3, 2] = 1
+    nib.save(nib.Nifti1Image(data, np.eye(4)), nifti_file)
+
+    result, new_segment_map = await rt_struct.convert_nii_to_rt_struct(
+        [nifti_file],
+        os.path.dirname(dicom_file),
+        [],
+        {"1": {"category": "Category1"}},
+        False,
+        False,
+    )
+    assert result is None
+    assert not new_segment_map
+
+
+@pytest.mark.unit
+def test_load_series_headers(dicom_file_and_image):
+    """Test rt_struct.load_series_headers returns copies, refreshed on file changes"""
+    import pydicom
+
+    dicom_file, _ = dicom_file_and_image
+    series_dir = os.path.dirname(dicom_file)
+    headers = rt_struct.load_series_headers(series_dir)
+    headers[0].PatientID = "modified"
+    assert rt_struct.load_series_headers(series_dir)[0].PatientID != "modified"
+
+    # a slice rewritten in place does not change the directory
+    dir_stat = os.stat(series_dir)
+    dataset = pydicom.dcmread(dicom_file)
+    dataset.PatientID = "rewritten"
+    dataset.save_as(dicom_file)
+    file_stat = os.stat(dicom_file)
+    os.utime(dicom_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1))
+    os.utime(series_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+    assert rt_struct.load_series_headers(series_dir)[0].PatientID == "rewritten"
+
+
 @pytest.mark.unit
 def test_merge_rtstructs(create_rtstructs):
     """Test for `rt_struct.merge_rtstructs`"""
@@ -607,3 +653,143 @@ def test_merge_rtstructs(create_rtstructs):
     assert "ROI2" in roi_names
     assert "ROI3" in roi_names
     assert "ROI4" in roi_names
+
+
+@pytest.mark.unit
+def test_roi_contours_match_rt_utils(create_rtstructs):
+    """Test `rt_struct.roi_contours` against rt_utils contour generation"""
+    from rt_utils.image_helper import get_pixel_to_patient_transformation_matrix
+
+    rtstruct1, rtstruct2 = create_rtstructs
+    data = np.zeros((512, 512, 2), dtype=np.uint16)
+    data[2:8, 3:7, 1] = 1
+    data[0:4, 500:512, 1] = 2
+    data[20:40, 20:40, 1] = 2
+    data[25:30, 25:30, 1] = 0
+
+    indices_map = rt_struct.instance_indices(data)
+    assert sorted(indices_map) == [1, 2]
+
+    matrix = get_pixel_to_patient_transformation_matrix(rtstruct2.series_data)
+    for instance, indices in indices_map.items():
+        rtstruct1.add_roi(mask=data == instance, name=f"Segment_{instance}")
+        rt_struct.add_roi_contours(
+            rtstruct2,
+            rt_struct.roi_contours(indices, data.shape, matrix),
+            f"Segment_{instance}",
+        )
+
+    assert rtstruct1.get_roi_names() == rtstruct2.get_roi_names()
+    for roi1, roi2 in zip(
+        rtstruct1.ds.ROIContourSequence, rtstruct2.ds.ROIContourSequence
+    ):
+        assert [contour.ContourData for contour in roi1.ContourSequence] == [
+            contour.ContourData for contour in roi2.ContourSequence
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_convert_rt_struct_to_nii(tmpdir, monkeypatch):
+    """Test `rt_struct.convert_rt_struct_to_nii` against rt_utils rasterization"""
+    # pylint: disable=invalid-name
+    import pydicom
+    from rt_utils import RTStructBuilder  # type: ignore
+
+    # undo class level attributes patched in by other dicom fixtures
+    for attr in ("StudyDate", "StudyTime", "StudyID", "SOPInstanceUID"):
+        monkeypatch.delattr(pydicom.dataset.Dataset, attr, raising=False)
+
+    dicom_series_path = os.path.join(str(tmpdir), "series")
+    os.makedirs(dicom_series_path)
+    series_uid, study_uid = pydicom.uid.generate_uid(), pydicom.uid.generate_uid()
+    for i in range(3):
+        ds = pydicom.Dataset()
+        ds.file_meta = pydicom.dataset.FileMetaDataset()
+        ds.file_meta.MediaStorageSOPClassUID = pydicom.uid.CTImageStorage
+        ds.file_meta.MediaStorageSOPInstanceUID = pydicom.uid.generate_uid()
+        ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+        ds.SOPClassUID = pydicom.uid.CTImageStorage
+        ds.SOPInstanceUID = ds.file_meta.MediaStorageSOPInstanceUID
+        ds.StudyInstanceUID, ds.SeriesInstanceUID = study_uid, series_uid
+        ds.FrameOfReferenceUID = series_uid
+        ds.StudyDate, ds.StudyTime, ds.StudyID = "20240101", "000000", "1"
+        ds.PatientName, ds.PatientID, ds.Modality = "Test", "1", "CT"
+        ds.Rows, ds.Columns = 64, 48
+        ds.ImagePositionPatient = [0, 0, 2 * i]
+        ds.ImageOrientationPatient = [1, 0, 0, 0, 1, 0]
+        ds.PixelSpacing = [0.5, 0.5]
+        ds.BitsAllocated, ds.BitsStored, ds.HighBit = 16, 16, 15
+        ds.SamplesPerPixel, ds.PixelRepresentation = 1, 0
+        ds.PhotometricInterpretation = "MONOCHROME2"
+        ds.PixelData = np.zeros((64, 48), dtype=np.uint16).tobytes()
+        ds.save_as(
+            os.path.join(dicom_series_path, f"{2 - i}.dcm"), write_like_original=False
+        )
+
+    rtstruct = RTStructBuilder.create_new(dicom_series_path)
+    mask1 = np.zeros((64, 48, 3), dtype=bool)
+    mask1[2:8, 3:7, 1] = True
+    rtstruct.add_roi(mask1, name="ROI1")
+    mask2 = np.zeros((64, 48, 3), dtype=bool)
+    mask2[4:30, 4:28, 0:2] = True
+    mask2[10:12, 10:12, 0] = False
+    rtstruct.add_roi(mask2, name="ROI2")
+    rt_struct_file = os.path.join(str(tmpdir), "rtstruct.dcm")
+    rtstruct.save(rt_struct_file)
+
+    segment_map = {"ROI1": {"category": "Category1"}, "ROI2": "Category2"}
+    image, new_segment_map = await rt_struct.convert_rt_struct_to_nii(
+        [rt_struct_file], dicom_series_path, dict(segment_map), False, []
+    )
+
+    assert new_segment_map == {"1": segment_map["ROI1"], "2": segment_map["ROI2"]}
+    data = np.asarray(image.dataobj).swapaxes(0, 1)
+    expected = np.zeros(data.shape, dtype=data.dtype)
+    for idx, name in enumerate(segment_map, start=1):
+        expected[rtstruct.get_roi_mask_by_name(name)] = idx
+    assert np.array_equal(data, expected)
+    assert (data == 2).any() and (data == 1).any()
+
+
+@pytest.mark.unit
+def test_convert_dicom_series_to_nifti_cache(tmpdir):
+    """Test `nifti.convert_dicom_series_to_nifti` reuses converted volumes"""
+    series_dir = os.path.join(str(tmpdir), "series")
+    os.makedirs(series_dir)
+    for idx in range(3):
+        with open(os.path.join(series_dir, f"{idx}.dcm"), "wb") as file_:
+            file_.write(f"slice {idx}".encode())
+
+    def mock_convert(_series_dir, output_file):
+        with open(output_file, "wb") as file_:
+            file_.write(b"nifti")
+        return {"NII_FILE": output_file}
+
+    with (
+        patch.object(nifti, "config_path", return_value=str(tmpdir)),
+        patch("dicom2nifti.dicom_series_to_nifti", side_effect=mock_convert) as convert,
+    ):
+        # the cache is disabled by default
+        nifti.convert_dicom_series_to_nifti(
+            series_dir, os.path.join(str(tmpdir), "out.nii.gz")
+        )
+        assert convert.call_count == 1
+        assert not os.path.exists(os.path.join(str(tmpdir), "cache", "dcm2nii"))
+
+        for idx in range(2):
+            output = nifti.convert_dicom_series_to_nifti(
+                series_dir, os.path.join(str(tmpdir), f"out{idx}.nii.gz"), 8
+            )
+            with open(output, "rb") as file_:
+                assert file_.read() == b"nifti"
+        assert convert.call_count == 2
+
+        # cached volumes are evicted once over the cache size
+        with open(os.path.join(series_dir, "0.dcm"), "wb") as file_:
+            file_.write(b"changed")
+        nifti.convert_dicom_series_to_nifti(
+            series_dir, os.path.join(str(tmpdir), "out2.nii.gz"), 8
+        )
+        assert convert.call_count == 3
+        assert len(os.listdir(os.path.join(str(tmpdir), "cache", "dcm2nii"))) == 1
@@ -22,6 +22,16 @@ def test_user_format():
     assert rb_label_utils.user_format("API:456", users) == "API Key - API Key"
     assert rb_label_utils.user_format("user123", users) == "User123"
     assert rb_label_utils.user_format("unknown_user", users) == "unknown_user"
+    assert rb_label_utils.user_format({"userId": "user123"}, users) == "User123"
+    assert (
+        rb_label_utils.user_format({"userId": "new", "email": "new@x.com"}, users)
+        == "new@x.com"
+    )
+    assert (
+        rb_label_utils.user_format({"userId": "API:789", "givenName": "Key"}, users)
+        == "API Key - Key"
+    )
+    assert rb_label_utils.user_format({"email": "new@x.com"}, users) is None
 
 
 @pytest.mark.unit
@@ -1,12 +1,20 @@
 """Tests for `redbrick.utils.upload`."""
 
+import asyncio
 import json
+import os
 from unittest.mock import Mock, patch, AsyncMock
 
 import pytest
 
-from redbrick.upload.interact import validate_json
+from redbrick.common.storage import StorageMethod
+from redbrick.upload.interact import (
+    create_task,
+    prepare_json_files_async,
+    validate_json,
+)
 from redbrick.utils import upload
+from redbrick.utils.upload_index import UploadIndex
 
 
 @pytest.mark.unit
@@ -47,6 +55,182 @@ async def test_validate_json(valid_state):
         assert result == []
 
 
+@pytest.mark.unit
+def test_is_import_format():
+    """Check upload.is_import_format only accepts canonical tasks"""
+    assert upload.is_import_format({"name": "task", "items": ["a.dcm", "b.dcm"]})
+    assert upload.is_import_format(
+        {
+            "name": "task",
+            "items": ["a.dcm", "b.dcm"],
+            "seriesInfo": [{"name": "a", "itemsIndices": [0]}, {"itemsIndices": [1]}],
+            "heatMaps": [{"name": "heat", "item": "heat.nii.gz", "preset": "x"}],
+            "priority": 0.5,
+            "metaData": {"key": "value"},
+        }
+    )
+    assert not upload.is_import_format(
+        {"name": "task", "items": ["a.dcm"], "labels": []}
+    )
+    assert not upload.is_import_format(
+        {"name": "task", "items": ["a.dcm"], "labelsMap": [None]}
+    )
+    assert not upload.is_import_format(
+        {"name": "task", "items": ["a.dcm"], "seriesInfo": [{"itemsIndices": ["0"]}]}
+    )
+    assert not upload.is_import_format(
+        {"name": "task", "items": ["a.dcm"], "heatMaps": [{"item": "h", "bad": 1}]}
+    )
+    assert not upload.is_import_format({"name": "task", "series": [{"items": "a"}]})
+    assert not upload.is_import_format({"name": "task", "items": "a.dcm"})
+    assert not upload.is_import_format({"name": "", "items": ["a.dcm"]})
+    assert not upload.is_import_format({"items": ["a.dcm"]})
+    assert not upload.is_import_format(
+        {"name": "task", "items": ["a.dcm"], "segmentations": ["label.nii.gz"]}
+    )
+    assert not upload.is_import_format(
+        {"name": "task", "items": ["a.dcm"], "priority": 2}
+    )
+    assert not upload.is_import_format(
+        {"name": "task", "items": ["a.dcm"], "metaData": {"key": 1}}
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_validate_json_per_item():
+    """Check validate_json skips canonical tasks and drops only invalid tasks"""
+    input_data = [
+        {"name": "canonical", "items": ["a.dcm"]},
+        {"name": "valid", "series": [{"items": "b.dcm"}]},
+        {"name": "invalid", "series": "c.dcm"},
+        {"name": "valid2", "series": [{"items": "d.dcm"}], "status": "DONE"},
+    ]
+    batches = []
+
+    async def mock_validate_and_convert(
+        arg1, input_, *args
+    ):  # pylint: disable=unused-argument
+        batches.append([task["name"] for task in input_])
+        if any(not isinstance(task["series"], list) for task in input_):
+            return {"isValid": False, "error": "Invalid series"}
+        return {
+            "isValid": True,
+            "converted": json.dumps(
+                [
+                    {"name": task["name"], "items": [task["series"][0]["items"]]}
+                    for task in input_
+                ]
+            ),
+        }
+
+    mock_rb_context = AsyncMock()
+    mock_rb_context.upload.validate_and_convert_to_import_format = (
+        mock_validate_and_convert
+    )
+
+    result = await validate_json(
+        mock_rb_context, input_data, "storage_id", 10  # type: ignore
+    )
+    assert result == [
+        {"name": "canonical", "items": ["a.dcm"]},
+        {"name": "valid", "items": ["b.dcm"]},
+        {"name": "valid2", "items": ["d.dcm"]},
+    ]
+    assert batches[0] == ["valid", "invalid", "valid2"]
+    assert sorted(batches[1:]) == [["invalid"], ["valid"], ["valid2"]]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_validate_json_semaphore():
+    """Check validate_json requests, including retried items, share the semaphore"""
+    input_data = [{"name": f"item{idx}", "series": "a.dcm"} for idx in range(6)]
+    running = {"now": 0, "peak": 0}
+
+    async def mock_validate_and_convert(
+        arg1, input_, *args
+    ):  # pylint: disable=unused-argument
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.01)
+        running["now"] -= 1
+        return {"isValid": False, "error": "Invalid series"}
+
+    mock_rb_context = AsyncMock()
+    mock_rb_context.upload.validate_and_convert_to_import_format = AsyncMock(
+        side_effect=mock_validate_and_convert
+    )
+
+    result = await validate_json(
+        mock_rb_context,
+        input_data,  # type: ignore
+        "storage_id",
+        3,
+        None,
+        asyncio.Semaphore(2),
+    )
+    assert result == []
+    # 2 batches of 3, then each of the 6 items
+    assert mock_rb_context.upload.validate_and_convert_to_import_format.await_count == 8
+    assert running["peak"] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_prepare_json_files_async(tmpdir):
+    """Check prepare_json_files_async validates files concurrently, in order"""
+    task_dirs = []
+    for idx in range(2):
+        task_dir = os.path.join(str(tmpdir), f"task{idx}")
+        os.makedirs(task_dir)
+        with open(os.path.join(task_dir, "image.png"), "wb") as file_:
+            file_.write(b"")
+        task_dirs.append(task_dir)
+
+    files_data = [
+        [{"name": "first", "items": ["image.png"]}, {"name": "dup", "items": ["x"]}],
+        [
+            {"name": "dup", "items": ["image.png"]},
+            {"name": "first", "items": ["image.png"]},
+        ],
+    ]
+
+    started = asyncio.Event()
+    validating = 0
+
+    async def mock_validate_and_convert(
+        arg1, input_, *args
+    ):  # pylint: disable=unused-argument
+        nonlocal validating
+        validating += 1
+        if validating == len(files_data):
+            started.set()
+        # every file must reach validation before any completes
+        await asyncio.wait_for(started.wait(), 5)
+        return {"isValid": True, "converted": json.dumps(input_)}
+
+    mock_rb_context = AsyncMock()
+    mock_rb_context.upload.validate_and_convert_to_import_format = (
+        mock_validate_and_convert
+    )
+
+    points = await prepare_json_files_async(
+        context=mock_rb_context,
+        org_id="org_id",
+        taxonomy=None,
+        files_data=files_data,  # type: ignore
+        storage_id=str(StorageMethod.REDBRICK),
+        label_storage_id="label_storage_id",
+        task_dirs=task_dirs,
+        uploaded={"ignored"},
+    )
+    assert points == [
+        {"name": "first", "items": [os.path.join(task_dirs[0], "image.png")]},
+        {"name": "dup", "items": [os.path.join(task_dirs[1], "image.png")]},
+    ]
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_process_segmentation_upload(
@@ -119,3 +303,87 @@ async def test_process_segmentation_upload(
             )
 
     assert result == [{"labelName": "file_path", "seriesIndex": 0}]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("available", [True, False])
+async def test_create_task_dedup_uploads(tmpdir, available):
+    """Check create_task references previously uploaded files instead of uploading"""
+    items = []
+    for name in ("a.dcm", "b.dcm"):
+        items.append(os.path.join(str(tmpdir), name))
+        with open(items[-1], "wb") as file_:
+            file_.write(name.encode())
+
+    mock_rb_context = Mock()
+    mock_rb_context.upload.items_upload_presign = Mock(
+        side_effect=lambda org_id, dataset, files, file_types: [
+            {"presignedUrl": f"https://upload/{name}", "filePath": f"remote/{name}"}
+            for name in files
+        ]
+    )
+    mock_rb_context.upload.create_datapoint_async = AsyncMock(
+        return_value={"dpId": "dp_id"}
+    )
+    mock_rb_context.export.presign_items = Mock(
+        side_effect=lambda org_id, storage_id, paths: [
+            f"https://download/{path}" for path in paths
+        ]
+    )
+    response = Mock(status=206 if available else 404)
+    session = Mock()
+    session.get = Mock(
+        return_value=Mock(
+            __aenter__=AsyncMock(return_value=response), __aexit__=AsyncMock()
+        )
+    )
+    index = UploadIndex("org_id", os.path.join(str(tmpdir), "uploads.db"))
+    index.record(items[:1], ["application/dicom"], ["remote/existing.dcm"])
+
+    upload_files_mock = AsyncMock(side_effect=lambda files, *args, **kwargs: [True])
+    with patch("redbrick.upload.interact.upload_files", upload_files_mock):
+        result = await create_task(
+            context=mock_rb_context,
+            session=session,
+            org_id="org_id",
+            workspace_id="workspace_id",
+            project_id=None,
+            storage_id=StorageMethod.REDBRICK,
+            point={"name": "task", "items": items[:]},
+            is_ground_truth=False,
+            label_storage_id=StorageMethod.REDBRICK,
+            project_label_storage_id=StorageMethod.REDBRICK,
+            label_validate=False,
+            prune_segmentations=False,
+            update_items=False,
+            append=False,
+            upload_index=index,
+        )
+
+    mock_rb_context.export.presign_items.assert_called_once_with(
+        "org_id", StorageMethod.REDBRICK, ["remote/existing.dcm"]
+    )
+    session.get.assert_called_once_with(
+        "https://download/remote/existing.dcm", headers={"Range": "bytes=0-0"}
+    )
+    if available:
+        expected = ["remote/existing.dcm", "remote/b.dcm"]
+        uploaded = items[1:]
+    else:
+        # missing remote files are uploaded again
+        expected = ["remote/a.dcm", "remote/b.dcm"]
+        uploaded = items
+    assert result["items"] == expected
+    mock_rb_context.upload.items_upload_presign.assert_called_once_with(
+        "org_id",
+        "workspace_id",
+        [os.path.basename(item) for item in uploaded],
+        ["application/dicom"] * len(uploaded),
+    )
+    assert upload_files_mock.await_args_list[0].args[0] == [
+        (item, f"https://upload/{os.path.basename(item)}", "application/dicom")
+        for item in uploaded
+    ]
+    assert index.lookup(items, ["application/dicom"] * 2) == expected
+    index.close()
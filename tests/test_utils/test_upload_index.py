@@ -0,0 +1,53 @@
+"""Tests for `redbrick.utils.upload_index`."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from redbrick.utils.upload_index import UploadIndex
+
+
+@pytest.mark.unit
+def test_upload_index(tmpdir):
+    """Test UploadIndex maps file contents to uploaded paths, per org"""
+    index_file = os.path.join(str(tmpdir), "cache", "uploads.db")
+    paths = []
+    for name, content in (("a.dcm", b"a"), ("b.dcm", b"b"), ("copy.dcm", b"a")):
+        paths.append(os.path.join(str(tmpdir), name))
+        with open(paths[-1], "wb") as file_:
+            file_.write(content)
+    file_types = ["application/dicom"] * 3
+
+    index = UploadIndex("org", index_file)
+    assert index.lookup(paths, file_types) == [None, None, None]
+    index.record(paths[:1], file_types[:1], ["org/remote/a.dcm"])
+    assert index.lookup(paths, file_types) == [
+        "org/remote/a.dcm",
+        None,
+        "org/remote/a.dcm",
+    ]
+    assert index.lookup(paths[:1], ["image/png"]) == [None]
+    assert index.lookup([os.path.join(str(tmpdir), "missing")], file_types) == [None]
+
+    # unchanged files are not hashed again
+    with patch("redbrick.utils.upload_index.open", side_effect=AssertionError):
+        assert index.lookup(paths[:1], file_types[:1]) == ["org/remote/a.dcm"]
+
+    # modified files are hashed again
+    with open(paths[0], "wb") as file_:
+        file_.write(b"changed")
+    assert index.lookup(paths[:1], file_types[:1]) == [None]
+    index.close()
+
+    # index persists, scoped by org
+    index = UploadIndex("other", index_file)
+    assert index.lookup(paths[2:], file_types[2:]) == [None]
+    index.close()
+    index = UploadIndex("org", index_file)
+    assert index.lookup(paths[2:], file_types[2:]) == ["org/remote/a.dcm"]
+
+    # invalidated remote paths are no longer reused
+    index.invalidate(["org/remote/a.dcm"])
+    assert index.lookup(paths[2:], file_types[2:]) == [None]
+    index.close()
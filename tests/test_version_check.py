@@ -0,0 +1,103 @@
+"""Tests for `redbrick.version_check`."""
+
+import os
+import threading
+from configparser import ConfigParser
+
+import pytest
+
+from redbrick import version_check
+
+
+@pytest.mark.unit
+def test_version_check_background(tmpdir, monkeypatch):
+    """Test stale version checks run in the background and update the cache"""
+    monkeypatch.setattr(version_check, "config_path", lambda: str(tmpdir))
+    monkeypatch.setattr(version_check, "_update_thread", None)
+    monkeypatch.setattr(version_check, "_updated_versions", [])
+    monkeypatch.setattr(version_check.atexit, "register", lambda *args: None)
+
+    release = threading.Event()
+
+    def mock_get_updated_versions(current_version):
+        assert current_version == "1.0.0"
+        release.wait(5)
+        return [{"tag_name": "v1.1.0", "name": "v1.1.0", "body": "Changes"}]
+
+    monkeypatch.setattr(
+        version_check, "get_updated_versions", mock_get_updated_versions
+    )
+
+    # returns without waiting for the releases request
+    version_check.version_check("1.0.0", True)
+    thread = version_check._update_thread  # pylint: disable=protected-access
+    assert thread is not None and thread.daemon and thread.is_alive()
+
+    cache_config = ConfigParser()
+    cache_config.read(os.path.join(str(tmpdir), "version"))
+    assert set(cache_config["version"]) == {"current_version", "last_attempted"}
+
+    release.set()
+    thread.join(5)
+    cache_config.read(os.path.join(str(tmpdir), "version"))
+    assert cache_config["version"]["latest_version"] == "1.1.0"
+    assert version_check._updated_versions  # pylint: disable=protected-access
+
+    # the next run reports the cached update without checking again
+    warnings = []
+    monkeypatch.setattr(version_check, "_update_thread", None)
+    monkeypatch.setattr(
+        version_check, "_warn_update", lambda *args: warnings.append(args)
+    )
+    version_check.version_check("1.0.0", True)
+    assert version_check._update_thread is None  # pylint: disable=protected-access
+    assert warnings == [("1.0.0", "1.1.0")]
+
+    # the update is reported once until the next check
+    version_check.version_check("1.0.0", True)
+    assert warnings == [("1.0.0", "1.1.0")]
+
+
+@pytest.mark.unit
+def test_version_check_interrupted(tmpdir, monkeypatch):
+    """Test checks cut short at exit are not retried, and reported if done soon"""
+    monkeypatch.setattr(version_check, "config_path", lambda: str(tmpdir))
+    monkeypatch.setattr(version_check, "_update_thread", None)
+    monkeypatch.setattr(version_check, "_updated_versions", [])
+    monkeypatch.setattr(version_check.atexit, "register", lambda *args: None)
+    monkeypatch.setattr(version_check, "VERSION_CHECK_EXIT_TIMEOUT", 5)
+
+    release = threading.Event()
+    calls = []
+
+    def mock_get_updated_versions(current_version):
+        calls.append(current_version)
+        release.wait(5)
+        return [{"tag_name": "v1.1.0", "name": "v1.1.0", "body": "Changes"}]
+
+    warnings = []
+    monkeypatch.setattr(
+        version_check, "get_updated_versions", mock_get_updated_versions
+    )
+    monkeypatch.setattr(
+        version_check, "_warn_update", lambda *args: warnings.append(args)
+    )
+
+    version_check.version_check("1.0.0", True)
+    thread = version_check._update_thread  # pylint: disable=protected-access
+    assert thread is not None and thread.is_alive()
+
+    # a new process does not check again while the attempt is recent
+    monkeypatch.setattr(version_check, "_update_thread", None)
+    version_check.version_check("1.0.0", True)
+    assert version_check._update_thread is None  # pylint: disable=protected-access
+    assert not warnings
+
+    # the exit hook waits for a check that completes shortly
+    monkeypatch.setattr(version_check, "_update_thread", thread)
+    threading.Timer(0.2, release.set).start()
+    version_check._report_updates(  # pylint: disable=protected-access
+        "1.0.0", os.path.join(str(tmpdir), "version")
+    )
+    assert calls == ["1.0.0"]
+    assert warnings == [("1.0.0", "1.1.0")]